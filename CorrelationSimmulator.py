@@ -1,7 +1,29 @@
-import streamlit as st
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
-import pandas as pd
-import plotly.express as px
+import streamlit as st
+
+from chart_payload import get_payload_meter, show_chart, show_payload
+from dependence import DEPENDENCE_MAX_POINTS, dependence_measures
+from figures import r_histogram_figure, simpsons_figure
+from grouped_stats import group_ranges, grouped_correlation, pooled_correlation
+from monte_carlo import MAX_WORKERS, sampling_distribution_r
+from rerun_profiler import profiled, register_cache, show_profile_panel
+from resampling import RESAMPLING_MAX_POINTS, bootstrap_r, permutation_test_r
+from sample_cache import SampleCache, sample_key
+from sampling_engine import DEFAULT_SEED, generate_simpsons_data, group_labels, new_seed
+from session_memory import show_session_memory
+from slider_grid import WARMUP_MODE, SliderGridIndex
+
+# Tamanhos de amostra oferecidos; acima de alguns milhares de pontos o gráfico
+# passa para WebGL e, depois, para um mapa de densidade agregado no servidor
+SAMPLE_SIZES = [150, 1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+# Resultados de bootstrap/permutação guardados para reaproveitar entre sessões
+UNCERTAINTY_MAX_ENTRIES = 64
+# Pontos mínimos por grupo no Paradoxo de Simpson (com 2 ou 3, todo r por grupo é ±1)
+MIN_GROUP_POINTS = 10
 
 st.set_page_config(page_title="Explorador de Correlação", layout="wide")
 
@@ -13,41 +35,103 @@ st.markdown("""
 """)
 
 # Funções auxiliares
-def generate_correlated_data(correlation, n_points=150):
-    """Gera dados correlacionados usando transformação Box-Muller"""
-    x = np.random.normal(0, 1, n_points)
-    eps = np.random.normal(0, 1, n_points)
-    y = correlation * x + np.sqrt(1 - correlation**2) * eps
-    return pd.DataFrame({'x': x, 'y': y})
-
-def generate_curved_data(curvature=1.0, n_points=150):
-    """Gera dados em formato de U"""
-    x = np.random.uniform(-2, 2, n_points)
-    noise = np.random.normal(0, 0.1, n_points)
-    y = (curvature**2) * x**2 + noise - 2
-    return pd.DataFrame({'x': x, 'y': y})
-
-def generate_simpsons_data(slope_diff=-1, n_points=150):
-    """Gera dados do paradoxo de Simpson"""
-    # Grupo A
-    n_a = n_points // 2
-    x_a = np.random.uniform(0, 5, n_a)
-    y_a = x_a + np.random.normal(0, 0.5, n_a)
-    df_a = pd.DataFrame({'x': x_a, 'y': y_a, 'group': 'Grupo A'})
-    
-    # Grupo B
-    n_b = n_points - n_a
-    x_b = np.random.uniform(4, 9, n_b)
-    y_b = slope_diff * (x_b - 4) + 5 + np.random.normal(0, 0.5, n_b)
-    df_b = pd.DataFrame({'x': x_b, 'y': y_b, 'group': 'Grupo B'})
-    
-    return pd.concat([df_a, df_b])
+@st.cache_resource
+def get_sample_cache():
+    """Cache de amostras compartilhado por todas as sessões"""
+    return SampleCache()
 
-# Abas para diferentes cenários
-tab1, tab2 = st.tabs(["Correlação Linear", "Padrões Não-lineares"])
+@st.cache_resource
+def get_grid_index():
+    """Índice da grade dos sliders, aquecido uma única vez por processo"""
+    index = SliderGridIndex(get_sample_cache())
+    if WARMUP_MODE != "off":
+        index.warm(background=WARMUP_MODE == "background")
+    return index
+
+grid_index = get_grid_index()
+register_cache("amostras", get_sample_cache().stats)
+register_cache("grade dos sliders", grid_index.stats)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def curved_dependence(curvature, seed, n_points):
+    """Medidas de dependência da amostra em U (reaproveitadas entre sessões)"""
+    sample = get_sample_cache().get('curved', curvature, seed, n_points)
+    return dependence_measures(sample.x, sample.y)
 
+@st.cache_resource(max_entries=4, show_spinner=False)
+def simpsons_analysis(slope_diff, n_points, n_groups, seed):
+    """Dados do paradoxo de Simpson e suas estatísticas por grupo e gerais"""
+    x, y, group = generate_simpsons_data(slope_diff, n_points, seed=seed, n_groups=n_groups)
+    stats = grouped_correlation(x, y, group, n_groups)
+    x_min, x_max = group_ranges(x, group, n_groups)
+    pooled = pooled_correlation(x, y)
+    fig = simpsons_figure(x, y, group, stats, pooled, x_min, x_max)
+    return stats, pooled, fig
+
+@st.cache_resource
+def get_process_pool():
+    """Pool de processos compartilhado para as simulações de Monte Carlo"""
+    return ProcessPoolExecutor(max_workers=MAX_WORKERS)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def simulate_r(correlation, n_points, n_replicates, seed):
+    """Distribuição amostral de r (reaproveitada entre sessões)"""
+    return sampling_distribution_r(correlation, n_points, n_replicates, seed=seed,
+                                   executor=get_process_pool())
+
+@st.cache_resource
+def get_uncertainty_cache():
+    """Resultados de correlation_uncertainty compartilhados entre as sessões (LRU) e seu lock"""
+    return OrderedDict(), threading.Lock()
+
+def correlation_uncertainty(scenario, param, seed, n_points, progress=None):
+    """IC por bootstrap e p-valor por permutação da correlação de uma amostra do cache
+
+    Não usa st.cache_data: ele reproduziria, num acerto, as atualizações da barra
+    de progresso, que é criada fora da função, e a reprodução falharia.
+    """
+    cache, lock = get_uncertainty_cache()
+    key = sample_key(scenario, param, seed, n_points)
+    with lock:
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+    sample = get_sample_cache().get(*key)
+    progress = progress or (lambda step, done, total: None)
+    boot = bootstrap_r(sample.x, sample.y, seed=seed, tol=0.002, executor=get_process_pool(),
+                       progress=lambda done, total: progress(0, done, total))
+    perm = permutation_test_r(sample.x, sample.y, seed=seed, tol=0.002, executor=get_process_pool(),
+                              progress=lambda done, total: progress(1, done, total))
+    with lock:
+        cache[key] = boot, perm
+        while len(cache) > UNCERTAINTY_MAX_ENTRIES:
+            cache.popitem(last=False)
+    return boot, perm
+
+def show_uncertainty(scenario, param, seed, n_points):
+    """Caixa de seleção que mostra a incerteza da correlação da amostra atual"""
+    if not st.checkbox("📏 Mostrar incerteza da correlação (bootstrap e permutação)", key=f"{scenario}_uncertainty"):
+        return
+    if n_points > RESAMPLING_MAX_POINTS:
+        st.caption(f"Disponível para amostras de até {RESAMPLING_MAX_POINTS:,} pontos.".replace(",", "."))
+        return
+    bar = st.progress(0.0, "Reamostrando...")
+    steps = ["Bootstrap", "Permutação"]
+    boot, perm = correlation_uncertainty(
+        scenario, round(param, 1), seed, n_points,
+        progress=lambda step, done, total: bar.progress((step + done / total) / 2, f"{steps[step]}: {done}/{total}"),
+    )
+    bar.empty()
+    st.write(f"IC 95% da correlação (bootstrap, {boot.n_resamples} reamostras): [{boot.low:.2f}, {boot.high:.2f}]")
+    st.write(f"p-valor (permutação, {perm.n_permutations} permutações): {perm.p_value:.4f}")
+
+# Cada aba é um fragmento: um widget reexecuta só a sua aba, e os gráficos das
+# outras não são serializados nem reenviados ao navegador
 # Aba 1: Correlação Linear
-with tab1:
+@st.fragment
+@profiled("Correlação Linear")
+def linear_section():
+    get_payload_meter().start("linear")
     st.header("1️⃣ Correlação Linear")
     st.markdown("""
         Mova o controle deslizante para ver como diferentes valores de correlação afetam o gráfico de dispersão.
@@ -57,20 +141,46 @@ with tab1:
     col1, col2 = st.columns([1, 2])
     with col1:
         correlation = st.slider("Correlação Alvo", -1.0, 1.0, 0.0, 0.1)
+        linear_n = st.select_slider("Tamanho da amostra", SAMPLE_SIZES, 150,
+                                    format_func=lambda n: f"{n:,}".replace(",", "."), key="linear_n")
         if st.button("🎲 Gerar Nova Amostra"):
-            st.session_state.linear_data = generate_correlated_data(correlation)
+            st.session_state.linear_seed = new_seed()
     
-    # Inicializar ou atualizar dados
-    if 'linear_data' not in st.session_state:
-        st.session_state.linear_data = generate_correlated_data(correlation)
+    # Inicializar ou atualizar dados (a semente padrão é comum a todas as sessões). A sessão guarda
+    # só a chave da amostra; os dados vêm do cache compartilhado e são regeneráveis pela semente
+    if 'linear_seed' not in st.session_state:
+        st.session_state.linear_seed = DEFAULT_SEED
+    entry = grid_index.get('linear', correlation, st.session_state.linear_seed, linear_n)
     
     # Gráfico
-    fig = px.scatter(st.session_state.linear_data, x='x', y='y', 
-                     title=f"Correlação da Amostra: {st.session_state.linear_data['x'].corr(st.session_state.linear_data['y']):.2f}")
-    st.plotly_chart(fig, use_container_width=True)
+    show_chart(entry.figure, "linear")
+    show_uncertainty('linear', correlation, st.session_state.linear_seed, linear_n)
+
+    # Distribuição amostral de r (Monte Carlo)
+    with st.expander("📈 Distribuição amostral da correlação"):
+        st.markdown("""
+            Em vez de uma amostra por vez, sorteie milhares de amostras com a mesma correlação alvo
+            e veja como a correlação de cada amostra varia em torno do alvo.
+        """)
+        mc_col1, mc_col2 = st.columns(2)
+        with mc_col1:
+            mc_points = st.select_slider("Tamanho de cada amostra", [10, 30, 150, 1_000], 150)
+        with mc_col2:
+            mc_replicates = st.select_slider("Número de amostras", [1_000, 10_000, 100_000, 1_000_000], 10_000,
+                                             format_func=lambda n: f"{n:,}".replace(",", "."))
+        with st.spinner("Simulando..."):
+            r_values = simulate_r(round(correlation, 1), mc_points, mc_replicates, st.session_state.linear_seed)
+        show_chart(r_histogram_figure(r_values, correlation), "linear")
+        low, high = np.percentile(r_values, [2.5, 97.5])
+        st.write(f"Média de r: {r_values.mean():.3f} | Desvio padrão: {r_values.std():.3f} | "
+                 f"95% das amostras entre {low:.2f} e {high:.2f}")
+    show_payload("linear")
 
 # Aba 2: Padrões Não-lineares
-with tab2:
+@st.fragment
+@profiled("Padrões Não-lineares")
+def curved_section():
+    get_payload_meter().start("curved")
     st.header("2️⃣ Padrões Não-lineares (A Forma de U)")
     st.markdown("""
         Aqui é onde a correlação pode nos enganar! Estes dados mostram um padrão claro em forma de U,
@@ -80,23 +190,94 @@ with tab2:
     col1, col2 = st.columns([1, 2])
     with col1:
         curvature = st.slider("Curvatura", 0.1, 2.0, 1.0, 0.1)
+        curved_n = st.select_slider("Tamanho da amostra", SAMPLE_SIZES, 150,
+                                    format_func=lambda n: f"{n:,}".replace(",", "."), key="curved_n")
         if st.button("🎲 Gerar Nova Forma de U"):
-            st.session_state.curved_data = generate_curved_data(curvature)
+            st.session_state.curved_seed = new_seed()
     
-    # Inicializar ou atualizar dados
-    if 'curved_data' not in st.session_state:
-        st.session_state.curved_data = generate_curved_data(curvature)
+    # Inicializar ou atualizar dados (só a chave da amostra fica na sessão)
+    if 'curved_seed' not in st.session_state:
+        st.session_state.curved_seed = DEFAULT_SEED
+    entry = grid_index.get('curved', curvature, st.session_state.curved_seed, curved_n)
     
     # Gráfico
-    fig = px.scatter(st.session_state.curved_data, x='x', y='y',
-                     title=f"Correlação: {st.session_state.curved_data['x'].corr(st.session_state.curved_data['y']):.2f}")
-    fig.update_layout(
-        yaxis=dict(range=[-3, 8]),
-        xaxis=dict(range=[-2.5, 2.5])
-    )    
-    st.plotly_chart(fig, use_container_width=True)
+    show_chart(entry.figure, "curved")
+    show_uncertainty('curved', curvature, st.session_state.curved_seed, curved_n)
+    
+    # Outras medidas de dependência
+    st.subheader("Outras medidas de dependência")
+    measures = curved_dependence(round(curvature, 1), st.session_state.curved_seed, curved_n)
+    for col, (name, value) in zip(st.columns(len(measures)), measures.items()):
+        col.metric(name, f"{value:.2f}")
+    st.caption("Pearson, Spearman e Kendall só enxergam relações monótonas; a correlação de distância "
+               "e a informação mútua são zero apenas quando não há relação nenhuma.")
+    if curved_n > DEPENDENCE_MAX_POINTS:
+        st.caption(f"Exceto Pearson, as medidas usam os primeiros {DEPENDENCE_MAX_POINTS:,} pontos da amostra."
+                   .replace(",", "."))
     
     st.info("📌 Mesmo havendo um padrão claro, a correlação está próxima de zero! Isso mostra por que devemos sempre visualizar nossos dados.")
+    show_payload("curved")
+
+# Aba 3: Paradoxo de Simpson
+@st.fragment
+@profiled("Paradoxo de Simpson")
+def simpsons_section():
+    get_payload_meter().start("simpsons")
+    st.header("3️⃣ Paradoxo de Simpson")
+    st.markdown("""
+        Quando os dados vêm de grupos diferentes, a tendência geral pode ser o oposto da tendência
+        dentro de cada grupo! Ajuste a inclinação dentro dos grupos e o número de grupos.
+    """)
+    
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        slope_diff = st.slider("Inclinação dentro dos grupos", -2.0, 1.0, -1.0, 0.1)
+        n_groups = st.slider("Número de grupos", 2, 500, 2)
+        simpsons_n = st.select_slider("Tamanho da amostra", [150, 1_000, 10_000, 100_000, 1_000_000, 5_000_000], 150,
+                                      format_func=lambda n: f"{n:,}".replace(",", "."), key="simpsons_n")
+        # Cada grupo precisa de pontos suficientes para que r e a inclinação por grupo signifiquem algo
+        max_groups = simpsons_n // MIN_GROUP_POINTS
+        if n_groups > max_groups:
+            n_label = f"{simpsons_n:,}".replace(",", ".")
+            st.caption(f"Com {n_label} pontos, no máximo {max_groups} grupos de {MIN_GROUP_POINTS} pontos: "
+                       f"usando {max_groups}.")
+            n_groups = max_groups
+        if st.button("🎲 Gerar Novos Grupos"):
+            st.session_state.simpsons_seed = new_seed()
+    
+    if 'simpsons_seed' not in st.session_state:
+        st.session_state.simpsons_seed = DEFAULT_SEED
+    group_stats, pooled, fig = simpsons_analysis(round(slope_diff, 1), simpsons_n, n_groups,
+                                                 st.session_state.simpsons_seed)
+    
+    # Gráfico
+    show_chart(fig, "simpsons")
+    
+    # Resumo por grupo
+    negative = np.mean(group_stats.slope < 0)
+    st.write(f"Inclinação geral: {pooled.slope:.2f} | "
+             f"Grupos com inclinação negativa: {negative:.0%} dos {n_groups}")
+    with st.expander("📋 Estatísticas por grupo"):
+        st.dataframe({
+            "Grupo": group_labels(n_groups),
+            "n": group_stats.n,
+            "Média de X": group_stats.mean_x,
+            "Média de Y": group_stats.mean_y,
+            "Correlação": group_stats.r,
+            "Inclinação": group_stats.slope,
+        }, use_container_width=True)
+    
+    st.info("📌 A correlação geral aponta numa direção, mas dentro de cada grupo a relação pode ser a oposta! Sempre verifique se há grupos nos seus dados.")
+    show_payload("simpsons")
+
+# Abas para diferentes cenários
+tab1, tab2, tab3 = st.tabs(["Correlação Linear", "Padrões Não-lineares", "Paradoxo de Simpson"])
+with tab1:
+    linear_section()
+with tab2:
+    curved_section()
+with tab3:
+    simpsons_section()
 
 
 # Principais Conclusões
@@ -113,5 +294,10 @@ st.markdown("""
 # Adicionar um rodapé divertido
 # Rodapé
 st.divider()
+
+# Memória por sessão, para dimensionar as instâncias
+show_session_memory({"Cache de amostras": lambda: get_sample_cache().stats()["nbytes"],
+                     "Gráficos fora da grade": lambda: grid_index.stats()["nbytes"]})
+show_profile_panel()
 st.caption("2025 Ferramenta de Ensino de Correlação | Desenvolvida para fins educacionais")
 st.caption("Prof. José Américo — Coppead/UCAM")
\ No newline at end of file
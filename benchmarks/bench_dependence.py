@@ -0,0 +1,53 @@
+"""Compara as medidas de dependência rápidas com as versões ingênuas O(n²).
+
+Uso (na raiz do repositório):
+
+    python -m benchmarks.bench_dependence
+"""
+import time
+
+import numpy as np
+
+from dependence import distance_correlation, distance_correlation_naive, kendall, kendall_naive
+
+NAIVE_SIZES = [500, 1_000, 2_000, 4_000]
+FAST_ONLY_SIZES = [100_000, 1_000_000]
+
+
+def best_time(func, *args, repeat=3):
+    """Menor tempo (s) de `repeat` execuções, e o resultado da última"""
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def u_shape(n, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(-2, 2, n)
+    return x, x**2 + rng.normal(0, 0.1, n) - 2
+
+
+def main():
+    pairs = [
+        ("Correlação de distância", distance_correlation, distance_correlation_naive),
+        ("Kendall", kendall, kendall_naive),
+    ]
+    print(f"{'medida':<25}{'n':>10}{'rápida (s)':>13}{'ingênua (s)':>13}{'ganho':>9}{'dif.':>10}")
+    for name, fast, naive in pairs:
+        for n in NAIVE_SIZES:
+            x, y = u_shape(n)
+            t_fast, v_fast = best_time(fast, x, y)
+            t_naive, v_naive = best_time(naive, x, y)
+            print(f"{name:<25}{n:>10,}{t_fast:>13.4f}{t_naive:>13.4f}{t_naive / t_fast:>8.0f}x"
+                  f"{abs(v_fast - v_naive):>10.1e}")
+        for n in FAST_ONLY_SIZES:
+            x, y = u_shape(n)
+            t_fast, _ = best_time(fast, x, y, repeat=1)
+            print(f"{name:<25}{n:>10,}{t_fast:>13.4f}{'-':>13}{'-':>9}{'-':>10}")
+
+
+if __name__ == "__main__":
+    main()
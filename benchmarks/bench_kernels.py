@@ -0,0 +1,233 @@
+"""Tempo e memória de pico dos caminhos quentes dos dois aplicativos.
+
+Mede os geradores de amostras, os núcleos de estatística (correlação,
+momentos, KDE, medidas de dependência, correlação por grupo e móvel) e a
+construção e serialização dos gráficos (Plotly e matplotlib), de n = 150 até
+10^7. O tempo é o menor de algumas repetições; a memória é o pico alocado
+numa execução separada, medido com tracemalloc (que vê os arrays do NumPy).
+
+Uso (na raiz do repositório):
+
+    python -m benchmarks.bench_kernels --save base.json        # versão em produção
+    python -m benchmarks.bench_kernels --compare base.json     # antes do deploy
+
+Com --compare, sai com código 1 se algum caso ficar mais lento ou usar mais
+memória que a base além da tolerância.
+"""
+import argparse
+import fnmatch
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+
+import numpy as np
+
+SIZES = [150, 10_000, 1_000_000, 10_000_000]
+QUICK_MAX_N = 1_000_000
+# Regressão: mais lento ou mais memória que a base por mais que a tolerância
+# e por mais que o piso absoluto (abaixo dele é ruído de medição)
+DEFAULT_TOLERANCE = 0.25
+TIME_FLOOR_S = 0.002
+MEMORY_FLOOR_MB = 1.0
+# Repete os casos rápidos até somar este tempo (no máximo MAX_REPEAT vezes)
+TARGET_TIME_S = 0.5
+MAX_REPEAT = 20
+# Probabilidades (desiguais) das categorias nos casos categóricos
+CATEGORY_PROBABILITIES = np.random.default_rng(0).dirichlet(np.ones(1_000))
+
+Case = namedtuple("Case", ["name", "setup", "run", "max_n"])
+
+
+def _sample(n, scenario="linear"):
+    from sample_cache import build_sample
+
+    return build_sample(scenario, 0.5 if scenario == "linear" else 1.0, 0, n)
+
+
+def _xy(n):
+    sample = _sample(n)
+    return np.asarray(sample.x, dtype=float), np.asarray(sample.y, dtype=float)
+
+
+def _values(n):
+    return (np.random.default_rng(0).standard_normal(n),)
+
+
+def _simpsons(n):
+    from sampling_engine import generate_simpsons_data
+
+    return generate_simpsons_data(-1.0, n, seed=0, n_groups=10)
+
+
+def _to_json(fig):
+    import plotly.io as pio
+
+    return pio.to_json(fig, validate=False)
+
+
+def _matplotlib_png(density):
+    import matplotlib.pyplot as plt
+
+    from distributions import plot_density
+
+    fig, ax = plt.subplots()
+    plot_density(ax, density, stat="count", hist_kws=dict(alpha=0.75, edgecolor="white"))
+    out = io.BytesIO()
+    fig.savefig(out, format="png")
+    plt.close(fig)
+    return out.getvalue()
+
+
+def cases():
+    """Casos medidos; `setup(n)` prepara os argumentos fora da medição"""
+    from categorical import sample_counts
+    from dependence import dependence_measures
+    from distributions import binned_density
+    from figures import curved_figure, linear_figure, simpsons_figure
+    from grouped_stats import group_ranges, grouped_correlation, pooled_correlation
+    from kde import fft_kde
+    from moments import Moments
+    from rolling_correlation import rolling_corr
+    from sampling_engine import generate_correlated_data, generate_curved_data, pearson_r
+
+    def simpsons_plot(x, y, group):
+        stats = grouped_correlation(x, y, group, 10)
+        x_min, x_max = group_ranges(x, group, 10)
+        return simpsons_figure(x, y, group, stats, pooled_correlation(x, y), x_min, x_max)
+
+    return [
+        Case("gerar/correlated", lambda n: (n,), lambda n: generate_correlated_data(0.5, n, seed=0), None),
+        Case("gerar/curved", lambda n: (n,), lambda n: generate_curved_data(1.0, n, seed=0), None),
+        Case("gerar/simpsons", lambda n: (n,), lambda n: _simpsons(n), None),
+        Case("gerar/categorical_counts", lambda n: (n,), lambda n: sample_counts(CATEGORY_PROBABILITIES, n, seed=0),
+             None),
+        Case("estat/pearson_r", _xy, pearson_r, None),
+        Case("estat/moments", _values, Moments.from_array, None),
+        Case("estat/fft_kde", _values, fft_kde, None),
+        Case("estat/binned_density", _values, binned_density, None),
+        Case("estat/grouped_correlation", _simpsons, lambda x, y, group: grouped_correlation(x, y, group, 10), None),
+        Case("estat/rolling_corr", _xy, lambda x, y: rolling_corr(x, y, 30), None),
+        Case("estat/dependence_measures", lambda n: _xy(n), dependence_measures, 1_000_000),
+        Case("grafico/linear_figure", lambda n: (_sample(n),), linear_figure, None),
+        Case("grafico/curved_figure", lambda n: (_sample(n, "curved"),), curved_figure, None),
+        Case("grafico/simpsons_figure", _simpsons, simpsons_plot, None),
+        Case("grafico/plotly_json", lambda n: (linear_figure(_sample(n)),), _to_json, None),
+        Case("grafico/matplotlib_png", lambda n: (binned_density(_values(n)[0]),), _matplotlib_png, None),
+    ]
+
+
+def measure(case, n):
+    """Menor tempo, tempo mediano e memória de pico (MB) de um caso"""
+    args = case.setup(n)
+    # A primeira execução paga importações e caches (fontes do matplotlib etc.)
+    case.run(*args)
+    times = []
+    while len(times) < MAX_REPEAT and (len(times) < 3 or sum(times) < TARGET_TIME_S):
+        start = time.perf_counter()
+        case.run(*args)
+        times.append(time.perf_counter() - start)
+        if times[-1] > TARGET_TIME_S:
+            break
+    tracemalloc.start()
+    case.run(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"time_s": min(times), "median_s": float(np.median(times)), "repeat": len(times),
+            "peak_mb": peak / 1024**2}
+
+
+def environment():
+    """Máquina e versões, gravadas junto com os resultados"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        commit = ""
+    import matplotlib
+    import pandas
+    import plotly
+
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pandas.__version__,
+        "plotly": plotly.__version__,
+        "matplotlib": matplotlib.__version__,
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "commit": commit,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Casos mais lentos ou com mais memória que a base: lista de (chave, motivo)"""
+    regressions = []
+    for key, current in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        if (current["time_s"] > base["time_s"] * (1 + tolerance)
+                and current["time_s"] - base["time_s"] > TIME_FLOOR_S):
+            regressions.append((key, f"tempo {current['time_s'] / base['time_s']:.2f}x"))
+        if (current["peak_mb"] > base["peak_mb"] * (1 + tolerance)
+                and current["peak_mb"] - base["peak_mb"] > MEMORY_FLOOR_MB):
+            regressions.append((key, f"memória {current['peak_mb'] / base['peak_mb']:.2f}x"))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", metavar="ARQUIVO", help="grava os resultados em JSON (para servir de base)")
+    parser.add_argument("--compare", metavar="ARQUIVO", help="compara com uma base gravada antes")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="piora relativa aceita (padrão: %(default)s)")
+    parser.add_argument("--max-n", type=int, default=SIZES[-1], help="maior tamanho medido")
+    parser.add_argument("--quick", action="store_true", help=f"só até n = {QUICK_MAX_N:,}")
+    parser.add_argument("--filter", default="*", help="padrão dos nomes dos casos (ex.: 'estat/*')")
+    args = parser.parse_args()
+
+    import matplotlib
+    matplotlib.use("Agg")
+
+    max_n = min(args.max_n, QUICK_MAX_N) if args.quick else args.max_n
+    baseline = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+
+    results = {}
+    print(f"{'caso':<28}{'n':>12}{'tempo (s)':>12}{'base (s)':>11}{'pico (MB)':>12}{'base (MB)':>11}")
+    for case in cases():
+        if not fnmatch.fnmatch(case.name, args.filter):
+            continue
+        for n in SIZES:
+            if n > max_n or (case.max_n is not None and n > case.max_n):
+                continue
+            key = f"{case.name}/{n}"
+            results[key] = current = measure(case, n)
+            base = baseline.get(key, {})
+            print(f"{case.name:<28}{n:>12,}{current['time_s']:>12.4f}"
+                  f"{base['time_s'] if base else float('nan'):>11.4f}{current['peak_mb']:>12.1f}"
+                  f"{base['peak_mb'] if base else float('nan'):>11.1f}", flush=True)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"environment": environment(), "results": results}, f, indent=1)
+        print(f"resultados gravados em {args.save}")
+
+    if args.compare:
+        regressions = compare(results, baseline, args.tolerance)
+        for key, reason in regressions:
+            print(f"REGRESSÃO {key}: {reason}")
+        print(f"{len(regressions)} regressão(ões) com tolerância de {args.tolerance:.0%}")
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
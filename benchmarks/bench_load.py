@@ -0,0 +1,256 @@
+"""Carga de várias sessões simultâneas nos dois aplicativos, sem navegador.
+
+Cada nível de carga roda num processo Python novo, como uma instância do
+servidor: N sessões do AppTest, cada uma numa thread (o servidor do Streamlit
+também roda as sessões em threads de um só processo), imitam alunos arrastando
+sliders, clicando botões, marcando caixas e trocando de página, com pausas
+aleatórias entre as interações. O relatório traz a latência das reexecuções
+(p50/p95/p99), a vazão, a memória residente (RSS) do processo e dos processos
+filhos, e a memória por sessão (média e marginal, isto é, o custo de cada
+sessão além das do primeiro nível), conforme N cresce. Roda offline, em
+Linux (lê /proc).
+
+Uso (na raiz do repositório):
+
+    python -m benchmarks.bench_load [--app correlation|introduction|all] [--sessions 1,5,10,20]
+                                    [--duration SEGUNDOS] [--think SEGUNDOS]
+
+A latência medida é a de AppTest.run(): inclui a execução do script e a
+montagem das mensagens dos elementos, mas não o WebSocket nem o navegador.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.bench_startup import PAGES
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APPS = {
+    "correlation": os.path.join(ROOT, "CorrelationSimmulator.py"),
+    "introduction": os.path.join(ROOT, "Introduction_2.py"),
+}
+DEFAULT_SESSIONS = [1, 5, 10, 20]
+DEFAULT_DURATION_S = 60.0
+# Pausa média entre duas interações de um aluno (distribuição exponencial)
+DEFAULT_THINK_S = 2.0
+# Chance de um aluno trocar de página no Introduction_2.py em cada interação
+PAGE_SWITCH_PROBABILITY = 0.2
+# select_sliders movidos pelos alunos simulados e os valores usados (tamanhos de sala de aula)
+SELECT_SLIDER_VALUES = {
+    "linear_n": [150, 1_000, 10_000],
+    "curved_n": [150, 1_000, 10_000],
+    "simpsons_n": [150, 1_000, 10_000],
+}
+
+
+def rss_mb(pid="self"):
+    """Memória residente de um processo (MB), lida de /proc"""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return 0.0
+
+
+def children_rss_mb():
+    """RSS somada dos processos filhos (pool de processos das simulações)"""
+    total = 0.0
+    for task in os.listdir("/proc/self/task"):
+        try:
+            with open(f"/proc/self/task/{task}/children") as f:
+                total += sum(rss_mb(pid) for pid in f.read().split())
+        except OSError:
+            pass
+    return total
+
+
+def widget_actions(at):
+    """Interações possíveis na tela atual: pares (tipo, widget)"""
+    actions = []
+    for slider in at.slider:
+        if isinstance(slider.value, (int, float)) and not isinstance(slider.value, bool):
+            actions.append(("slider", slider))
+    for widget in at.select_slider:
+        if widget.key in SELECT_SLIDER_VALUES:
+            actions.append(("select_slider", widget))
+    actions += [("button", widget) for widget in at.button]
+    actions += [("checkbox", widget) for widget in at.checkbox]
+    actions += [("selectbox", widget) for widget in at.selectbox if widget.options]
+    actions += [("radio", widget) for widget in at.radio if widget.key != "page" and widget.options]
+    return actions
+
+
+def act(kind, widget, rng):
+    """Aplica uma interação de aluno a um widget"""
+    if kind == "slider":
+        # Arrastar: alguns passos para um lado, dentro dos limites
+        step = widget.step or 1
+        value = widget.value + int(rng.integers(-3, 4) or 1) * step
+        value = min(max(value, widget.min), widget.max)
+        widget.set_value(round(value, 6) if isinstance(step, float) else int(value))
+    elif kind == "select_slider":
+        widget.set_value(int(rng.choice(SELECT_SLIDER_VALUES[widget.key])))
+    elif kind == "button":
+        widget.click()
+    elif kind == "checkbox":
+        widget.set_value(not widget.value)
+    else:
+        # Os selectbox/radio dos aplicativos não têm format_func: a opção exibida é o valor
+        widget.set_value(widget.options[int(rng.integers(len(widget.options)))])
+
+
+def student(app, rng, deadline, think, timeout, results):
+    """Uma sessão simulada: primeira carga e interações até o fim do prazo
+
+    `results` é da sessão (cada thread tem o seu); run_level junta todos no fim.
+    """
+    at = AppTest.from_file(APPS[app], default_timeout=timeout)
+    start = time.perf_counter()
+    at.run()
+    results["first"].append(time.perf_counter() - start)
+    results["errors"] += len(at.exception)
+    while time.perf_counter() < deadline:
+        time.sleep(rng.exponential(think))
+        if time.perf_counter() >= deadline:
+            break
+        if app == "introduction" and rng.random() < PAGE_SWITCH_PROBABILITY:
+            kind = "page"
+            at.radio(key="page").set_value(PAGES[int(rng.integers(len(PAGES)))])
+        else:
+            actions = widget_actions(at)
+            if not actions:
+                continue
+            kind, widget = actions[int(rng.integers(len(actions)))]
+            try:
+                act(kind, widget, rng)
+            except Exception:
+                # Valor que o widget não aceita: interação descartada, não é erro da aplicação
+                results["skipped"] += 1
+                continue
+        start = time.perf_counter()
+        try:
+            at.run()
+        except RuntimeError:
+            # Reexecução que passou do tempo máximo
+            results["errors"] += 1
+            continue
+        results["latency"].append(time.perf_counter() - start)
+        results["actions"][kind] += 1
+        results["errors"] += len(at.exception)
+        for exception in at.exception:
+            results["messages"][exception.message] += 1
+
+
+def run_level(app, n_sessions, duration, think, timeout, seed):
+    """Roda N sessões simultâneas neste processo e devolve as medidas"""
+    base_rss = rss_mb()
+    sessions = [{"first": [], "latency": [], "errors": 0, "skipped": 0, "actions": Counter(),
+                 "messages": Counter()}
+                for _ in range(n_sessions)]
+    start = time.perf_counter()
+    deadline = start + duration
+    rngs = [np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(n_sessions)]
+    threads = [threading.Thread(target=student, args=(app, rng, deadline, think, timeout, results), daemon=True)
+               for rng, results in zip(rngs, sessions)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    results = {"first": [], "latency": [], "errors": 0, "skipped": 0, "actions": Counter(),
+               "messages": Counter()}
+    for session in sessions:
+        for key in results:
+            results[key] += session[key]
+
+    from session_memory import get_session_registry
+
+    latency = np.array(results["latency"]) if results["latency"] else np.full(1, np.nan)
+    total_rss = rss_mb()
+    return {
+        "app": app,
+        "sessions": n_sessions,
+        "reruns": len(results["latency"]),
+        "throughput": len(results["latency"]) / elapsed,
+        "p50_s": float(np.percentile(latency, 50)),
+        "p95_s": float(np.percentile(latency, 95)),
+        "p99_s": float(np.percentile(latency, 99)),
+        "first_p95_s": float(np.percentile(results["first"], 95)) if results["first"] else float("nan"),
+        "errors": results["errors"],
+        "skipped": results["skipped"],
+        "actions": dict(results["actions"]),
+        "exceptions": dict(results["messages"]),
+        "base_rss_mb": base_rss,
+        "rss_mb": total_rss,
+        "children_rss_mb": children_rss_mb(),
+        "rss_per_session_mb": (total_rss - base_rss) / n_sessions,
+        "state_per_session_kb": get_session_registry().stats()["mean_bytes"] / 1024,
+    }
+
+
+def measure(app, n_sessions, args):
+    """Roda um nível de carga num processo novo"""
+    command = [sys.executable, "-m", "benchmarks.bench_load", "--child", app, str(n_sessions),
+               "--duration", str(args.duration), "--think", str(args.think), "--timeout", str(args.timeout),
+               "--seed", str(args.seed)]
+    out = subprocess.run(command, capture_output=True, text=True, check=True, cwd=ROOT)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--app", choices=[*APPS, "all"], default="all")
+    parser.add_argument("--sessions", default=",".join(map(str, DEFAULT_SESSIONS)),
+                        help="números de sessões simultâneas, separados por vírgula (padrão: %(default)s)")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION_S,
+                        help="duração de cada nível em segundos (padrão: %(default)s)")
+    parser.add_argument("--think", type=float, default=DEFAULT_THINK_S,
+                        help="pausa média entre interações de um aluno (padrão: %(default)s)")
+    parser.add_argument("--timeout", type=float, default=300, help="tempo máximo de uma reexecução")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", metavar="ARQUIVO", help="grava os resultados em JSON")
+    parser.add_argument("--child", nargs=2, metavar=("APP", "N"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        app, n_sessions = args.child
+        print(json.dumps(run_level(app, int(n_sessions), args.duration, args.think, args.timeout, args.seed)))
+        return
+
+    apps = list(APPS) if args.app == "all" else [args.app]
+    levels = [int(n) for n in args.sessions.split(",")]
+    rows = []
+    print(f"{'app':<14}{'N':>4}{'reexec.':>9}{'/s':>7}{'p50':>8}{'p95':>8}{'p99':>8}{'1ª p95':>8}"
+          f"{'erros':>7}{'RSS':>9}{'filhos':>9}{'RSS/sessão':>12}{'marginal':>11}{'estado':>9}")
+    for app in apps:
+        first = None
+        for n_sessions in levels:
+            row = measure(app, n_sessions, args)
+            # Custo de cada sessão a mais, sem as importações e caches que a primeira já pagou
+            first = first or row
+            row["marginal_rss_mb"] = ((row["rss_mb"] - first["rss_mb"]) / (n_sessions - first["sessions"])
+                                      if n_sessions > first["sessions"] else float("nan"))
+            rows.append(row)
+            print(f"{app:<14}{n_sessions:>4}{row['reruns']:>9}{row['throughput']:>7.2f}{row['p50_s']:>7.2f}s"
+                  f"{row['p95_s']:>7.2f}s{row['p99_s']:>7.2f}s{row['first_p95_s']:>7.2f}s{row['errors']:>7}"
+                  f"{row['rss_mb']:>6.0f} MB{row['children_rss_mb']:>6.0f} MB{row['rss_per_session_mb']:>9.1f} MB"
+                  f"{row['marginal_rss_mb']:>8.1f} MB{row['state_per_session_kb']:>6.1f} KB", flush=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Mede a partida a frio de Introduction_2.py e compara com um orçamento.
+
+Cada página é medida num processo Python novo, como depois de reiniciar o
+contêiner: importação do Streamlit e primeira renderização já na página
+medida, incluindo as importações feitas por ela. Também lista quais
+bibliotecas pesadas ficaram carregadas.
+
+Uso (na raiz do repositório):
+
+    python -m benchmarks.bench_startup [--budget SEGUNDOS]
+
+Sai com código 1 se alguma primeira renderização passar do orçamento.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Introduction_2.py")
+PAGES = [
+    "Tipos de Variáveis",
+    "Tipos de Dados",
+    "Medidas de Tendência Central",
+    "Medidas de Dispersão",
+    "Medidas de Assimetria e Curtose",
+    "Matriz de Correlação",
+]
+DEFAULT_BUDGET_S = 5.0
+
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+imported = time.perf_counter()
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+at.session_state["page"] = sys.argv[2]
+at.run()
+first_render = time.perf_counter()
+heavy = [m for m in ("matplotlib.pyplot", "seaborn", "scipy.stats") if m in sys.modules]
+print(json.dumps({
+    "streamlit_import_s": imported - start,
+    "first_render_s": first_render - imported,
+    "loaded_modules": heavy,
+    "errors": len(at.exception),
+}))
+"""
+
+
+def measure(page):
+    """Roda o aplicativo num processo novo e devolve os tempos da página"""
+    out = subprocess.run([sys.executable, "-c", CHILD, APP, page],
+                         capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_S,
+                        help="orçamento em segundos para a primeira renderização de cada página")
+    args = parser.parse_args()
+
+    over_budget = False
+    print(f"{'página':<34}{'import st':>11}{'1ª render':>11}  módulos pesados")
+    for page in PAGES:
+        result = measure(page)
+        slow = result["first_render_s"] > args.budget
+        over_budget |= slow or result["errors"] > 0
+        flag = "  <-- acima do orçamento" if slow else ""
+        print(f"{page:<34}{result['streamlit_import_s']:>10.2f}s{result['first_render_s']:>10.2f}s"
+              f"  {', '.join(result['loaded_modules']) or '-'}{flag}")
+    print(f"orçamento por página: {args.budget:.1f}s")
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
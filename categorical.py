@@ -0,0 +1,52 @@
+"""Sorteio e contagem de variáveis categóricas e ordinais com códigos inteiros.
+
+As categorias viram códigos 0..k-1 (`encode`) e nunca são sorteadas como
+strings. Como as páginas só mostram contagens, `sample_counts` as sorteia
+direto da multinomial, em O(k) para qualquer n, sem gerar os valores.
+Tabelas e gráficos partem das contagens, e não dos dados brutos.
+"""
+import numpy as np
+import pandas as pd
+
+from sampling_engine import make_rng
+
+# Folga aceita na soma das probabilidades digitadas
+SUM_TOL = 1e-6
+# Quantas posições inválidas listar na mensagem de erro
+MAX_REPORTED_ERRORS = 5
+
+
+def encode(labels):
+    """(rótulos únicos na ordem em que aparecem, código de cada rótulo)"""
+    codes, uniques = pd.factorize(pd.Series(labels, dtype=object))
+    return list(uniques), codes
+
+
+def validate_probabilities(probabilities, n_categories=None):
+    """Probabilidades como array float, normalizadas; ValueError com a posição dos valores inválidos"""
+    p = np.asarray(probabilities, dtype=float)
+    if p.ndim != 1 or not len(p):
+        raise ValueError("Informe ao menos uma probabilidade.")
+    if n_categories is not None and len(p) != n_categories:
+        raise ValueError(f"São {n_categories} categoria(s) e {len(p)} probabilidade(s).")
+    bad = np.flatnonzero(~np.isfinite(p) | (p < 0))
+    if len(bad):
+        listed = ", ".join(f"#{pos + 1}" for pos in bad[:MAX_REPORTED_ERRORS])
+        if len(bad) > MAX_REPORTED_ERRORS:
+            listed += f" e mais {len(bad) - MAX_REPORTED_ERRORS}"
+        raise ValueError(f"{len(bad)} probabilidade(s) negativa(s) ou inválida(s): {listed}")
+    total = p.sum()
+    if abs(total - 1) > SUM_TOL:
+        raise ValueError(f"As probabilidades somam {total:g}, e não 1.")
+    return p / total
+
+
+def sample_counts(probabilities, n, seed=None):
+    """Contagens de `n` sorteios, direto da multinomial (sem gerar os valores)"""
+    return make_rng(seed).multinomial(n, validate_probabilities(probabilities))
+
+
+def count_table(labels, counts):
+    """Contagens por rótulo, da mais frequente para a menos (como value_counts)"""
+    table = pd.Series(counts, index=pd.Index(labels), name="count")
+    return table[table > 0].sort_values(ascending=False, kind="stable")
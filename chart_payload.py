@@ -0,0 +1,109 @@
+"""Bytes dos gráficos Plotly enviados ao navegador a cada interação.
+
+O Streamlit serializa cada gráfico em JSON a cada execução do script, mas uma
+mensagem de pelo menos global.minCachedMessageSize bytes que o navegador já
+recebeu nas últimas global.maxCachedMessageAge execuções vai só como uma
+referência ao seu hash. Um gráfico que não mudou custa quase nada; um que
+mudou é reenviado inteiro. `PayloadMeter` reproduz essa regra para estimar os
+bytes de gráficos de cada interação, por sessão.
+
+Medir serializa cada figura nova uma segunda vez, além da serialização do
+próprio Streamlit; por isso a medição e a legenda só existem com ?admin=1 na URL.
+"""
+import hashlib
+import weakref
+
+import plotly.io as pio
+import streamlit as st
+
+from session_memory import format_bytes
+
+# Tamanho aproximado de uma mensagem de referência (hash e metadados)
+REFERENCE_BYTES = 64
+
+# Tamanho e hash do JSON de cada figura viva (por id), calculados uma vez por objeto
+_specs = {}
+
+
+def spec_info(fig):
+    """(bytes, hash) do JSON que o Streamlit envia para a figura"""
+    info = _specs.get(id(fig))
+    if info is None:
+        spec = pio.to_json(fig, validate=False).encode()
+        info = (len(spec), hashlib.md5(spec).hexdigest())
+        _specs[id(fig)] = info
+        # Figuras não são hasheáveis; a entrada sai quando a figura é coletada
+        weakref.finalize(fig, _specs.pop, id(fig), None)
+    return info
+
+
+class PayloadMeter:
+    """Bytes de gráficos enviados por interação, com a regra de cache do Streamlit"""
+
+    def __init__(self, min_cached_bytes=10_000, max_age=2):
+        self.min_cached_bytes = min_cached_bytes
+        self.max_age = max_age
+        self.total_bytes = 0
+        self.full_bytes = 0
+        self._runs = {}
+        self._last_run = {}
+        self._interactions = {}
+
+    def start(self, scope):
+        """Começa a contar uma nova execução da seção `scope`"""
+        self._runs[scope] = self._runs.get(scope, 0) + 1
+        self._interactions[scope] = {"bytes": 0, "sent": 0, "reused": 0}
+        # Hashes antigos já saíram do cache do navegador
+        run = self._runs[scope]
+        self._last_run = {key: last for key, last in self._last_run.items()
+                          if key[0] != scope or run - last <= self.max_age}
+
+    def record(self, scope, fig):
+        """Contabiliza uma figura; devolve os bytes estimados no envio"""
+        nbytes, digest = spec_info(fig)
+        run = self._runs.get(scope, 0)
+        last = self._last_run.get((scope, digest))
+        reused = nbytes >= self.min_cached_bytes and last is not None and run - last <= self.max_age
+        self._last_run[(scope, digest)] = run
+        sent = REFERENCE_BYTES if reused else nbytes
+        interaction = self._interactions.setdefault(scope, {"bytes": 0, "sent": 0, "reused": 0})
+        interaction["bytes"] += sent
+        interaction["reused" if reused else "sent"] += 1
+        self.total_bytes += sent
+        self.full_bytes += nbytes
+        return sent
+
+    def interaction(self, scope):
+        return self._interactions.get(scope, {"bytes": 0, "sent": 0, "reused": 0})
+
+
+def get_payload_meter():
+    """Medidor desta sessão, guardado no session_state"""
+    if "payload_meter" not in st.session_state:
+        st.session_state.payload_meter = PayloadMeter(
+            int(st.get_option("global.minCachedMessageSize")), int(st.get_option("global.maxCachedMessageAge")))
+    return st.session_state.payload_meter
+
+
+def payload_enabled():
+    """A medição só roda com ?admin=1 (custa uma serialização extra por figura nova)"""
+    return st.query_params.get("admin") == "1"
+
+
+def show_chart(fig, scope):
+    """st.plotly_chart que contabiliza os bytes enviados na seção `scope` (com ?admin=1)"""
+    if payload_enabled():
+        get_payload_meter().record(scope, fig)
+    st.plotly_chart(fig, use_container_width=True)
+
+
+def show_payload(scope):
+    """Legenda com os bytes de gráficos da última interação da seção e da sessão (com ?admin=1)"""
+    if not payload_enabled():
+        return
+    meter = get_payload_meter()
+    interaction = meter.interaction(scope)
+    saved = 1 - meter.total_bytes / meter.full_bytes if meter.full_bytes else 0.0
+    st.caption(f"📡 Gráficos nesta interação: {format_bytes(interaction['bytes'])} "
+               f"({interaction['sent']} enviado(s), {interaction['reused']} reaproveitado(s) do navegador) | "
+               f"sessão: {format_bytes(meter.total_bytes)}, {saved:.0%} economizado pelo cache")
@@ -0,0 +1,250 @@
+"""Matrizes de correlação (Pearson e Spearman) de tabelas largas.
+
+A tabela fica num np.memmap float32 (linhas, colunas) em disco, escrito em
+blocos de linhas, e nunca é carregada inteira. Uma passada calcula média e
+soma dos quadrados dos desvios de cada coluna (fórmulas de Chan por bloco);
+outra acumula Z'Z sobre blocos de linhas padronizados, com os ladrilhos
+(bloco de colunas I x bloco de colunas J) de cada bloco calculados em
+threads. A memória de pico fica em um bloco de linhas mais a própria matriz.
+Valores ausentes entram como a média da coluna (contribuem com zero).
+
+O Spearman é o Pearson dos postos: a tabela é copiada uma vez para um
+memmap float64 por colunas (em float32 os postos deixariam de ser exatos
+com milhões de linhas), e cada bloco de colunas é ordenado em uma thread.
+"""
+import os
+import tempfile
+import warnings
+import weakref
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from monte_carlo import MAX_WORKERS
+
+# Memória aproximada de um bloco de linhas (ou de colunas, ao calcular postos)
+BLOCK_BYTES = 64 * 1024**2
+# Colunas por ladrilho da matriz
+BLOCK_COLUMNS = 256
+# Acima disto a matriz (colunas²) deixa de caber confortavelmente na memória
+MATRIX_MAX_COLUMNS = 4000
+# Acima disto a ordem do mapa de calor vem do autovetor principal, não do agrupamento
+CLUSTER_MAX_COLUMNS = 2000
+METHODS = ("pearson", "spearman")
+
+MemmapTable = namedtuple("MemmapTable", ["data", "columns"])
+CorrelationPair = namedtuple("CorrelationPair", ["first", "second", "r"])
+
+
+def block_rows(n_columns, block_bytes=BLOCK_BYTES):
+    """Linhas por bloco para caber em `block_bytes`"""
+    return max(1, block_bytes // (8 * max(n_columns, 1)))
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _temporary_memmap(shape, order="C", dtype=np.float32, directory=None):
+    """Memmap num arquivo temporário, apagado quando o array é coletado"""
+    fd, path = tempfile.mkstemp(suffix=f".f{np.dtype(dtype).itemsize * 8}", dir=directory)
+    os.close(fd)
+    data = np.memmap(path, dtype=dtype, mode="w+", shape=shape, order=order)
+    weakref.finalize(data, _remove_quietly, path)
+    return data
+
+
+def write_memmap(chunks, columns, directory=None):
+    """Grava blocos (linhas, colunas) num arquivo float32 e o abre como memmap"""
+    fd, path = tempfile.mkstemp(suffix=".f32", dir=directory)
+    n_rows = 0
+    with os.fdopen(fd, "wb") as out:
+        for chunk in chunks:
+            np.ascontiguousarray(chunk, dtype=np.float32).tofile(out)
+            n_rows += len(chunk)
+    if not n_rows or not len(columns):
+        _remove_quietly(path)
+        raise ValueError("a tabela não tem linhas ou colunas numéricas")
+    data = np.memmap(path, dtype=np.float32, mode="r", shape=(n_rows, len(columns)))
+    weakref.finalize(data, _remove_quietly, path)
+    return MemmapTable(data, list(columns))
+
+
+def file_chunks(file, fmt, chunk_rows=100_000, max_columns=MATRIX_MAX_COLUMNS):
+    """Colunas numéricas de um CSV/Parquet e um gerador dos seus blocos de linhas (float32)"""
+    import pandas as pd
+
+    file.seek(0)
+    if fmt == "parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        parquet = pq.ParquetFile(file)
+        columns = [field.name for field in parquet.schema_arrow
+                   if pa.types.is_integer(field.type) or pa.types.is_floating(field.type)][:max_columns]
+        batches = parquet.iter_batches(batch_size=chunk_rows, columns=columns)
+        return columns, (batch.to_pandas().to_numpy(dtype=np.float32, na_value=np.nan) for batch in batches)
+
+    reader = pd.read_csv(file, chunksize=chunk_rows)
+    first = next(reader)
+    columns = list(first.select_dtypes("number").columns)[:max_columns]
+
+    def chunks():
+        for chunk in _chain(first, reader):
+            try:
+                yield chunk[columns].to_numpy(dtype=np.float32)
+            except (ValueError, TypeError):
+                yield chunk[columns].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float32)
+    return columns, chunks()
+
+
+def _chain(first, rest):
+    yield first
+    yield from rest
+
+
+def column_moments(data, block_bytes=BLOCK_BYTES):
+    """Contagem, média e soma dos quadrados dos desvios de cada coluna, em blocos de linhas"""
+    n_columns = data.shape[1]
+    n = np.zeros(n_columns)
+    mean = np.zeros(n_columns)
+    m2 = np.zeros(n_columns)
+    rows = block_rows(n_columns, block_bytes)
+    for start in range(0, data.shape[0], rows):
+        block = np.asarray(data[start:start + rows], dtype=float)
+        n_block = (~np.isnan(block)).sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean_block = np.where(n_block > 0, np.nansum(block, axis=0) / n_block, 0.0)
+            m2_block = np.nansum((block - mean_block) ** 2, axis=0)
+            total = n + n_block
+            delta = mean_block - mean
+            weight = np.where(total > 0, n_block / total, 0.0)
+        mean += delta * weight
+        m2 += m2_block + delta * delta * n * weight
+        n = total
+    return n, mean, m2
+
+
+def _accumulate_tile(out, z, i0, i1, j0, j1):
+    out[i0:i1, j0:j1] += z[:, i0:i1].T @ z[:, j0:j1]
+
+
+def pearson_matrix(data, block_bytes=BLOCK_BYTES, block_columns=BLOCK_COLUMNS, n_workers=MAX_WORKERS):
+    """Matriz de Pearson das colunas de `data` (array ou memmap (linhas, colunas))
+
+    Colunas constantes (ou vazias) ficam com NaN.
+    """
+    n_columns = data.shape[1]
+    _, mean, m2 = column_moments(data, block_bytes)
+    constant = ~(m2 > 0)
+    with np.errstate(divide="ignore"):
+        scale = np.where(constant, 0.0, 1 / np.sqrt(m2))
+
+    out = np.zeros((n_columns, n_columns))
+    edges = list(range(0, n_columns, block_columns)) + [n_columns]
+    tiles = [(edges[a], edges[a + 1], edges[b], edges[b + 1])
+             for a in range(len(edges) - 1) for b in range(a, len(edges) - 1)]
+    rows = block_rows(n_columns, block_bytes)
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        for start in range(0, data.shape[0], rows):
+            z = np.asarray(data[start:start + rows], dtype=float)
+            z -= mean
+            z *= scale
+            z[np.isnan(z)] = 0.0
+            list(executor.map(lambda tile: _accumulate_tile(out, z, *tile), tiles))
+
+    # Só os ladrilhos do triângulo superior foram calculados
+    out = np.triu(out) + np.triu(out, 1).T
+    np.clip(out, -1.0, 1.0, out=out)
+    np.fill_diagonal(out, 1.0)
+    out[constant, :] = np.nan
+    out[:, constant] = np.nan
+    return out
+
+
+def rank_columns(data, block_bytes=BLOCK_BYTES, n_workers=MAX_WORKERS, directory=None):
+    """Postos médios de cada coluna num memmap por colunas (NaN continua NaN)"""
+    from scipy.stats import rankdata
+
+    n_rows, n_columns = data.shape
+    # float64: em float32 os postos perdem precisão acima de 2**24 (os postos médios, acima de 2**23)
+    ranks = _temporary_memmap(data.shape, order="F", dtype=np.float64, directory=directory)
+    rows = block_rows(n_columns, block_bytes)
+    for start in range(0, n_rows, rows):
+        ranks[start:start + rows] = data[start:start + rows]
+
+    # rankdata usa algumas cópias float64 do bloco
+    width = max(1, block_bytes // (24 * n_rows))
+
+    def rank_block(c0):
+        block = np.asarray(ranks[:, c0:c0 + width], dtype=float)
+        ranks[:, c0:c0 + width] = rankdata(block, axis=0, nan_policy="omit")
+
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        list(executor.map(rank_block, range(0, n_columns, width)))
+    return ranks
+
+
+def correlation_matrix(data, method="pearson", block_bytes=BLOCK_BYTES, block_columns=BLOCK_COLUMNS,
+                       n_workers=MAX_WORKERS):
+    """Matriz de correlação de Pearson ou de Spearman das colunas de `data`"""
+    if method not in METHODS:
+        raise ValueError(f"método desconhecido: {method}")
+    if method == "spearman":
+        data = rank_columns(data, block_bytes, n_workers)
+    return pearson_matrix(data, block_bytes, block_columns, n_workers)
+
+
+def top_pairs(matrix, columns, k=20):
+    """Os `k` pares de colunas distintas com maior |r|, do mais forte para o mais fraco"""
+    n_columns = len(columns)
+    strength = np.nan_to_num(np.abs(matrix), nan=-1.0)
+    strength[np.tri(n_columns, dtype=bool)] = -1.0
+    k = min(k, n_columns * (n_columns - 1) // 2)
+    if k <= 0:
+        return []
+    flat = np.argpartition(strength.ravel(), -k)[-k:]
+    flat = flat[np.argsort(strength.ravel()[flat])[::-1]]
+    rows, cols = np.divmod(flat, n_columns)
+    return [CorrelationPair(columns[i], columns[j], matrix[i, j]) for i, j in zip(rows, cols) if strength[i, j] >= 0]
+
+
+def cluster_order(matrix):
+    """Ordem das colunas que aproxima as mais correlacionadas (em |r|)"""
+    n_columns = len(matrix)
+    if n_columns < 3:
+        return np.arange(n_columns)
+    similarity = np.nan_to_num(matrix)
+    if n_columns > CLUSTER_MAX_COLUMNS:
+        # Ordena pelo autovetor principal (iteração de potência)
+        vector = np.ones(n_columns)
+        for _ in range(50):
+            vector = similarity @ vector
+            vector /= np.linalg.norm(vector) or 1.0
+        return np.argsort(vector)
+
+    from scipy.cluster.hierarchy import leaves_list, linkage
+    from scipy.spatial.distance import squareform
+
+    distance = 1 - np.abs(similarity)
+    distance = np.clip((distance + distance.T) / 2, 0.0, None)
+    np.fill_diagonal(distance, 0.0)
+    return leaves_list(linkage(squareform(distance, checks=False), method="average"))
+
+
+def downsample(matrix, max_size=200):
+    """Reduz a matriz para no máximo `max_size` x `max_size`, pela média de blocos"""
+    size = len(matrix)
+    factor = -(-size // max_size)
+    if factor <= 1:
+        return matrix
+    reduced = -(-size // factor)
+    pad = reduced * factor - size
+    padded = np.pad(matrix, ((0, pad), (0, pad)), constant_values=np.nan)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.nanmean(padded.reshape(reduced, factor, reduced, factor), axis=(1, 3))
@@ -0,0 +1,363 @@
+"""Registro de conjuntos de dados didáticos, guardados em colunas no disco.
+
+Cada conjunto é uma pasta em DATASET_DIR/<coleção>/<nome> com um arquivo .npy
+por coluna (x e y) e um meta.json com a descrição e as estatísticas já
+calculadas: médias, desvios padrão, correlação, reta de regressão e, para
+conjuntos pequenos, o intervalo de bootstrap e o p-valor de permutação. As
+colunas são abertas com np.load(mmap_mode="r"): nada é copiado para a memória
+das sessões, e o sistema operacional compartilha as mesmas páginas entre
+sessões e processos. Escolher um conjunto no aplicativo não recalcula nada.
+
+Os conjuntos embutidos (Quarteto de Anscombe e conjuntos no estilo do
+Datasaurus) são gravados na primeira vez que o registro é aberto. Para
+adicionar um conjunto de um CSV (na raiz do repositório):
+
+    python dataset_registry.py add "Minha turma" "Prova 1 x Prova 2" notas.csv --x prova1 --y prova2
+    python dataset_registry.py list
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from collections import namedtuple
+from contextlib import suppress
+
+import numpy as np
+import streamlit as st
+
+from moments import Moments
+from resampling import RESAMPLING_MAX_POINTS, bootstrap_r, permutation_test_r
+from sampling_engine import pearson_r
+
+logger = logging.getLogger(__name__)
+
+DATASET_DIR = os.environ.get("DATASET_DIR",
+                             os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "datasets"))
+# Muda quando o conteúdo do meta.json muda; os embutidos são regravados
+FORMAT_VERSION = 1
+# Tentativas de leitura enquanto outro processo troca a pasta de um conjunto
+LOAD_RETRIES = 5
+
+Dataset = namedtuple("Dataset", ["collection", "name", "description", "x", "y", "stats"])
+
+ANSCOMBE = "Quarteto de Anscombe"
+ANSCOMBE_X = [10, 8, 13, 9, 11, 14, 6, 4, 12, 7, 5]
+ANSCOMBE_DATA = {
+    'Conjunto 1': (ANSCOMBE_X, [8.04, 6.95, 7.58, 8.81, 8.33, 9.96, 7.24, 4.26, 10.84, 4.82, 5.68]),
+    'Conjunto 2': (ANSCOMBE_X, [9.14, 8.14, 8.74, 8.77, 9.26, 8.10, 6.13, 3.10, 9.13, 7.26, 4.74]),
+    'Conjunto 3': (ANSCOMBE_X, [7.46, 6.77, 12.74, 7.11, 7.81, 8.84, 6.08, 5.39, 8.15, 6.42, 5.73]),
+    'Conjunto 4': ([8, 8, 8, 8, 8, 8, 8, 19, 8, 8, 8], [6.58, 5.76, 7.71, 8.84, 8.47, 7.04, 5.25, 12.50, 5.56, 7.91, 6.89]),
+}
+
+SAME_STATS = "Mesmas estatísticas (estilo Datasaurus)"
+# Médias, desvios padrão e correlação do "Datasaurus Dozen", impostos a cada forma
+SAME_STATS_TARGET = {"mean_x": 54.26, "mean_y": 47.83, "std_x": 16.76, "std_y": 26.93, "r": -0.06}
+SAME_STATS_POINTS = 142
+
+
+def _circle(rng, n):
+    angle = rng.uniform(0, 2 * np.pi, n)
+    radius = 1 + rng.normal(0, 0.03, n)
+    return radius * np.cos(angle), radius * np.sin(angle)
+
+
+def _cross(rng, n):
+    t = rng.uniform(-1, 1, n)
+    sign = np.where(np.arange(n) % 2 == 0, 1, -1)
+    return t + rng.normal(0, 0.02, n), sign * t + rng.normal(0, 0.02, n)
+
+
+def _lines(rng, n):
+    return rng.uniform(0, 1, n), np.arange(n) % 4 + rng.normal(0, 0.03, n)
+
+
+def _cloud(rng, n):
+    return rng.normal(0, 1, n), rng.normal(0, 1, n)
+
+
+SAME_STATS_SHAPES = {"Círculo": _circle, "Xis": _cross, "Linhas": _lines, "Nuvem": _cloud}
+
+
+def match_moments(x, y, target):
+    """Transformação afim de (x, y) com exatamente as médias, desvios e correlação de `target`"""
+    xz = (x - x.mean()) / x.std(ddof=1)
+    yz = (y - y.mean()) / y.std(ddof=1)
+    # Parte de y sem correlação com x, padronizada
+    residual = yz - np.dot(xz, yz) / np.dot(xz, xz) * xz
+    residual /= residual.std(ddof=1)
+    r = target["r"]
+    yz = r * xz + np.sqrt(1 - r**2) * residual
+    return target["mean_x"] + target["std_x"] * xz, target["mean_y"] + target["std_y"] * yz
+
+
+def builtin_datasets():
+    """Conjuntos embutidos: (coleção, nome, descrição, x, y)"""
+    for name, (x, y) in ANSCOMBE_DATA.items():
+        yield ANSCOMBE, name, "Anscombe (1973), 11 pontos.", x, y
+    rng = np.random.default_rng(0)
+    for name, shape in SAME_STATS_SHAPES.items():
+        x, y = match_moments(*shape(rng, SAME_STATS_POINTS), SAME_STATS_TARGET)
+        yield SAME_STATS, name, f"{SAME_STATS_POINTS} pontos com as médias, os desvios e a correlação do Datasaurus.", x, y
+
+
+def summarize(x, y):
+    """Estatísticas gravadas no meta.json (as mesmas que a página exibia)"""
+    moments_x = Moments.from_array(x)
+    moments_y = Moments.from_array(y)
+    slope, intercept = np.polyfit(x, y, 1)
+    stats = {
+        "n": len(x),
+        "mean_x": moments_x.mean, "mean_y": moments_y.mean,
+        "std_x": moments_x.std(), "std_y": moments_y.std(),
+        "r": float(pearson_r(x, y)),
+        "slope": float(slope), "intercept": float(intercept),
+        "r_low": None, "r_high": None, "p_value": None,
+    }
+    if len(x) <= RESAMPLING_MAX_POINTS:
+        boot = bootstrap_r(x, y, seed=0)
+        stats.update(r_low=boot.low, r_high=boot.high, p_value=permutation_test_r(x, y, seed=0).p_value)
+    return {key: float(value) if isinstance(value, np.floating) else value for key, value in stats.items()}
+
+
+def slug(name):
+    """Nome de pasta para uma coleção ou conjunto
+
+    O resumo do nome original no fim evita que nomes diferentes ("A/B" e "A B") caiam na mesma pasta.
+    """
+    readable = re.sub(r"[^\w-]+", "_", name).strip("_") or "_"
+    return f"{readable}-{hashlib.blake2b(name.encode(), digest_size=4).hexdigest()}"
+
+
+class DatasetRegistry:
+    """Conjuntos gravados em DATASET_DIR, abertos por memory mapping e guardados por processo"""
+
+    def __init__(self, root=DATASET_DIR):
+        self.root = root
+        self.hits = 0
+        self.misses = 0
+        self._index = None
+        self._index_signature = None
+        # (identidade do meta.json, conjunto); os arrays são memmaps: guardar todos custa só espaço de endereçamento
+        self._datasets = {}
+        self._lock = threading.Lock()
+
+    def _path(self, collection, name):
+        return os.path.join(self.root, slug(collection), slug(name))
+
+    def _read_meta(self, path):
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            return json.load(f)
+
+    def _signature(self):
+        """mtimes da raiz e das pastas das coleções: mudam quando um conjunto entra, sai ou é trocado"""
+        try:
+            with os.scandir(self.root) as entries:
+                collections = sorted((entry.name, entry.stat().st_mtime_ns) for entry in entries
+                                     if entry.is_dir() and not entry.name.startswith("."))
+            return os.stat(self.root).st_mtime_ns, tuple(collections)
+        except FileNotFoundError:
+            return None
+
+    def _swap(self, temporary, path):
+        """Põe a pasta nova no lugar do conjunto; a antiga sai com um rename e só depois é apagada"""
+        while True:
+            try:
+                os.rename(temporary, path)
+                return
+            except OSError:
+                if not os.path.exists(path):
+                    raise
+            aside = f"{temporary}.old"
+            try:
+                os.rename(path, aside)
+            except FileNotFoundError:
+                # Outro gravador tirou a pasta antes: tenta de novo
+                continue
+            shutil.rmtree(aside, ignore_errors=True)
+
+    def write(self, collection, name, x, y, description=""):
+        """Grava um conjunto e suas estatísticas (substitui o de mesmo nome na coleção)"""
+        x = np.ascontiguousarray(x, dtype=float)
+        y = np.ascontiguousarray(y, dtype=float)
+        if x.ndim != 1 or x.shape != y.shape or len(x) < 3:
+            raise ValueError("x e y precisam ser vetores do mesmo tamanho, com pelo menos 3 valores")
+        if not (np.isfinite(x).all() and np.isfinite(y).all()):
+            raise ValueError("x e y não podem ter valores faltantes ou infinitos")
+        path = self._path(collection, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Pasta temporária única ao lado do destino (pastas com "." são ignoradas pelo índice)
+        temporary = tempfile.mkdtemp(prefix=f".{slug(name)}.", suffix=".tmp", dir=os.path.dirname(path))
+        # mkdtemp cria a pasta só para o dono; o servidor pode rodar com outro usuário
+        os.chmod(temporary, 0o755)
+        try:
+            np.save(os.path.join(temporary, "x.npy"), x)
+            np.save(os.path.join(temporary, "y.npy"), y)
+            meta = {"version": FORMAT_VERSION, "collection": collection, "name": name, "description": description,
+                    "stats": summarize(x, y)}
+            with open(os.path.join(temporary, "meta.json"), "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False, indent=1)
+            # Sessões que já mapearam os arquivos antigos continuam a lê-los até soltá-los
+            self._swap(temporary, path)
+        except BaseException:
+            shutil.rmtree(temporary, ignore_errors=True)
+            raise
+        with self._lock:
+            self._datasets.pop((collection, name), None)
+            self._index = None
+
+    def migrate(self):
+        """Move para a pasta atual os conjuntos gravados com outro nome de pasta (versões antigas de `slug`)"""
+        for directory, subdirectories, files in list(os.walk(self.root)):
+            subdirectories[:] = [d for d in subdirectories if not d.startswith(".")]
+            if "meta.json" not in files:
+                continue
+            try:
+                meta = self._read_meta(directory)
+            except FileNotFoundError:
+                continue
+            path = self._path(meta["collection"], meta["name"])
+            if os.path.abspath(directory) == os.path.abspath(path):
+                continue
+            if os.path.exists(path):
+                # O conjunto já está na pasta atual: a cópia antiga sobrou de uma colisão ou migração
+                shutil.rmtree(directory, ignore_errors=True)
+                continue
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.rename(directory, path)
+            # Apaga a pasta antiga da coleção quando ela fica vazia
+            with suppress(OSError):
+                os.rmdir(os.path.dirname(directory))
+        with self._lock:
+            self._index = None
+
+    def ensure_builtin(self):
+        """Grava os conjuntos embutidos que faltam ou estão em formato antigo"""
+        for collection, name, description, x, y in builtin_datasets():
+            try:
+                current = self._read_meta(self._path(collection, name))["version"] == FORMAT_VERSION
+            except (OSError, ValueError, KeyError):
+                current = False
+            if not current:
+                self.write(collection, name, x, y, description)
+
+    def collections(self):
+        """{coleção: [nomes dos conjuntos]}, relidos dos meta.json só quando as pastas mudam"""
+        signature = self._signature()
+        with self._lock:
+            if self._index is None or signature != self._index_signature:
+                index = {}
+                for directory, subdirectories, files in sorted(os.walk(self.root)):
+                    # Pastas temporárias e antigas de uma troca em andamento
+                    subdirectories[:] = [d for d in subdirectories if not d.startswith(".")]
+                    if "meta.json" not in files:
+                        continue
+                    try:
+                        meta = self._read_meta(directory)
+                    except FileNotFoundError:
+                        continue
+                    # Pastas fora do lugar (ainda não migradas) não são abertas por `load`
+                    if os.path.abspath(directory) != os.path.abspath(self._path(meta["collection"], meta["name"])):
+                        continue
+                    index.setdefault(meta["collection"], []).append(meta["name"])
+                self._index = index
+                self._index_signature = signature
+            return {collection: list(names) for collection, names in self._index.items()}
+
+    def load(self, collection, name):
+        """Conjunto com as colunas mapeadas do disco (o mesmo objeto para todas as sessões)
+
+        Se o conjunto foi regravado (por exemplo pela linha de comando), é aberto de novo.
+        """
+        key = (collection, name)
+        path = self._path(collection, name)
+        for attempt in range(LOAD_RETRIES):
+            try:
+                info = os.stat(os.path.join(path, "meta.json"))
+                identity = (info.st_ino, info.st_mtime_ns)
+                with self._lock:
+                    cached = self._datasets.get(key)
+                    if cached is not None and cached[0] == identity:
+                        self.hits += 1
+                        return cached[1]
+                    meta = self._read_meta(path)
+                    dataset = Dataset(collection, name, meta["description"],
+                                      np.load(os.path.join(path, "x.npy"), mmap_mode="r"),
+                                      np.load(os.path.join(path, "y.npy"), mmap_mode="r"), meta["stats"])
+                    self.misses += 1
+                    self._datasets[key] = (identity, dataset)
+                    return dataset
+            except FileNotFoundError:
+                # A pasta está sendo trocada por outro processo
+                if attempt == LOAD_RETRIES - 1:
+                    raise
+                time.sleep(0.05)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "datasets": len(self._datasets),
+                "mapped_bytes": sum(d.x.nbytes + d.y.nbytes for _, d in self._datasets.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+@st.cache_resource
+def get_dataset_registry():
+    """Registro compartilhado por todas as sessões, com os embutidos já gravados
+
+    Se DATASET_DIR não aceita escrita (deploy somente leitura), os embutidos vão para uma pasta temporária.
+    """
+    registry = DatasetRegistry()
+    try:
+        registry.migrate()
+        registry.ensure_builtin()
+    except OSError as error:
+        logger.warning("registro de conjuntos em %s sem escrita (%s); usando uma pasta temporária",
+                       registry.root, error)
+        registry = DatasetRegistry(tempfile.mkdtemp(prefix="datasets."))
+        registry.ensure_builtin()
+    return registry
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Registro de conjuntos de dados didáticos")
+    parser.add_argument("--root", default=DATASET_DIR, help="pasta do registro (padrão: %(default)s)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    add = commands.add_parser("add", help="adiciona um conjunto a partir de duas colunas de um CSV")
+    add.add_argument("collection", help="coleção (agrupa os conjuntos no aplicativo)")
+    add.add_argument("name", help="nome do conjunto")
+    add.add_argument("csv", help="arquivo CSV")
+    add.add_argument("--x", required=True, help="coluna do eixo X")
+    add.add_argument("--y", required=True, help="coluna do eixo Y")
+    add.add_argument("--description", default="", help="texto exibido com o conjunto")
+    commands.add_parser("list", help="lista os conjuntos e suas estatísticas")
+    args = parser.parse_args()
+
+    registry = DatasetRegistry(args.root)
+    registry.migrate()
+    registry.ensure_builtin()
+    if args.command == "add":
+        import pandas as pd
+
+        data = pd.read_csv(args.csv, usecols=[args.x, args.y]).dropna()
+        registry.write(args.collection, args.name, data[args.x].to_numpy(), data[args.y].to_numpy(),
+                       args.description)
+        print(f"{args.collection} / {args.name}: {len(data):,} pontos gravados em {registry.root}")
+        return
+    for collection, names in registry.collections().items():
+        print(collection)
+        for name in names:
+            stats = registry.load(collection, name).stats
+            print(f"  {name:<24}n = {stats['n']:>10,}  r = {stats['r']:+.3f}  "
+                  f"y = {stats['slope']:.2f}x + {stats['intercept']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
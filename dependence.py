@@ -0,0 +1,176 @@
+"""Medidas de dependência além da correlação de Pearson.
+
+- Correlação de distância (Székely): zero apenas quando há independência, então
+  detecta a forma de U. O algoritmo rápido usa ordenações e somas de dominância
+  calculadas nível a nível, como num merge sort, sem a matriz n x n.
+- Spearman (postos) e Kendall (tau-b, algoritmo de Knight por merge sort).
+- Informação mútua estimada por histograma 2D.
+
+As versões ingênuas O(n²) ficam aqui como referência para os benchmarks.
+"""
+import numpy as np
+from scipy import stats
+
+from sampling_engine import pearson_r
+
+# Acima disto as medidas usam os primeiros pontos da amostra (que já é aleatória)
+DEPENDENCE_MAX_POINTS = 200_000
+
+
+def _dominance_sums(y_order, weights):
+    """Para cada posição i, soma `weights[j]` dos j < i com y[j] < y[i]
+
+    `y_order` são as posições ordenadas por y (empates em ordem decrescente de
+    posição, para que a desigualdade seja estrita). Percorre os níveis de um
+    merge sort de cima para baixo: em cada nível, a ordem por (bloco, y) é
+    particionada de forma estável pelo bit do nível, e cada elemento da metade
+    direita de um bloco acumula as somas da metade esquerda que o precedem.
+    Cada nível custa O(n), com memória O(n).
+    """
+    n = len(y_order)
+    out = np.zeros_like(weights)
+    order = y_order
+    idx = np.arange(n)
+    level = int(np.ceil(np.log2(n))) - 1 if n > 1 else -1
+    while level >= 0:
+        half = 1 << level
+        start = (order >> (level + 1)) << (level + 1)
+        is_left = (order & half) == 0
+
+        cumulative = np.zeros((n + 1, weights.shape[1]))
+        np.cumsum(weights[order] * is_left[:, None], axis=0, out=cumulative[1:])
+        right = ~is_left
+        out[order[right]] += cumulative[idx[right]] - cumulative[start[right]]
+
+        # Partição estável: a metade esquerda de cada bloco vem antes da direita
+        left_before = np.cumsum(is_left) - is_left
+        rank_left = left_before - left_before[start]
+        n_left = np.minimum(half, n - start)
+        new_idx = np.where(is_left, start + rank_left, start + n_left + (idx - start) - rank_left)
+        new_order = np.empty_like(order)
+        new_order[new_idx] = order
+        order = new_order
+        level -= 1
+    return out
+
+
+def _row_distance_sums(values):
+    """a_i. = sum_j |v_i - v_j| para todo i, em O(n log n)"""
+    order = np.argsort(values, kind="stable")
+    v = values[order]
+    n = len(v)
+    prefix = np.concatenate([[0.0], np.cumsum(v)[:-1]])
+    sums = np.empty(n)
+    sums[order] = (2 * np.arange(n) - n) * v + v.sum() - 2 * prefix
+    return sums
+
+
+def _distance_covariance_sq(x, y):
+    """dCov²_n (estatística V) entre x e y, sem formar as matrizes de distância"""
+    n = len(x)
+    order = np.argsort(x, kind="stable")
+    xs, ys = x[order], y[order]
+    y_order = np.lexsort((-np.arange(n), ys))
+
+    # sum_{j<i} (x_i - x_j)(y_i - y_j), separando os j com y_j < y_i
+    ones = np.ones(n)
+    weights = np.column_stack([ones, xs, ys, xs * ys])
+    below = _dominance_sums(y_order, weights)
+    before = np.concatenate([np.zeros((1, 4)), np.cumsum(weights, axis=0)[:-1]])
+
+    def pair_products(s):
+        return xs * ys * s[:, 0] - xs * s[:, 2] - ys * s[:, 1] + s[:, 3]
+
+    # |x_i - x_j||y_i - y_j| = (x_i - x_j)(y_i - y_j) * (+1 se y_j < y_i, -1 caso contrário)
+    cross = 2 * (2 * pair_products(below) - pair_products(before)).sum()
+
+    a_rows = _row_distance_sums(x)
+    b_rows = _row_distance_sums(y)
+    return cross / n**2 - 2 * (a_rows @ b_rows) / n**3 + a_rows.sum() * b_rows.sum() / n**4
+
+
+def _distance_variance_sq(x):
+    n = len(x)
+    squares = 2 * n * (x @ x) - 2 * x.sum() ** 2
+    a_rows = _row_distance_sums(x)
+    return squares / n**2 - 2 * (a_rows @ a_rows) / n**3 + a_rows.sum() ** 2 / n**4
+
+
+def distance_correlation(x, y):
+    """Correlação de distância em O(n log n), sem matrizes n x n"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    # Centralizar não altera as distâncias e melhora a precisão das somas
+    x = x - x.mean()
+    y = y - y.mean()
+    dcov = _distance_covariance_sq(x, y)
+    denom = np.sqrt(_distance_variance_sq(x) * _distance_variance_sq(y))
+    if denom <= 0:
+        return 0.0
+    return float(np.sqrt(max(dcov, 0.0) / denom))
+
+
+def distance_correlation_naive(x, y):
+    """Correlação de distância pela definição, com matrizes n x n duplamente centradas"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    def centered(v):
+        d = np.abs(v[:, None] - v[None, :])
+        return d - d.mean(axis=0) - d.mean(axis=1)[:, None] + d.mean()
+
+    a, b = centered(x), centered(y)
+    dcov = (a * b).mean()
+    denom = np.sqrt((a * a).mean() * (b * b).mean())
+    return float(np.sqrt(max(dcov, 0.0) / denom)) if denom > 0 else 0.0
+
+
+def spearman(x, y):
+    """Correlação de Spearman: Pearson sobre os postos (empates recebem o posto médio)"""
+    return float(pearson_r(stats.rankdata(x), stats.rankdata(y)))
+
+
+def kendall(x, y):
+    """Tau-b de Kendall em O(n log n) (scipy usa o algoritmo de Knight, com merge sort)"""
+    return float(stats.kendalltau(x, y).statistic)
+
+
+def kendall_naive(x, y):
+    """Tau-b de Kendall comparando todos os pares, em O(n²)"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    sx = np.sign(x[:, None] - x[None, :])
+    sy = np.sign(y[:, None] - y[None, :])
+    concordance = (sx * sy).sum()
+    return float(concordance / np.sqrt((sx != 0).sum() * (sy != 0).sum()))
+
+
+def mutual_information(x, y, bins=None):
+    """Informação mútua (em bits) estimada por um histograma 2D com `bins` x `bins` células"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if bins is None:
+        bins = int(np.clip(np.sqrt(n / 5), 2, 64))
+    counts, _, _ = np.histogram2d(x, y, bins=bins)
+    joint = counts / n
+    px = joint.sum(axis=1, keepdims=True)
+    py = joint.sum(axis=0, keepdims=True)
+    nonzero = joint > 0
+    return float((joint[nonzero] * np.log2(joint[nonzero] / (px @ py)[nonzero])).sum())
+
+
+def dependence_measures(x, y, max_points=DEPENDENCE_MAX_POINTS):
+    """Todas as medidas da aba de padrões não-lineares, num dicionário
+
+    Pearson usa todos os pontos; as demais, no máximo `max_points`.
+    """
+    pearson = float(pearson_r(x, y))
+    x, y = x[:max_points], y[:max_points]
+    return {
+        "Pearson": pearson,
+        "Spearman": spearman(x, y),
+        "Kendall": kendall(x, y),
+        "Correlação de distância": distance_correlation(x, y),
+        "Informação mútua (bits)": mutual_information(x, y),
+    }
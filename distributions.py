@@ -0,0 +1,99 @@
+"""Amostras e densidades padronizadas das demonstrações de distribuições.
+
+Normal, qui-quadrado, t e uniforme são famílias de locação e escala: uma
+amostra com média a e desvio b é `a + b * z`, com z padronizada (média 0 e
+variância 1 teóricas). Por isso cada família/tamanho é sorteada e resumida
+(histograma, KDE, momentos) uma única vez, e mover os sliders de média e
+desvio só reescala esses resumos, em O(bins) em vez de sortear de novo e
+recalcular a KDE em O(n·grade). As KDEs vêm de `kde.fft_kde` e
+`plot_density` desenha o histograma com a curva sobreposta.
+"""
+from collections import namedtuple
+
+import numpy as np
+import streamlit as st
+
+from kde import fft_kde
+from moments import Moments
+from sampling_engine import DEFAULT_SEED, make_rng
+
+# Geradores padronizados (média 0 e variância 1 teóricas)
+FAMILIES = {
+    "normal": lambda rng, n: rng.standard_normal(n),
+    "chisquare2": lambda rng, n: (rng.chisquare(2, n) - 2) / 2,
+    "t3": lambda rng, n: rng.standard_t(3, n) / np.sqrt(3),
+    "uniform": lambda rng, n: (rng.random(n) - 0.5) * np.sqrt(12),
+}
+
+# Histograma (contagens por intervalo) e KDE (densidade) de uma amostra
+Density = namedtuple("Density", ["edges", "counts", "grid", "pdf"])
+
+
+def binned_density(values, bins="auto", kde=True, bw_method="scott"):
+    """Histograma e KDE gaussiana de uma amostra, na faixa do histograma
+
+    Com as regras "scott" e "silverman" a KDE acompanha a reescala dos dados.
+    """
+    counts, edges = np.histogram(values, bins=bins)
+    if not kde:
+        return Density(edges, counts, None, None)
+    grid, pdf = fft_kde(values, bw_method, lo=edges[0], hi=edges[-1])
+    return Density(edges, counts, grid, pdf)
+
+
+def rescale_density(density, loc, scale):
+    """Densidade de `loc + scale * dados` a partir da densidade dos dados"""
+    edges = loc + scale * density.edges
+    counts = density.counts
+    grid, pdf = density.grid, density.pdf
+    if grid is not None:
+        grid, pdf = loc + scale * grid, pdf / abs(scale)
+    if scale < 0:
+        edges, counts = edges[::-1], counts[::-1]
+        if grid is not None:
+            grid, pdf = grid[::-1], pdf[::-1]
+    return Density(edges, counts, grid, pdf)
+
+
+@st.cache_resource(max_entries=32)
+def standard_sample(family, n, seed=DEFAULT_SEED):
+    """Amostra padronizada da família (somente leitura, compartilhada entre sessões)"""
+    z = FAMILIES[family](make_rng(seed), n)
+    z.flags.writeable = False
+    return z
+
+
+@st.cache_resource(max_entries=32)
+def standard_density(family, n, bins="auto", kde=True, bw_method="scott", seed=DEFAULT_SEED):
+    return binned_density(standard_sample(family, n, seed), bins, kde, bw_method)
+
+
+@st.cache_resource(max_entries=32)
+def standard_moments(family, n, seed=DEFAULT_SEED):
+    return Moments.from_array(standard_sample(family, n, seed))
+
+
+@st.cache_resource(max_entries=32)
+def standard_describe(family, n, seed=DEFAULT_SEED):
+    import pandas as pd
+
+    return pd.Series(standard_sample(family, n, seed)).describe()
+
+
+def rescale_describe(described, loc, scale):
+    """`Series.describe()` de `loc + scale * dados` (scale > 0)"""
+    out = described.copy()
+    out.iloc[1:] = loc + scale * out.iloc[1:]
+    out["std"] = scale * described["std"]
+    return out
+
+
+def plot_density(ax, density, stat="density", label=None, hist_kws=None, kde_kws=None):
+    """Desenha o histograma e sobrepõe a KDE; `stat` é "count" ou "density", como no seaborn"""
+    widths = np.diff(density.edges)
+    n = density.counts.sum()
+    heights = density.counts if stat == "count" else density.counts / (n * widths)
+    ax.bar(density.edges[:-1], heights, width=widths, align="edge", label=label, **(hist_kws or {}))
+    if density.pdf is not None:
+        curve = density.pdf * n * widths.mean() if stat == "count" else density.pdf
+        ax.plot(density.grid, curve, **(kde_kws or {}))
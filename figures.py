@@ -0,0 +1,139 @@
+"""Construção dos gráficos das abas do Explorador de Correlação.
+
+O modo de renderização depende do tamanho da amostra: SVG para amostras
+pequenas, WebGL até WEBGL_MAX_POINTS e, acima disso, um mapa de densidade
+agregado no servidor, cujo tamanho não depende de n.
+
+Os arrays numéricos dos gráficos são float32: o Plotly serializa arrays NumPy
+como arrays tipados em base64 ("bdata"), e não como texto, então cada
+coordenada ocupa 4 bytes (mais 1/3 da base64) no JSON enviado ao navegador.
+"""
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from sampling_engine import group_labels
+
+SVG_MAX_POINTS = 5_000
+WEBGL_MAX_POINTS = 200_000
+DENSITY_BINS = 200
+# Tipo dos arrays enviados ao navegador (precisão de sobra para desenhar)
+PAYLOAD_DTYPE = np.float32
+
+
+def compact(values):
+    """Array no tipo de envio, serializado pelo Plotly como array tipado binário"""
+    return np.asarray(values, dtype=PAYLOAD_DTYPE)
+
+
+def render_mode(n_points):
+    """Escolhe "svg", "webgl" ou "density" conforme o número de pontos"""
+    if n_points <= SVG_MAX_POINTS:
+        return "svg"
+    if n_points <= WEBGL_MAX_POINTS:
+        return "webgl"
+    return "density"
+
+
+def binned_counts(x, y, bins=DENSITY_BINS):
+    """Contagens 2D em grade regular (bins x bins) com uma única passada de bincount"""
+    x_min, x_max = x.min(), x.max()
+    y_min, y_max = y.min(), y.max()
+    x_step = (x_max - x_min) / bins or 1.0
+    y_step = (y_max - y_min) / bins or 1.0
+    ix = np.minimum(((x - x_min) / x_step).astype(np.intp), bins - 1)
+    iy = np.minimum(((y - y_min) / y_step).astype(np.intp), bins - 1)
+    counts = np.bincount(iy * bins + ix, minlength=bins * bins).reshape(bins, bins)
+    x_centers = x_min + (np.arange(bins) + 0.5) * x_step
+    y_centers = y_min + (np.arange(bins) + 0.5) * y_step
+    return x_centers, y_centers, counts
+
+
+def density_figure(x, y, title, bins=DENSITY_BINS):
+    """Mapa de densidade dos pontos; as células vazias ficam transparentes"""
+    x_centers, y_centers, counts = binned_counts(x, y, bins)
+    z = np.where(counts > 0, np.log10(np.maximum(counts, 1)), np.nan)
+    fig = go.Figure(go.Heatmap(
+        x=compact(x_centers), y=compact(y_centers), z=compact(z), colorscale="Blues",
+        customdata=counts, hovertemplate="x=%{x:.2f}<br>y=%{y:.2f}<br>pontos=%{customdata}<extra></extra>",
+        colorbar=dict(title="log₁₀(pontos)"),
+    ))
+    fig.update_layout(title=title, xaxis_title='x', yaxis_title='y')
+    return fig
+
+
+def scatter_figure(sample, title):
+    """Monta o gráfico de dispersão a partir de uma amostra em arrays"""
+    mode = render_mode(len(sample.x))
+    if mode == "density":
+        return density_figure(sample.x, sample.y, title)
+    return px.scatter(pd.DataFrame({'x': compact(sample.x), 'y': compact(sample.y)}), x='x', y='y', title=title,
+                      render_mode="webgl" if mode == "webgl" else "svg")
+
+
+def linear_figure(sample):
+    """Gráfico da aba 1 (Correlação Linear)"""
+    return scatter_figure(sample, title=f"Correlação da Amostra: {sample.stats['r']:.2f}")
+
+
+def curved_figure(sample):
+    """Gráfico da aba 2 (Padrões Não-lineares), com eixos fixos"""
+    fig = scatter_figure(sample, title=f"Correlação: {sample.stats['r']:.2f}")
+    fig.update_layout(
+        yaxis=dict(range=[-3, 8]),
+        xaxis=dict(range=[-2.5, 2.5])
+    )
+    return fig
+
+
+def simpsons_figure(x, y, group, group_stats, pooled, x_min, x_max, max_lines=50):
+    """Gráfico do paradoxo de Simpson: pontos por grupo, retas de cada grupo e a reta geral
+
+    Com muitos grupos, a legenda é omitida e só `max_lines` retas de grupo são
+    desenhadas (todas num único traço, separadas por None).
+    """
+    n_groups = len(group_stats.n)
+    title = (f"Correlação geral: {pooled.r:.2f} | "
+             f"Correlação média dentro dos grupos: {np.nanmean(group_stats.r):.2f}")
+    mode = render_mode(len(x))
+    x, y = compact(x), compact(y)
+    if mode == "density":
+        fig = density_figure(x, y, title)
+    elif n_groups <= 10:
+        labels = np.asarray(group_labels(n_groups))
+        fig = px.scatter(pd.DataFrame({'x': x, 'y': y, 'Grupo': labels[group]}), x='x', y='y', color='Grupo',
+                         title=title, render_mode="webgl" if mode == "webgl" else "svg")
+    else:
+        fig = px.scatter(x=x, y=y, color=group, color_continuous_scale="Turbo", title=title,
+                         render_mode="webgl" if mode == "webgl" else "svg")
+        fig.update_layout(coloraxis_showscale=False, xaxis_title='x', yaxis_title='y')
+
+    shown = np.unique(np.linspace(0, n_groups - 1, min(n_groups, max_lines)).astype(int))
+    seg_x = np.column_stack([x_min[shown], x_max[shown], np.full(len(shown), np.nan)])
+    seg_y = group_stats.slope[shown, None] * seg_x[:, :2] + group_stats.intercept[shown, None]
+    seg_y = np.column_stack([seg_y, np.full(len(shown), np.nan)])
+    fig.add_trace(go.Scatter(x=compact(seg_x.ravel()), y=compact(seg_y.ravel()), mode="lines", name="Retas dos grupos",
+                             line=dict(color="black", width=2), connectgaps=False))
+    line_x = np.array([np.nanmin(x_min), np.nanmax(x_max)])
+    fig.add_trace(go.Scatter(x=compact(line_x), y=compact(pooled.slope * line_x + pooled.intercept), mode="lines",
+                             name="Reta geral", line=dict(color="red", width=3, dash="dash")))
+    return fig
+
+
+def r_histogram_figure(r_values, correlation, bins=100):
+    """Histograma (agregado no servidor) das correlações amostrais simuladas"""
+    counts, edges = np.histogram(r_values, bins=bins, range=(-1, 1))
+    fig = go.Figure(go.Bar(x=compact((edges[:-1] + edges[1:]) / 2), y=counts, width=edges[1] - edges[0],
+                           marker_color="steelblue"))
+    fig.add_vline(x=correlation, line_dash="dash", line_color="red",
+                  annotation_text=f"Correlação alvo: {correlation:.1f}")
+    fig.update_layout(title=f"Distribuição de r em {len(r_values):,} amostras".replace(",", "."),
+                      xaxis_title="r da amostra", yaxis_title="Frequência", bargap=0)
+    return fig
+
+
+FIGURE_BUILDERS = {
+    "linear": linear_figure,
+    "curved": curved_figure,
+}
@@ -0,0 +1,74 @@
+"""Estatísticas de correlação por grupo e do conjunto todo, sem laços por grupo.
+
+Todas as somas por grupo saem de reduções segmentadas (np.bincount com pesos),
+em duas passadas sobre os dados: uma para as médias e outra para as somas de
+desvios. Isso é numericamente estável e atende centenas de grupos e milhões
+de linhas sem groupby/apply.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+GroupStats = namedtuple("GroupStats", ["n", "mean_x", "mean_y", "std_x", "std_y", "r", "slope", "intercept"])
+
+
+def _finish(n, mean_x, mean_y, sxx, syy, sxy):
+    with np.errstate(invalid="ignore", divide="ignore"):
+        slope = sxy / sxx
+        r = sxy / np.sqrt(sxx * syy)
+        std_x = np.sqrt(sxx / (n - 1))
+        std_y = np.sqrt(syy / (n - 1))
+    return GroupStats(n, mean_x, mean_y, std_x, std_y, r, slope, mean_y - slope * mean_x)
+
+
+def grouped_correlation(x, y, group, n_groups=None):
+    """Correlação, inclinação e médias de cada grupo (arrays indexados pelo código do grupo)
+
+    `group` deve conter códigos inteiros em [0, n_groups).
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    group = np.asarray(group)
+    n_groups = int(group.max()) + 1 if n_groups is None else n_groups
+
+    n = np.bincount(group, minlength=n_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_x = np.bincount(group, weights=x, minlength=n_groups) / n
+        mean_y = np.bincount(group, weights=y, minlength=n_groups) / n
+    dx = x - mean_x[group]
+    dy = y - mean_y[group]
+    sxx = np.bincount(group, weights=dx * dx, minlength=n_groups)
+    syy = np.bincount(group, weights=dy * dy, minlength=n_groups)
+    sxy = np.bincount(group, weights=dx * dy, minlength=n_groups)
+    return _finish(n, mean_x, mean_y, sxx, syy, sxy)
+
+
+def pooled_correlation(x, y):
+    """As mesmas estatísticas de `grouped_correlation`, para todos os dados juntos"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    mean_x, mean_y = x.mean(), y.mean()
+    dx = x - mean_x
+    dy = y - mean_y
+    return _finish(len(x), mean_x, mean_y, dx @ dx, dy @ dy, dx @ dy)
+
+
+def group_ranges(x, group, n_groups=None):
+    """Mínimo e máximo de x em cada grupo
+
+    Para grupos em blocos contíguos (como os do gerador) usa `reduceat`;
+    caso contrário, ordena por grupo antes.
+    """
+    x = np.asarray(x, dtype=float)
+    group = np.asarray(group)
+    n_groups = int(group.max()) + 1 if n_groups is None else n_groups
+    if np.any(group[1:] < group[:-1]):
+        order = np.argsort(group, kind="stable")
+        x, group = x[order], group[order]
+    starts = np.concatenate([[0], np.flatnonzero(group[1:] != group[:-1]) + 1])
+    present = group[starts]
+    x_min = np.full(n_groups, np.nan)
+    x_max = np.full(n_groups, np.nan)
+    x_min[present] = np.minimum.reduceat(x, starts)
+    x_max[present] = np.maximum.reduceat(x, starts)
+    return x_min, x_max
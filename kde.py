@@ -0,0 +1,71 @@
+"""Estimativa de densidade por kernel (KDE) gaussiana com binning linear e FFT.
+
+Os dados são distribuídos linearmente numa grade regular de G pontos (O(n),
+com np.bincount) e a grade é convoluída com o kernel gaussiano amostrado,
+por FFT (O(G log G)). O resultado coincide com a soma direta dos kernels
+(scipy.stats.gaussian_kde) a menos do erro de discretização da grade, e
+continua interativo com milhões de pontos.
+"""
+import numpy as np
+
+# Pontos da grade de avaliação
+GRID_POINTS = 512
+# Larguras de banda (h) além das quais o kernel é considerado zero
+KERNEL_CUTOFF = 5
+# Regras de largura de banda disponíveis (rótulo -> nome aceito por `bandwidth`)
+BANDWIDTH_RULES = {"Scott": "scott", "Silverman": "silverman"}
+
+
+def bandwidth(values, method="scott"):
+    """Largura de banda do kernel
+
+    "scott": desvio padrão * n^(-1/5) (padrão do scipy e do seaborn);
+    "silverman": regra de bolso 0.9 * min(desvio, IQR/1.349) * n^(-1/5),
+    mais robusta a caudas pesadas; um número é usado diretamente como h.
+    """
+    if not isinstance(method, str):
+        return float(method)
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    std = values.std(ddof=1)
+    if method == "scott":
+        return std * n ** -0.2
+    if method == "silverman":
+        q25, q75 = np.percentile(values, [25, 75])
+        spread = min(std, (q75 - q25) / 1.349) or std
+        return 0.9 * spread * n ** -0.2
+    raise ValueError(f"regra de largura de banda desconhecida: {method}")
+
+
+def linear_binning(values, lo, hi, grid_points=GRID_POINTS):
+    """Pesos de cada ponto da grade, dividindo cada valor entre os dois pontos vizinhos"""
+    delta = (hi - lo) / (grid_points - 1)
+    pos = (np.asarray(values, dtype=float) - lo) / delta
+    left = np.clip(np.floor(pos).astype(np.intp), 0, grid_points - 2)
+    frac = np.clip(pos - left, 0.0, 1.0)
+    return (np.bincount(left, weights=1 - frac, minlength=grid_points)
+            + np.bincount(left + 1, weights=frac, minlength=grid_points))
+
+
+def fft_kde(values, bw_method="scott", grid_points=GRID_POINTS, lo=None, hi=None, cut=3):
+    """KDE gaussiana avaliada numa grade regular; devolve (grade, densidade)
+
+    Sem `lo`/`hi`, a grade vai de `cut` larguras de banda antes do mínimo até
+    `cut` depois do máximo. Valores fora da grade contam no ponto mais próximo.
+    """
+    values = np.asarray(values, dtype=float).ravel()
+    h = bandwidth(values, bw_method) if len(values) > 1 else 0.0
+    lo = values.min() - cut * h if lo is None else lo
+    hi = values.max() + cut * h if hi is None else hi
+    grid = np.linspace(lo, hi, grid_points)
+    if not h > 0 or not hi > lo:
+        return grid, np.zeros(grid_points)
+
+    counts = linear_binning(values, lo, hi, grid_points)
+    delta = grid[1] - grid[0]
+    half = min(grid_points - 1, int(np.ceil(KERNEL_CUTOFF * h / delta)))
+    offsets = np.arange(-half, half + 1) * delta
+    kernel = np.exp(-0.5 * (offsets / h) ** 2) / (h * np.sqrt(2 * np.pi))
+    size = 1 << int(np.ceil(np.log2(grid_points + 2 * half + 1)))
+    conv = np.fft.irfft(np.fft.rfft(counts, size) * np.fft.rfft(kernel, size), size)
+    return grid, np.maximum(conv[half:half + grid_points], 0.0) / len(values)
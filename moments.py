@@ -0,0 +1,181 @@
+"""Momentos e quantis em uma única passada, combináveis entre blocos.
+
+`Moments` acumula n, média, M2, M3, M4, mínimo e máximo (fórmulas de
+Welford/Pébay) e alimenta um `QuantileSketch` para mediana e quartis. Cada
+bloco é reduzido com operações vetorizadas e combinado ao acumulado, então o
+mesmo objeto serve para arrays inteiros, arrays grandes lidos em blocos ou
+dados que chegam aos poucos; dois acumuladores de partes diferentes dos dados
+se combinam com `merge`.
+"""
+import numpy as np
+
+# Tamanho dos blocos em que `Moments.from_array` percorre os dados
+CHUNK_SIZE = 1_000_000
+# Valores guardados por nível do esboço; até esse total os quantis são exatos
+SKETCH_K = 8192
+
+
+class QuantileSketch:
+    """Esboço de quantis combinável (compactadores ao estilo KLL)
+
+    O nível i guarda valores de peso 2**i. Quando um nível passa de `k`
+    valores, ele é ordenado e metade dos valores (alternadamente) sobe para
+    o nível seguinte. Com até `k` valores o esboço é exato.
+    """
+
+    def __init__(self, k=SKETCH_K):
+        self.k = k
+        self.levels = [np.empty(0)]
+        self._offset = 0
+
+    @property
+    def exact(self):
+        return len(self.levels) == 1
+
+    def update(self, values):
+        self.levels[0] = np.concatenate([self.levels[0], np.asarray(values, dtype=float).ravel()])
+        self._compress()
+
+    def merge(self, other):
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self._compress()
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self.k:
+                items = np.sort(items)
+                keep = items[-1:] if len(items) % 2 else items[:0]
+                pairs = items[:len(items) - len(keep)]
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], pairs[self._offset::2]])
+                self.levels[level] = keep
+                self._offset ^= 1
+            level += 1
+
+    def quantile(self, q):
+        """Quantil(is) q em [0, 1]; interpolação linear como np.quantile quando exato"""
+        if self.exact:
+            return np.quantile(self.levels[0], q)
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(v), 2.0**i) for i, v in enumerate(self.levels)])
+        order = np.argsort(items)
+        items = items[order]
+        cumulative = np.cumsum(weights[order])
+        idx = np.searchsorted(cumulative, np.asarray(q) * cumulative[-1], side="left")
+        return items[np.minimum(idx, len(items) - 1)]
+
+
+class Moments:
+    """Acumulador de momentos de uma passada, combinável entre blocos"""
+
+    def __init__(self, sketch_k=SKETCH_K):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.sketch = QuantileSketch(sketch_k)
+
+    @classmethod
+    def from_array(cls, values, chunk_size=CHUNK_SIZE, sketch_k=SKETCH_K):
+        """Acumula `values` (qualquer sequência de números, inclusive memmap) bloco a bloco"""
+        acc = cls(sketch_k)
+        values = np.asarray(values).ravel()
+        for start in range(0, len(values), chunk_size):
+            acc.update(values[start:start + chunk_size])
+        return acc
+
+    def update(self, values):
+        """Acrescenta um bloco de valores"""
+        chunk = np.asarray(values, dtype=float).ravel()
+        if not len(chunk):
+            return self
+        part = Moments(self.sketch.k)
+        part.n = len(chunk)
+        part.mean = chunk.mean()
+        dev = chunk - part.mean
+        dev2 = dev * dev
+        part.m2 = dev2.sum()
+        part.m3 = (dev2 * dev).sum()
+        part.m4 = (dev2 * dev2).sum()
+        part.min = chunk.min()
+        part.max = chunk.max()
+        self._combine(part)
+        self.sketch.update(chunk)
+        return self
+
+    def merge(self, other):
+        """Combina com o acumulador de outra parte dos dados"""
+        self._combine(other)
+        self.sketch.merge(other.sketch)
+        return self
+
+    def _combine(self, other):
+        na, nb = self.n, other.n
+        if nb == 0:
+            return
+        if na == 0:
+            self.n, self.mean, self.m2, self.m3, self.m4 = nb, other.mean, other.m2, other.m3, other.m4
+            self.min, self.max = other.min, other.max
+            return
+        n = na + nb
+        d = other.mean - self.mean
+        d_n = d / n
+        m2 = self.m2 + other.m2 + d * d_n * na * nb
+        m3 = (self.m3 + other.m3 + d * d_n * d_n * na * nb * (na - nb)
+              + 3 * d_n * (na * other.m2 - nb * self.m2))
+        m4 = (self.m4 + other.m4 + d * d_n**3 * na * nb * (na * na - na * nb + nb * nb)
+              + 6 * d_n * d_n * (na * na * other.m2 + nb * nb * self.m2)
+              + 4 * d_n * (na * other.m3 - nb * self.m3))
+        self.n, self.mean, self.m2, self.m3, self.m4 = n, self.mean + d_n * nb, m2, m3, m4
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def rescaled(self, loc, scale):
+        """Momentos de `loc + scale * dados`, sem voltar aos dados"""
+        out = Moments(self.sketch.k)
+        out.n = self.n
+        out.mean = loc + scale * self.mean
+        out.m2 = scale**2 * self.m2
+        out.m3 = scale**3 * self.m3
+        out.m4 = scale**4 * self.m4
+        out.min, out.max = sorted((loc + scale * self.min, loc + scale * self.max))
+        out.sketch.levels = [loc + scale * items for items in self.sketch.levels]
+        return out
+
+    def variance(self, ddof=1):
+        return self.m2 / (self.n - ddof) if self.n > ddof else np.nan
+
+    def std(self, ddof=1):
+        return np.sqrt(self.variance(ddof))
+
+    def skewness(self):
+        """Assimetria (mesma definição de scipy.stats.skew)"""
+        if self.n == 0 or self.m2 == 0:
+            return np.nan
+        return np.sqrt(self.n) * self.m3 / self.m2**1.5
+
+    def kurtosis(self, fisher=True):
+        """Curtose (mesma definição de scipy.stats.kurtosis); `fisher` subtrai 3"""
+        if self.n == 0 or self.m2 == 0:
+            return np.nan
+        kurt = self.n * self.m4 / (self.m2 * self.m2)
+        return kurt - 3 if fisher else kurt
+
+    def quantile(self, q):
+        return self.sketch.quantile(q)
+
+    def median(self):
+        return self.quantile(0.5)
+
+    def iqr(self):
+        q1, q3 = self.quantile([0.25, 0.75])
+        return q3 - q1
@@ -0,0 +1,55 @@
+"""Simulação de Monte Carlo da distribuição amostral de r.
+
+As réplicas são geradas em blocos de formato (K, n) e as correlações de cada
+bloco saem de uma única chamada ao kernel linha a linha `pearson_r`. O tamanho
+dos blocos limita a memória, e os blocos podem ser distribuídos entre
+processos. Cada bloco tem sua própria semente derivada (SeedSequence.spawn),
+então o resultado é o mesmo com ou sem processos.
+"""
+import os
+
+import numpy as np
+
+from sampling_engine import generate_correlated_data, pearson_r
+
+# Memória aproximada por bloco (x, y e os dois arrays centrados)
+CHUNK_BYTES = 64 * 1024**2
+# Abaixo deste total de sorteios não compensa abrir processos
+PARALLEL_MIN_DRAWS = 5_000_000
+MAX_WORKERS = int(os.environ.get("CORRELATION_WORKERS", os.cpu_count() or 1))
+
+
+def chunk_rows(n_points, chunk_bytes=CHUNK_BYTES):
+    """Número de réplicas por bloco para caber em `chunk_bytes`"""
+    return max(1, chunk_bytes // (4 * 8 * n_points))
+
+
+def _replicate_chunk(correlation, n_points, n_rows, seed_seq):
+    x, y = generate_correlated_data(correlation, n_points, n_samples=n_rows, seed=np.random.default_rng(seed_seq))
+    return pearson_r(x, y)
+
+
+def sampling_distribution_r(correlation, n_points=150, n_replicates=10_000, seed=None,
+                            chunk_bytes=CHUNK_BYTES, executor=None):
+    """Correlações amostrais de `n_replicates` amostras de tamanho `n_points`
+
+    Com `executor` (ex.: ProcessPoolExecutor), os blocos são calculados em
+    paralelo quando o total de sorteios passa de PARALLEL_MIN_DRAWS.
+    """
+    rows = chunk_rows(n_points, chunk_bytes)
+    sizes = [rows] * (n_replicates // rows)
+    if n_replicates % rows:
+        sizes.append(n_replicates % rows)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    out = np.empty(n_replicates)
+    starts = np.concatenate([[0], np.cumsum(sizes)])
+    if executor is not None and len(sizes) > 1 and n_replicates * n_points >= PARALLEL_MIN_DRAWS:
+        futures = [executor.submit(_replicate_chunk, correlation, n_points, size, seq)
+                   for size, seq in zip(sizes, seeds)]
+        for start, stop, future in zip(starts, starts[1:], futures):
+            out[start:stop] = future.result()
+    else:
+        for start, stop, size, seq in zip(starts, starts[1:], sizes, seeds):
+            out[start:stop] = _replicate_chunk(correlation, n_points, size, seq)
+    return out
@@ -0,0 +1,148 @@
+"""Entrada de dados numéricos das páginas do Introduction_2.py.
+
+`parse_numbers` converte o texto digitado (valores separados por vírgula)
+direto num array NumPy, com o leitor em C do pandas, e aponta cada token
+inválido em vez de quebrar a página. `read_column` lê uma coluna de um
+arquivo CSV ou Parquet em blocos e acumula os momentos (`moments.Moments`)
+durante a leitura. `numeric_data` junta os dois caminhos num único widget.
+"""
+import csv
+import io
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from moments import Moments
+
+# Linhas lidas por bloco dos arquivos enviados
+READ_CHUNK_ROWS = 1_000_000
+# Quantos tokens inválidos listar na mensagem de aviso
+MAX_REPORTED_ERRORS = 5
+# Quantos valores mostrar em "Dados"
+PREVIEW_MAX = 1_000
+
+SOURCES = ["Digitar valores", "Enviar arquivo (CSV/Parquet)"]
+
+ParsedNumbers = namedtuple("ParsedNumbers", ["values", "errors"])
+LoadedColumn = namedtuple("LoadedColumn", ["values", "moments", "skipped"])
+NumericData = namedtuple("NumericData", ["values", "moments"])
+
+
+def parse_numbers(text):
+    """Valores de um texto separado por vírgulas e a lista de (posição, token) inválidos
+
+    Tokens vazios são ignorados; as posições começam em 1.
+    """
+    if not text.strip():
+        return ParsedNumbers(np.empty(0), [])
+    try:
+        values = pd.read_csv(io.StringIO(text), lineterminator=",", header=None, dtype=float,
+                             quoting=csv.QUOTE_NONE).iloc[:, 0].to_numpy()
+        if np.isfinite(values).all():
+            return ParsedNumbers(values, [])
+    except (ValueError, pd.errors.ParserError):
+        pass
+
+    # Caminho lento, só quando há tokens inválidos: localiza cada um deles ("nan" e "inf" também)
+    tokens = pd.Series(text.split(",")).str.strip()
+    values = pd.to_numeric(tokens, errors="coerce").to_numpy(dtype=float)
+    finite = np.isfinite(values)
+    bad = ~finite & (tokens != "").to_numpy()
+    errors = [(int(pos) + 1, tokens.iat[pos]) for pos in np.flatnonzero(bad)]
+    return ParsedNumbers(values[finite], errors)
+
+
+def file_format(name):
+    return "parquet" if name.lower().endswith((".parquet", ".pq")) else "csv"
+
+
+def column_names(file, fmt):
+    """Colunas de um arquivo CSV ou Parquet, sem ler os dados"""
+    file.seek(0)
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(file).schema_arrow.names
+    return list(pd.read_csv(file, nrows=0).columns)
+
+
+def iter_column(file, column, fmt, chunk_rows=READ_CHUNK_ROWS):
+    """Blocos float64 de uma coluna; valores não numéricos viram NaN"""
+    file.seek(0)
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(file).iter_batches(batch_size=chunk_rows, columns=[column]):
+            yield pd.to_numeric(batch.column(0).to_pandas(), errors="coerce").to_numpy(dtype=float)
+    else:
+        for chunk in pd.read_csv(file, usecols=[column], chunksize=chunk_rows):
+            yield pd.to_numeric(chunk[column], errors="coerce").to_numpy(dtype=float)
+
+
+def read_column(file, column, fmt, chunk_rows=READ_CHUNK_ROWS):
+    """Lê uma coluna em blocos, acumulando os momentos; conta as linhas não numéricas ou infinitas"""
+    moments = Moments()
+    parts = []
+    skipped = 0
+    for block in iter_column(file, column, fmt, chunk_rows):
+        valid = block[np.isfinite(block)]
+        skipped += len(block) - len(valid)
+        moments.update(valid)
+        parts.append(valid)
+    values = np.concatenate(parts) if parts else np.empty(0)
+    return LoadedColumn(values, moments, skipped)
+
+
+@st.cache_resource(max_entries=4, show_spinner="Lendo o arquivo...")
+def load_uploaded_column(file_id, column, _file):
+    """Coluna de um arquivo enviado, lida uma única vez por arquivo e coluna"""
+    return read_column(_file, column, file_format(_file.name))
+
+
+def numbers_text_input(label, default, key):
+    """Campo de texto com valores separados por vírgula; avisa sobre tokens inválidos"""
+    parsed = parse_numbers(st.text_input(label, default, key=key))
+    if parsed.errors:
+        listed = ", ".join(f"#{pos} '{token}'" for pos, token in parsed.errors[:MAX_REPORTED_ERRORS])
+        if len(parsed.errors) > MAX_REPORTED_ERRORS:
+            listed += f" e mais {len(parsed.errors) - MAX_REPORTED_ERRORS}"
+        st.warning(f"{len(parsed.errors)} valor(es) ignorado(s) por não serem números finitos: {listed}")
+    return parsed.values
+
+
+def numeric_data(label, default, key):
+    """Valores digitados ou lidos de um arquivo, com seus momentos; None se não houver valores"""
+    source = st.radio("Fonte dos dados", SOURCES, horizontal=True, key=f"{key}_source")
+    if source == SOURCES[0]:
+        values = numbers_text_input(label, default, key)
+        moments = Moments.from_array(values)
+    else:
+        upload = st.file_uploader("Arquivo CSV ou Parquet", type=["csv", "parquet", "pq"], key=f"{key}_file")
+        if upload is None:
+            st.info("Envie um arquivo para analisar uma de suas colunas.")
+            return None
+        try:
+            column = st.selectbox("Coluna", column_names(upload, file_format(upload.name)), key=f"{key}_column")
+            loaded = load_uploaded_column(upload.file_id, column, upload)
+        except ImportError:
+            st.error("Para ler arquivos Parquet instale o pacote pyarrow.")
+            return None
+        except (ValueError, pd.errors.ParserError) as exc:
+            st.error(f"Não foi possível ler o arquivo: {exc}")
+            return None
+        if loaded.skipped:
+            st.warning(f"{loaded.skipped:,} linha(s) sem valor numérico finito na coluna '{column}' foram ignoradas.")
+        values, moments = loaded.values, loaded.moments
+
+    if not len(values):
+        st.warning("Nenhum valor numérico para analisar.")
+        return None
+    return NumericData(values, moments)
+
+
+def show_values(values):
+    """Mostra os dados (só o início, quando são muitos)"""
+    if len(values) <= PREVIEW_MAX:
+        st.write("**Dados**:", values.tolist())
+    else:
+        st.write(f"**Dados** ({len(values):,} valores; primeiros {PREVIEW_MAX:,}):", values[:PREVIEW_MAX].tolist())
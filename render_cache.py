@@ -0,0 +1,143 @@
+"""Camada de renderização dos gráficos matplotlib/seaborn do Introduction_2.py.
+
+Cada gráfico é descrito por uma função `draw(*args)` que cria e devolve uma
+Figure. `show_plot` rasteriza a figura uma única vez para cada combinação de
+entradas, guarda os bytes PNG/SVG num cache LRU limitado em memória e sempre
+fecha a figura, para que o servidor não acumule figuras abertas.
+"""
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from io import BytesIO
+
+import numpy as np
+import streamlit as st
+
+# Teto de memória padrão (MB), configurável pela variável de ambiente
+DEFAULT_MAX_MB = float(os.environ.get("RENDER_CACHE_MB", 64))
+
+# Mesmos parâmetros que o st.pyplot usa para salvar a figura
+SAVEFIG_KWARGS = {"bbox_inches": "tight", "dpi": 200}
+
+
+def fingerprint(value):
+    """Resumo estável das entradas de um gráfico (arrays entram pelo conteúdo)"""
+    digest = hashlib.blake2b(digest_size=16)
+
+    def feed(v):
+        if isinstance(v, np.ndarray) and v.dtype != object:
+            digest.update(f"nd{v.dtype}{v.shape}".encode())
+            digest.update(np.ascontiguousarray(v).tobytes())
+        elif isinstance(v, np.ndarray):
+            feed(v.tolist())
+        elif isinstance(v, (list, tuple)):
+            digest.update(f"{type(v).__name__}{len(v)}(".encode())
+            for item in v:
+                feed(item)
+            digest.update(b")")
+        elif isinstance(v, dict):
+            digest.update(f"dict{len(v)}(".encode())
+            for key in sorted(v, key=repr):
+                feed(key)
+                feed(v[key])
+            digest.update(b")")
+        elif hasattr(v, "columns"):
+            feed(list(v.columns))
+            for column in v.columns:
+                feed(v[column].to_numpy())
+        elif hasattr(v, "to_numpy"):
+            feed(v.to_numpy())
+        else:
+            digest.update(repr(v).encode())
+
+    feed(value)
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """Cache LRU de gráficos já renderizados, com teto de memória e contadores"""
+
+    def __init__(self, max_mb=DEFAULT_MAX_MB):
+        self.max_bytes = int(max_mb * 1024**2)
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.renders = 0
+        self.render_seconds = 0.0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def render(self, draw, *args, fmt="png", **kwargs):
+        """Bytes do gráfico `draw(*args, **kwargs)`, renderizado só se ainda não estiver no cache"""
+        key = (draw.__module__, draw.__qualname__, fmt, fingerprint((args, kwargs)))
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+            self.misses += 1
+
+        import matplotlib.pyplot as plt
+
+        start = time.perf_counter()
+        fig = draw(*args, **kwargs)
+        try:
+            buffer = BytesIO()
+            fig.savefig(buffer, format=fmt, **SAVEFIG_KWARGS)
+        finally:
+            plt.close(fig)
+        data = buffer.getvalue()
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self.renders += 1
+            self.render_seconds += elapsed
+            if key not in self._entries:
+                self._entries[key] = data
+                self.nbytes += len(data)
+            while self.nbytes > self.max_bytes and len(self._entries) > 1:
+                _, old = self._entries.popitem(last=False)
+                self.nbytes -= len(old)
+                self.evictions += 1
+        return data
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self):
+        """Resumo dos contadores do cache"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "nbytes": self.nbytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0,
+                "renders": self.renders,
+                "render_seconds": self.render_seconds,
+                "mean_render_ms": 1000 * self.render_seconds / self.renders if self.renders else 0.0,
+            }
+
+
+@st.cache_resource
+def get_render_cache():
+    """Cache de gráficos compartilhado por todas as sessões"""
+    return RenderCache()
+
+
+def show_plot(draw, *args, fmt="png", **kwargs):
+    """Mostra o gráfico `draw(*args, **kwargs)` usando o cache de renderização"""
+    data = get_render_cache().render(draw, *args, fmt=fmt, **kwargs)
+    if fmt == "svg":
+        st.image(data.decode(), width="stretch")
+    else:
+        st.image(data, width="stretch")
@@ -0,0 +1,278 @@
+"""Perfil das reexecuções por seção (abas e páginas), opcional.
+
+Com RERUN_PROFILE=time, cada seção nomeada (uma aba do Explorador de
+Correlação, uma página do Introduction_2.py) registra o tempo de parede e os
+acertos e falhas dos caches registrados com `register_cache`; com
+RERUN_PROFILE=full, também as alocações (bytes líquidos e pico, pelo
+tracemalloc, que deixa o processo mais lento). As medidas da última
+reexecução aparecem num painel da barra lateral visível só com ?admin=1 na
+URL, e os agregados do processo são gravados em RERUN_PROFILE_FILE no
+formato de texto do Prometheus (para o textfile collector do node_exporter).
+
+Os caches e o tracemalloc são do processo: com várias sessões ao mesmo tempo,
+os números de uma seção incluem o que as outras fizeram no mesmo intervalo.
+"""
+import functools
+import logging
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, suppress
+
+import streamlit as st
+
+from session_memory import format_bytes
+
+logger = logging.getLogger(__name__)
+
+# "off" (padrão), "time" (tempo e caches) ou "full" (também alocações)
+PROFILE_MODE = os.environ.get("RERUN_PROFILE", "off")
+PROFILE_FILE = os.environ.get("RERUN_PROFILE_FILE", "rerun_metrics.prom")
+# Intervalo mínimo entre duas gravações do arquivo de métricas
+WRITE_INTERVAL_S = 10.0
+# Limites (s) dos baldes do histograma de tempo
+BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels):
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+class SectionStats:
+    """Agregados de uma seção: histograma de tempo, alocações e caches"""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.buckets = [0] * len(BUCKETS)
+        self.allocated_bytes = 0
+        self.max_peak_bytes = 0
+        self.cache_hits = {}
+        self.cache_misses = {}
+
+    def add(self, record):
+        self.count += 1
+        self.seconds += record["seconds"]
+        self.max_seconds = max(self.max_seconds, record["seconds"])
+        for i, bound in enumerate(BUCKETS):
+            if record["seconds"] <= bound:
+                self.buckets[i] += 1
+        if record["peak_bytes"] is not None:
+            self.allocated_bytes += max(record["allocated_bytes"], 0)
+            self.max_peak_bytes = max(self.max_peak_bytes, record["peak_bytes"])
+        for cache, (hits, misses) in record["caches"].items():
+            self.cache_hits[cache] = self.cache_hits.get(cache, 0) + hits
+            self.cache_misses[cache] = self.cache_misses.get(cache, 0) + misses
+
+
+class RerunProfiler:
+    """Agregados de todas as seções do processo e gravação no formato do Prometheus"""
+
+    def __init__(self, path=PROFILE_FILE, trace_allocations=False):
+        self.path = path
+        self.trace_allocations = trace_allocations
+        self._caches = {}
+        self._sections = {}
+        self._lock = threading.Lock()
+        self._last_write = 0.0
+        # Seções abertas em cada thread (uma página contém as seções dos seus fragmentos)
+        self._open = threading.local()
+        if trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def register_cache(self, name, stats):
+        """`stats()` devolve um dicionário com os contadores "hits" e "misses" do cache"""
+        with self._lock:
+            self._caches[name] = stats
+
+    def cache_counters(self):
+        with self._lock:
+            caches = dict(self._caches)
+        return {name: (s["hits"], s["misses"]) for name, s in ((name, stats()) for name, stats in caches.items())}
+
+    @contextmanager
+    def section(self, app, name):
+        """Mede o bloco e devolve (no `as`) o registro, preenchido ao sair"""
+        record = {"app": app, "section": name, "seconds": 0.0, "allocated_bytes": 0, "peak_bytes": None,
+                  "caches": {}}
+        caches_before = self.cache_counters()
+        tracing = self.trace_allocations and tracemalloc.is_tracing()
+        stack = self._open.__dict__.setdefault("stack", [])
+        # Pico absoluto visto pela seção antes de cada reset_peak das seções internas
+        peak_seen = [0]
+        if tracing:
+            memory_before, peak = tracemalloc.get_traced_memory()
+            # O reset apagaria o pico das seções externas: guarda-o nelas antes
+            for outer in stack:
+                outer[0] = max(outer[0], peak)
+            tracemalloc.reset_peak()
+        stack.append(peak_seen)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] = time.perf_counter() - start
+            stack.pop()
+            if tracing:
+                current, peak = tracemalloc.get_traced_memory()
+                record["allocated_bytes"] = current - memory_before
+                record["peak_bytes"] = max(max(peak, peak_seen[0]) - memory_before, 0)
+            caches_after = self.cache_counters()
+            record["caches"] = {name: (after[0] - caches_before.get(name, (0, 0))[0],
+                                       after[1] - caches_before.get(name, (0, 0))[1])
+                                for name, after in caches_after.items()}
+            self.add(record)
+
+    def add(self, record):
+        with self._lock:
+            stats = self._sections.setdefault((record["app"], record["section"]), SectionStats())
+            stats.add(record)
+            # Só uma sessão por intervalo grava o arquivo
+            due = time.time() - self._last_write >= WRITE_INTERVAL_S
+            if due:
+                self._last_write = time.time()
+        if due:
+            self.write()
+
+    def summary(self):
+        """Agregados por (app, seção), para o painel"""
+        with self._lock:
+            return {key: (stats.count, stats.seconds / stats.count, stats.max_seconds)
+                    for key, stats in self._sections.items()}
+
+    def prometheus_text(self):
+        """Métricas no formato de texto de exposição do Prometheus"""
+        lines = [
+            "# HELP app_section_seconds Tempo de parede de cada execução da seção.",
+            "# TYPE app_section_seconds histogram",
+        ]
+        with self._lock:
+            sections = dict(self._sections)
+            for (app, section), stats in sections.items():
+                for bound, count in zip(BUCKETS, stats.buckets):
+                    lines.append(f"app_section_seconds_bucket{_labels(app=app, section=section, le=bound)} {count}")
+                lines.append(f"app_section_seconds_bucket{_labels(app=app, section=section, le='+Inf')} "
+                             f"{stats.count}")
+                lines.append(f"app_section_seconds_sum{_labels(app=app, section=section)} {stats.seconds:.6f}")
+                lines.append(f"app_section_seconds_count{_labels(app=app, section=section)} {stats.count}")
+            lines += ["# HELP app_section_max_seconds Maior tempo de uma execução da seção.",
+                      "# TYPE app_section_max_seconds gauge"]
+            lines += [f"app_section_max_seconds{_labels(app=app, section=section)} {stats.max_seconds:.6f}"
+                      for (app, section), stats in sections.items()]
+            if self.trace_allocations:
+                lines += ["# HELP app_section_allocated_bytes_total Bytes alocados (líquidos) pela seção.",
+                          "# TYPE app_section_allocated_bytes_total counter"]
+                lines += [f"app_section_allocated_bytes_total{_labels(app=app, section=section)} "
+                          f"{stats.allocated_bytes}" for (app, section), stats in sections.items()]
+                lines += ["# HELP app_section_peak_bytes Maior pico de alocação de uma execução da seção.",
+                          "# TYPE app_section_peak_bytes gauge"]
+                lines += [f"app_section_peak_bytes{_labels(app=app, section=section)} {stats.max_peak_bytes}"
+                          for (app, section), stats in sections.items()]
+            for kind, attribute in (("hits", "cache_hits"), ("misses", "cache_misses")):
+                lines += [f"# HELP app_section_cache_{kind}_total Acertos/falhas de cache durante a seção.",
+                          f"# TYPE app_section_cache_{kind}_total counter"]
+                lines += [f"app_section_cache_{kind}_total{_labels(app=app, section=section, cache=cache)} {value}"
+                          for (app, section), stats in sections.items()
+                          for cache, value in getattr(stats, attribute).items()]
+        return "\n".join(lines) + "\n"
+
+    def write(self):
+        """Grava o arquivo de métricas de uma vez (o coletor nunca lê um arquivo pela metade)
+
+        Uma falha de gravação só é registrada no log: o perfil nunca quebra uma reexecução.
+        """
+        temporary = None
+        try:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=directory, prefix=".rerun_metrics.",
+                                             suffix=".tmp", delete=False) as out:
+                temporary = out.name
+                out.write(self.prometheus_text())
+            os.replace(temporary, self.path)
+        except Exception as exc:
+            logger.warning("Não foi possível gravar as métricas em %s: %s", self.path, exc)
+            if temporary is not None:
+                with suppress(OSError):
+                    os.remove(temporary)
+
+
+@st.cache_resource
+def get_profiler():
+    """Perfilador do processo, ou None se RERUN_PROFILE=off"""
+    if PROFILE_MODE not in ("time", "full"):
+        return None
+    return RerunProfiler(trace_allocations=PROFILE_MODE == "full")
+
+
+def _app_name():
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    path = getattr(ctx, "main_script_path", "") if ctx is not None else ""
+    return os.path.splitext(os.path.basename(path))[0] or "app"
+
+
+def register_cache(name, stats):
+    """Inclui os contadores de um cache nas medidas das seções"""
+    profiler = get_profiler()
+    if profiler is not None:
+        profiler.register_cache(name, stats)
+
+
+@contextmanager
+def profile_section(name):
+    """Mede uma seção do script; sem perfilador, não faz nada"""
+    profiler = get_profiler()
+    if profiler is None:
+        yield None
+        return
+    with profiler.section(_app_name(), name) as record:
+        yield record
+    st.session_state.setdefault("profile_records", {})[name] = record
+
+
+def profiled(name):
+    """Decorador de profile_section para funções de seção (inclusive fragmentos)"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with profile_section(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def show_profile_panel():
+    """Painel de administração na barra lateral (só com ?admin=1 e o perfil ligado)"""
+    profiler = get_profiler()
+    if profiler is None or st.query_params.get("admin") != "1":
+        return
+    with st.sidebar.expander("⏱️ Perfil das seções (admin)"):
+        records = st.session_state.get("profile_records", {})
+        st.write("**Última execução de cada seção nesta sessão**")
+        st.dataframe({
+            "Seção": list(records),
+            "Tempo (ms)": [round(r["seconds"] * 1000, 1) for r in records.values()],
+            "Alocado": [format_bytes(r["allocated_bytes"]) if r["peak_bytes"] is not None else "-"
+                        for r in records.values()],
+            "Pico": [format_bytes(r["peak_bytes"]) if r["peak_bytes"] is not None else "-"
+                     for r in records.values()],
+            "Caches (acertos/falhas)": [", ".join(f"{c}: {h}/{m}" for c, (h, m) in r["caches"].items()) or "-"
+                                        for r in records.values()],
+        }, hide_index=True)
+        st.write("**Todas as sessões do processo**")
+        summary = profiler.summary()
+        st.dataframe({
+            "Seção": [f"{app} / {section}" for app, section in summary],
+            "Execuções": [count for count, _, _ in summary.values()],
+            "Média (ms)": [round(mean * 1000, 1) for _, mean, _ in summary.values()],
+            "Máximo (ms)": [round(worst * 1000, 1) for _, _, worst in summary.values()],
+        }, hide_index=True)
+        st.caption(f"Métricas gravadas em {os.path.abspath(profiler.path)} (a cada {WRITE_INTERVAL_S:.0f} s)")
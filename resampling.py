@@ -0,0 +1,111 @@
+"""Bootstrap e testes de permutação para a correlação de Pearson.
+
+As reamostras são geradas em blocos de formato (K, n), com tamanho limitado
+pela memória, e as K correlações de cada bloco saem de uma única chamada a
+`pearson_r`. Os blocos podem rodar em processos (em ondas de `n_workers`
+blocos), a função `progress(feitas, total)` é chamada após cada bloco e o
+cálculo para antes do fim quando a estimativa se estabiliza dentro de `tol`.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from monte_carlo import CHUNK_BYTES, MAX_WORKERS, chunk_rows
+from sampling_engine import pearson_r
+
+# Reamostrar amostras maiores que isto deixa de ser interativo
+RESAMPLING_MAX_POINTS = 100_000
+# Blocos menores dão progresso e parada antecipada mais finos
+CHUNK_MAX_ROWS = 1_000
+
+BootstrapResult = namedtuple("BootstrapResult", ["r", "low", "high", "n_resamples", "converged"])
+PermutationResult = namedtuple("PermutationResult", ["r", "p_value", "n_permutations", "converged"])
+
+
+def _bootstrap_chunk(x, y, rows, seed_seq):
+    rng = np.random.default_rng(seed_seq)
+    idx = rng.integers(0, len(x), (rows, len(x)))
+    return pearson_r(x[idx], y[idx])
+
+
+def _permutation_chunk(x, y, rows, seed_seq):
+    rng = np.random.default_rng(seed_seq)
+    return pearson_r(x, rng.permuted(np.broadcast_to(y, (rows, len(y))), axis=1))
+
+
+def _run_chunks(chunk_func, x, y, n_total, seed, chunk_bytes, executor, n_workers, progress, is_stable):
+    """Executa os blocos em ondas e para quando `is_stable(valores)` for verdadeiro"""
+    rows = min(chunk_rows(len(x), chunk_bytes), CHUNK_MAX_ROWS)
+    sizes = [rows] * (n_total // rows)
+    if n_total % rows:
+        sizes.append(n_total % rows)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    wave = n_workers if executor is not None else 1
+
+    values = np.empty(n_total)
+    done = 0
+    for first in range(0, len(sizes), wave):
+        batch = list(zip(sizes[first:first + wave], seeds[first:first + wave]))
+        if executor is not None and len(batch) > 1:
+            results = [f.result() for f in [executor.submit(chunk_func, x, y, s, q) for s, q in batch]]
+        else:
+            results = [chunk_func(x, y, s, q) for s, q in batch]
+        for result in results:
+            values[done:done + len(result)] = result
+            done += len(result)
+        if progress is not None:
+            progress(done, n_total)
+        if done < n_total and is_stable(values[:done]):
+            return values[:done], True
+    return values, False
+
+
+def bootstrap_r(x, y, n_resamples=10_000, confidence=0.95, seed=None, tol=None, min_resamples=1_000,
+                chunk_bytes=CHUNK_BYTES, executor=None, n_workers=MAX_WORKERS, progress=None):
+    """Intervalo de confiança percentil para r por bootstrap
+
+    Com `tol`, para quando os dois limites do intervalo mudam menos que `tol`
+    entre um bloco e o seguinte (depois de pelo menos `min_resamples`).
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    alpha = (1 - confidence) / 2
+    previous = [None]
+
+    def is_stable(values):
+        if tol is None or len(values) < min_resamples:
+            return False
+        interval = np.nanpercentile(values, [100 * alpha, 100 * (1 - alpha)])
+        stable = previous[0] is not None and np.all(np.abs(interval - previous[0]) < tol)
+        previous[0] = interval
+        return stable
+
+    values, converged = _run_chunks(_bootstrap_chunk, x, y, n_resamples, seed, chunk_bytes,
+                                    executor, n_workers, progress, is_stable)
+    low, high = np.nanpercentile(values, [100 * alpha, 100 * (1 - alpha)])
+    return BootstrapResult(float(pearson_r(x, y)), float(low), float(high), len(values), converged)
+
+
+def permutation_test_r(x, y, n_permutations=10_000, seed=None, tol=None, min_permutations=1_000,
+                       chunk_bytes=CHUNK_BYTES, executor=None, n_workers=MAX_WORKERS, progress=None):
+    """p-valor bilateral de r por permutação de y
+
+    Com `tol`, para quando o erro padrão do p-valor estimado fica abaixo de `tol`
+    (depois de pelo menos `min_permutations`).
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    r = float(pearson_r(x, y))
+
+    def p_value(values):
+        return (1 + np.count_nonzero(np.abs(values) >= abs(r) - 1e-12)) / (1 + len(values))
+
+    def is_stable(values):
+        if tol is None or len(values) < min_permutations:
+            return False
+        p = p_value(values)
+        return np.sqrt(p * (1 - p) / len(values)) < tol
+
+    values, converged = _run_chunks(_permutation_chunk, x, y, n_permutations, seed, chunk_bytes,
+                                    executor, n_workers, progress, is_stable)
+    return PermutationResult(r, float(p_value(values)), len(values), converged)
@@ -0,0 +1,63 @@
+"""Correlação de Pearson móvel e expansiva ao longo do tempo.
+
+As séries ficam num array (entidades, tempo) e o tempo é sempre o último
+eixo. As somas de cada janela (x, y, x², y², xy) saem de somas acumuladas:
+a janela que termina em t é S[t] - S[t - janela], então avançar um passo
+custa O(1), qualquer que seja o tamanho da janela, e todas as entidades são
+atualizadas de uma vez. Os dados são centrados antes das somas para evitar
+cancelamento numérico em séries longas.
+"""
+import numpy as np
+
+
+def _centered(x, y):
+    x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+    return x - x.mean(axis=-1, keepdims=True), y - y.mean(axis=-1, keepdims=True)
+
+
+def _window_sums(values, window):
+    """Somas móveis no último eixo; NaN antes da primeira janela completa"""
+    total = np.cumsum(values, axis=-1)
+    out = np.full(values.shape, np.nan)
+    out[..., window - 1] = total[..., window - 1]
+    out[..., window:] = total[..., window:] - total[..., :-window]
+    return out
+
+
+def _correlation(n, sx, sy, sxx, syy, sxy):
+    cov = sxy - sx * sy / n
+    var_x = np.maximum(sxx - sx * sx / n, 0.0)
+    var_y = np.maximum(syy - sy * sy / n, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.clip(cov / np.sqrt(var_x * var_y), -1.0, 1.0)
+
+
+def rolling_corr(x, y, window):
+    """Correlação na janela dos últimos `window` passos, para cada instante
+
+    `x` e `y` são (..., T) ou compatíveis por broadcasting, por exemplo um
+    painel (E, T) contra uma série (T,). As primeiras `window - 1` posições
+    são NaN.
+    """
+    x, y = _centered(x, y)
+    if not 2 <= window <= x.shape[-1]:
+        raise ValueError(f"a janela deve estar entre 2 e {x.shape[-1]} passos")
+    sums = [_window_sums(v, window) for v in (x, y, x * x, y * y, x * y)]
+    return _correlation(window, *sums)
+
+
+def expanding_corr(x, y, min_periods=2):
+    """Correlação de todos os passos desde o início até cada instante"""
+    x, y = _centered(x, y)
+    n = np.arange(1, x.shape[-1] + 1, dtype=float)
+    r = _correlation(n, *(np.cumsum(v, axis=-1) for v in (x, y, x * x, y * y, x * y)))
+    r[..., :max(min_periods, 2) - 1] = np.nan
+    return r
+
+
+def window_corr_matrix(panel, end, window):
+    """Matriz de correlação entre as entidades na janela que termina no passo `end`"""
+    block = np.asarray(panel, dtype=float)[:, max(end - window + 1, 0):end + 1]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.corrcoef(block)
+
@@ -0,0 +1,98 @@
+"""Cache LRU compartilhado de amostras e suas estatísticas.
+
+A chave é (cenário, parâmetro, semente, n_points). Como a geração é
+determinística pela semente, sessões diferentes que pedem a mesma chave
+recebem a mesma amostra, servida da memória.
+"""
+import os
+import threading
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+
+from sampling_engine import generate_correlated_data, generate_curved_data, pearson_r
+
+# Teto de memória padrão (MB), configurável pela variável de ambiente
+DEFAULT_MAX_MB = float(os.environ.get("CORRELATION_CACHE_MB", 256))
+
+SCENARIOS = {
+    "linear": generate_correlated_data,
+    "curved": generate_curved_data,
+}
+
+Sample = namedtuple("Sample", ["x", "y", "stats"])
+
+
+def sample_key(scenario, param, seed, n_points):
+    """Normaliza a chave (o slider devolve floats como 0.30000000000000004)"""
+    return (scenario, round(float(param), 6), int(seed), int(n_points))
+
+
+def build_sample(scenario, param, seed, n_points):
+    """Gera a amostra de um cenário e pré-calcula suas estatísticas"""
+    x, y = SCENARIOS[scenario](param, n_points=n_points, seed=seed)
+    stats = {"r": float(pearson_r(x, y))}
+    # float32 basta para exibir e reamostrar, e cabem o dobro de amostras no cache
+    return Sample(x.astype(np.float32), y.astype(np.float32), stats)
+
+
+class SampleCache:
+    """Cache LRU de amostras com teto de memória e contadores de uso"""
+
+    def __init__(self, max_mb=DEFAULT_MAX_MB):
+        self.max_bytes = int(max_mb * 1024**2)
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, scenario, param, seed, n_points=150):
+        """Devolve a amostra da chave, gerando-a apenas se não estiver no cache"""
+        key = sample_key(scenario, param, seed, n_points)
+        with self._lock:
+            sample = self._entries.get(key)
+            if sample is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return sample
+            self.misses += 1
+
+        # A geração fica fora do lock para não bloquear as outras sessões
+        sample = build_sample(*key)
+        self.put(key, sample)
+        return sample
+
+    def put(self, key, sample):
+        """Insere uma amostra e remove as menos usadas até caber no teto"""
+        size = sample.x.nbytes + sample.y.nbytes
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return
+            self._entries[key] = sample
+            self.nbytes += size
+            while self.nbytes > self.max_bytes and len(self._entries) > 1:
+                _, old = self._entries.popitem(last=False)
+                self.nbytes -= old.x.nbytes + old.y.nbytes
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self):
+        """Resumo dos contadores do cache"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "nbytes": self.nbytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
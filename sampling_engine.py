@@ -0,0 +1,122 @@
+"""Motor de geração de amostras do Explorador de Correlação.
+
+Todas as funções usam um np.random.Generator semeado e devolvem arrays NumPy
+(sem DataFrames). Com `n_samples=K` são geradas K réplicas de uma só vez,
+em arrays de formato (K, n_points); sem ele, o formato é (n_points,).
+"""
+import numpy as np
+
+# Semente da amostra inicial, comum a todas as sessões (e portanto ao cache)
+DEFAULT_SEED = 2025
+
+
+def make_rng(seed=None):
+    """Cria um Generator a partir de uma semente (ou devolve o próprio Generator)"""
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(seed)
+
+
+def new_seed():
+    """Sorteia uma semente nova de 32 bits para uma amostra reprodutível"""
+    return int(np.random.default_rng().integers(2**32))
+
+
+def _shape(n_points, n_samples):
+    return (n_points,) if n_samples is None else (n_samples, n_points)
+
+
+def generate_correlated_data(correlation, n_points=150, n_samples=None, seed=None):
+    """Gera pares (x, y) normais padrão com correlação populacional `correlation`"""
+    rng = make_rng(seed)
+    shape = _shape(n_points, n_samples)
+    x = rng.standard_normal(shape)
+    # y = r*x + sqrt(1 - r²)*eps, calculado no próprio buffer de eps
+    y = rng.standard_normal(shape)
+    y *= np.sqrt(1 - correlation**2)
+    y += correlation * x
+    return x, y
+
+
+def generate_curved_data(curvature=1.0, n_points=150, n_samples=None, seed=None):
+    """Gera pares (x, y) em formato de U: y = curvatura² · x² + ruído - 2"""
+    rng = make_rng(seed)
+    shape = _shape(n_points, n_samples)
+    x = rng.uniform(-2, 2, shape)
+    y = rng.normal(0, 0.1, shape)
+    y += (curvature**2) * x**2
+    y -= 2
+    return x, y
+
+
+def group_labels(n_groups):
+    """Rótulos "Grupo A", "Grupo B", ... (numerados depois do "Grupo Z")"""
+    return [f"Grupo {chr(65 + k)}" if k < 26 else f"Grupo {k + 1}" for k in range(n_groups)]
+
+
+def generate_simpsons_data(slope_diff=-1, n_points=150, n_samples=None, seed=None, n_groups=2):
+    """Gera dados do paradoxo de Simpson: (x, y, group), com group em {0, ..., n_groups-1}
+
+    O grupo k ocupa um bloco contíguo de colunas, com x uniforme em [4k, 4k+5].
+    O grupo 0 tem inclinação 1 e os demais `slope_diff`; como os centros dos grupos
+    sobem ao longo de x, a tendência geral é positiva mesmo com grupos decrescentes.
+    """
+    rng = make_rng(seed)
+    shape = _shape(n_points, n_samples)
+    bounds = np.arange(n_groups + 1) * n_points // n_groups
+    group = np.repeat(np.arange(n_groups, dtype=np.int32), np.diff(bounds))
+
+    offset = 4.0 * group
+    x = rng.uniform(0, 5, shape)
+    slope = np.where(group == 0, 1.0, slope_diff)
+    y = rng.normal(0, 0.5, shape)
+    y += slope * x + 1.25 * offset
+    x += offset
+    return x, y, group
+
+
+def generate_random_walks(n_series, n_steps, common=0.0, start=100.0, seed=None):
+    """Gera um painel de passeios aleatórios no formato (n_series, n_steps)
+
+    Cada série acumula os próprios choques (cumsum ao longo do tempo, por série);
+    os choques de séries diferentes têm correlação `common`, por um fator comum.
+    """
+    rng = make_rng(seed)
+    steps = rng.standard_normal((n_series, n_steps))
+    steps *= np.sqrt(1 - common)
+    steps += np.sqrt(common) * rng.standard_normal(n_steps)
+    levels = np.cumsum(steps, axis=1)
+    levels += start
+    return levels
+
+
+def factor_loadings(n_columns, n_factors=5, seed=None):
+    """Cargas (n_factors, n_columns): cada coluna depende de um fator, com peso e sinal sorteados"""
+    rng = make_rng(seed)
+    loadings = np.zeros((n_factors, n_columns))
+    factor = rng.integers(0, n_factors, n_columns)
+    loadings[factor, np.arange(n_columns)] = rng.choice([-1.0, 1.0], n_columns) * rng.uniform(0.5, 1.5, n_columns)
+    return loadings
+
+
+def generate_factor_data(loadings, n_points, noise=1.0, seed=None):
+    """Gera uma tabela larga (n_points, n_columns) float32 = fatores @ cargas + ruído"""
+    rng = make_rng(seed)
+    n_factors, n_columns = loadings.shape
+    data = rng.standard_normal((n_points, n_columns), dtype=np.float32)
+    data *= noise
+    data += (rng.standard_normal((n_points, n_factors)) @ loadings).astype(np.float32)
+    return data
+
+
+def pearson_r(x, y):
+    """Correlação de Pearson linha a linha (último eixo) para arrays (..., n)"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    xc = x - x.mean(axis=-1, keepdims=True)
+    yc = y - y.mean(axis=-1, keepdims=True)
+    sxy = np.einsum("...i,...i->...", xc, yc)
+    sxx = np.einsum("...i,...i->...", xc, xc)
+    syy = np.einsum("...i,...i->...", yc, yc)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return sxy / np.sqrt(sxx * syy)
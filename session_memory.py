@@ -0,0 +1,119 @@
+"""Contabilidade de memória do st.session_state de cada sessão.
+
+`nbytes` estima o tamanho de um valor (arrays e DataFrames pelo conteúdo,
+contêineres recursivamente, arrays e contêineres compartilhados uma vez só).
+`SessionMemoryRegistry` guarda a última medição de cada sessão do processo,
+para somar o uso de todas as sessões ativas e dimensionar as instâncias.
+"""
+import sys
+import threading
+import time
+
+import numpy as np
+import streamlit as st
+
+# Sessões sem medição há mais tempo que isto são consideradas encerradas
+SESSION_TTL_S = 3600
+
+
+def nbytes(value, _seen=None):
+    """Tamanho aproximado de um valor em bytes"""
+    if isinstance(value, (int, float, complex, bool, str, bytes, type(None))):
+        return sys.getsizeof(value)
+    seen = set() if _seen is None else _seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if hasattr(value, "memory_usage") and hasattr(value, "dtypes"):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(nbytes(k, seen) + nbytes(v, seen) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(nbytes(item, seen) for item in value)
+    return sys.getsizeof(value)
+
+
+def state_nbytes(state):
+    """Tamanho de cada entrada do session_state, da maior para a menor"""
+    seen = set()
+    sizes = {key: nbytes(state[key], seen) for key in list(state.keys())}
+    return dict(sorted(sizes.items(), key=lambda item: item[1], reverse=True))
+
+
+def format_bytes(n):
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+
+
+class SessionMemoryRegistry:
+    """Última medição de memória de cada sessão, com expiração"""
+
+    def __init__(self, ttl=SESSION_TTL_S):
+        self.ttl = ttl
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def record(self, session_id, size):
+        now = time.time()
+        with self._lock:
+            self._sessions[session_id] = (size, now)
+            expired = [sid for sid, (_, seen) in self._sessions.items() if now - seen > self.ttl]
+            for sid in expired:
+                del self._sessions[sid]
+
+    def stats(self):
+        """Resumo das sessões ativas"""
+        with self._lock:
+            sizes = [size for size, _ in self._sessions.values()]
+        return {
+            "sessions": len(sizes),
+            "total_bytes": sum(sizes),
+            "max_bytes": max(sizes, default=0),
+            "mean_bytes": sum(sizes) / len(sizes) if sizes else 0.0,
+        }
+
+
+@st.cache_resource
+def get_session_registry():
+    """Registro compartilhado por todas as sessões do processo"""
+    return SessionMemoryRegistry()
+
+
+def show_session_memory(shared=None):
+    """Mostra, na barra lateral, a memória desta sessão, das sessões ativas e dos caches compartilhados
+
+    `shared` é um dicionário nome -> função que devolve os bytes de um cache comum a todas as sessões.
+    """
+    with st.sidebar:
+        _memory_panel(shared or {})
+
+
+@st.fragment
+def _memory_panel(shared):
+    """Painel de memória (fragmento: "Atualizar" mede de novo sem reexecutar a página)"""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    sizes = state_nbytes(st.session_state)
+    total = sum(sizes.values())
+    ctx = get_script_run_ctx()
+    registry = get_session_registry()
+    if ctx is not None:
+        registry.record(ctx.session_id, total)
+    summary = registry.stats()
+
+    with st.expander("💾 Memória"):
+        st.write(f"**Esta sessão:** {format_bytes(total)} em {len(sizes)} entradas")
+        st.dataframe({"Entrada": list(sizes), "Tamanho": [format_bytes(n) for n in sizes.values()]},
+                     hide_index=True)
+        st.write(f"**Sessões ativas:** {summary['sessions']} | total {format_bytes(summary['total_bytes'])} | "
+                 f"média {format_bytes(summary['mean_bytes'])} | maior {format_bytes(summary['max_bytes'])}")
+        for name, size in shared.items():
+            st.write(f"**{name}** (compartilhado): {format_bytes(size())}")
+        # As seções interativas reexecutam sozinhas e não redesenham este painel
+        st.caption("Medido na última execução da página ou deste painel; as seções interativas não o atualizam.")
+        st.button("Atualizar", key="session_memory_refresh")
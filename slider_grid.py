@@ -0,0 +1,133 @@
+"""Índice pré-calculado dos valores dos sliders das abas 1 e 2.
+
+Os sliders "Correlação Alvo" e "Curvatura" têm poucos valores possíveis. Para a
+semente padrão, o índice guarda a amostra, suas estatísticas e o gráfico
+pronto de cada ponto da grade, e um movimento do slider vira uma consulta a um
+dicionário. O aquecimento pode rodar na inicialização ou em segundo plano.
+"""
+import os
+import threading
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+
+from figures import FIGURE_BUILDERS
+from sample_cache import sample_key
+from session_memory import nbytes
+from sampling_engine import DEFAULT_SEED
+
+# "startup" (bloqueia até terminar), "background" (thread) ou "off"
+WARMUP_MODE = os.environ.get("CORRELATION_GRID_WARMUP", "background")
+
+# Mesmos limites e passos dos sliders das abas
+SLIDER_GRIDS = {
+    "linear": np.round(np.arange(-1.0, 1.0 + 1e-9, 0.1), 1),
+    "curved": np.round(np.arange(0.1, 2.0 + 1e-9, 0.1), 1),
+}
+
+# Gráficos guardados para estados fora da grade (outra semente ou outro n)
+OFF_GRID_MAX_ENTRIES = 64
+# Teto de memória (MB) desses gráficos, configurável pela variável de ambiente
+OFF_GRID_MAX_MB = float(os.environ.get("CORRELATION_OFF_GRID_MB", 32))
+
+GridEntry = namedtuple("GridEntry", ["sample", "figure"])
+
+
+def build_entry(sample, scenario):
+    """Gera o gráfico da amostra
+
+    A entrada guarda a go.Figure, e não um dict: o st.plotly_chart revalida
+    dicts (~25 ms), mas só copia figuras já validadas.
+    """
+    figure = FIGURE_BUILDERS[scenario](sample)
+    return GridEntry(sample, figure)
+
+
+class SliderGridIndex:
+    """Amostras e gráficos prontos para cada ponto da grade dos sliders"""
+
+    def __init__(self, sample_cache, seed=DEFAULT_SEED, n_points=150, grids=SLIDER_GRIDS,
+                 off_grid_max_mb=OFF_GRID_MAX_MB):
+        self.sample_cache = sample_cache
+        self.seed = seed
+        self.n_points = n_points
+        self.grids = grids
+        self._entries = {}
+        self._thread = None
+        # LRU só dos gráficos: as amostras continuam no cache de amostras, com o teto de memória dele
+        self._off_grid = OrderedDict()
+        self._off_grid_lock = threading.Lock()
+        self.off_grid_max_bytes = int(off_grid_max_mb * 1024**2)
+        self.off_grid_nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def size(self):
+        return sum(len(grid) for grid in self.grids.values())
+
+    @property
+    def ready(self):
+        return len(self._entries) == self.size
+
+    def warm(self, background=False):
+        """Preenche o índice, de forma síncrona ou numa thread em segundo plano"""
+        if background:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self.warm, name="slider-grid-warmup", daemon=True)
+                self._thread.start()
+            return
+        for scenario, grid in self.grids.items():
+            for param in grid:
+                key = sample_key(scenario, param, self.seed, self.n_points)
+                if key not in self._entries:
+                    sample = self.sample_cache.get(scenario, param, self.seed, self.n_points)
+                    # Atribuição única de dict: segura para leitores em outras threads
+                    self._entries[key] = build_entry(sample, scenario)
+
+    def get(self, scenario, param, seed, n_points=None):
+        """Consulta O(1) no índice; fora dele, reaproveita o gráfico do LRU ou gera a entrada"""
+        n_points = self.n_points if n_points is None else n_points
+        key = sample_key(scenario, param, seed, n_points)
+        entry = self._entries.get(key)
+        if entry is not None:
+            with self._off_grid_lock:
+                self.hits += 1
+            return entry
+        sample = self.sample_cache.get(scenario, param, seed, n_points)
+        with self._off_grid_lock:
+            cached = self._off_grid.get(key)
+            if cached is not None:
+                self._off_grid.move_to_end(key)
+                self.hits += 1
+                return GridEntry(sample, cached[0])
+            self.misses += 1
+        entry = build_entry(sample, scenario)
+        # Tamanho pelo conteúdo da figura (os arrays dos traços dominam)
+        size = nbytes(entry.figure.to_dict())
+        with self._off_grid_lock:
+            if key not in self._off_grid:
+                self._off_grid[key] = (entry.figure, size)
+                self.off_grid_nbytes += size
+            while self._off_grid and (len(self._off_grid) > OFF_GRID_MAX_ENTRIES
+                                      or self.off_grid_nbytes > self.off_grid_max_bytes):
+                _, (_, old_size) = self._off_grid.popitem(last=False)
+                self.off_grid_nbytes -= old_size
+                self.evictions += 1
+        return entry
+
+    def stats(self):
+        """Resumo dos contadores; `nbytes` é a memória dos gráficos fora da grade"""
+        with self._off_grid_lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._off_grid),
+                "grid_entries": len(self._entries),
+                "nbytes": self.off_grid_nbytes,
+                "max_bytes": self.off_grid_max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
@@ -0,0 +1,277 @@
+"""Exportação estática das abas 1 e 2 do Explorador de Correlação.
+
+Percorre todos os valores dos sliders "Correlação Alvo" e "Curvatura", para
+algumas sementes e tamanhos de amostra, e gera gráfico e estatísticas de cada
+estado num pool de processos. O resultado é uma pasta autocontida (HTML,
+plotly.js e um arquivo por estado) que troca de estado no navegador, sem
+servidor Python: basta abrir o index.html ou servi-la como arquivos estáticos.
+
+Uso (na raiz do repositório):
+
+    python static_export.py saida/ [--seeds 5] [--sizes 150,1000] [--workers N]
+
+Os estados são scripts carregados sob demanda, e não JSON buscado com fetch,
+para que o pacote também funcione aberto direto do disco (file://).
+"""
+import argparse
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from dependence import DEPENDENCE_MAX_POINTS, dependence_measures
+from figures import FIGURE_BUILDERS
+from monte_carlo import MAX_WORKERS
+from sample_cache import build_sample, sample_key
+from sampling_engine import DEFAULT_SEED
+from slider_grid import SLIDER_GRIDS
+
+DEFAULT_SEEDS = 5
+DEFAULT_SIZES = (150, 1_000)
+
+
+def export_seeds(n_seeds, seed=DEFAULT_SEED):
+    """A semente padrão do aplicativo seguida de sementes derivadas dela (reprodutíveis)"""
+    extra = np.random.default_rng(seed).integers(2**32, size=max(n_seeds - 1, 0))
+    return [seed] + [int(s) for s in extra]
+
+
+def state_path(scenario, param, seed, n_points):
+    """Caminho do arquivo de um estado, relativo à pasta exportada"""
+    return f"states/{scenario}/{seed}-{n_points}-{param:.1f}.js"
+
+
+def render_state(scenario, param, seed, n_points):
+    """Gráfico (JSON do Plotly) e estatísticas de um estado; roda nos processos do pool"""
+    start = time.perf_counter()
+    sample = build_sample(*sample_key(scenario, param, seed, n_points))
+    stats = dict(sample.stats)
+    if scenario == "curved":
+        stats = dependence_measures(sample.x, sample.y)
+    figure = FIGURE_BUILDERS[scenario](sample).to_json()
+    payload = f'exportedState("{scenario}-{seed}-{n_points}-{param:.1f}",{{"figure":{figure},"stats":{json.dumps(stats)}}});\n'
+    return payload, time.perf_counter() - start
+
+
+def export_states(seeds, sizes, grids=SLIDER_GRIDS):
+    """Todos os estados (cenário, parâmetro, semente, n) a exportar"""
+    # + 0.0 troca -0.0 por 0.0, que o JavaScript formata como "0.0"
+    return [(scenario, float(param) + 0.0, seed, n_points)
+            for scenario, grid in grids.items() for seed in seeds for n_points in sizes for param in grid]
+
+
+def bundle_size(out_dir):
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(out_dir) for name in names)
+
+
+def write_page(out_dir, seeds, sizes, grids=SLIDER_GRIDS):
+    """index.html, plotly.js e o manifesto com as grades dos controles"""
+    import plotly
+
+    shutil.copy(os.path.join(os.path.dirname(plotly.__file__), "package_data", "plotly.min.js"), out_dir)
+    manifest = {
+        "seeds": seeds,
+        "sizes": list(sizes),
+        "grids": {scenario: [float(p) + 0.0 for p in grid] for scenario, grid in grids.items()},
+        "dependenceMaxPoints": DEPENDENCE_MAX_POINTS,
+    }
+    with open(os.path.join(out_dir, "index.html"), "w", encoding="utf-8") as out:
+        out.write(PAGE_TEMPLATE.replace("__MANIFEST__", json.dumps(manifest)))
+
+
+def export(out_dir, seeds, sizes, n_workers=MAX_WORKERS, log=print):
+    """Gera o pacote estático e devolve o tempo de cada estado (segundos)"""
+    states = export_states(seeds, sizes)
+    for scenario in SLIDER_GRIDS:
+        os.makedirs(os.path.join(out_dir, "states", scenario), exist_ok=True)
+    write_page(out_dir, seeds, sizes)
+
+    timings = {}
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        futures = {executor.submit(render_state, *state): state for state in states}
+        for done, future in enumerate(as_completed(futures), 1):
+            state = futures[future]
+            payload, seconds = future.result()
+            path = state_path(*state)
+            with open(os.path.join(out_dir, path), "w", encoding="utf-8") as out:
+                out.write(payload)
+            timings[path] = seconds
+            if done % 50 == 0 or done == len(states):
+                log(f"{done}/{len(states)} estados")
+
+    with open(os.path.join(out_dir, "timings.json"), "w", encoding="utf-8") as out:
+        json.dump(timings, out, indent=1, sort_keys=True)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exporta as abas 1 e 2 do Explorador de Correlação como páginas "
+                                                 "estáticas")
+    parser.add_argument("out_dir", help="pasta de saída")
+    parser.add_argument("--seeds", type=int, default=DEFAULT_SEEDS,
+                        help=f"amostras por valor do slider, incluindo a padrão (padrão: {DEFAULT_SEEDS})")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="tamanhos de amostra separados por vírgula (padrão: %(default)s)")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS, help="processos do pool")
+    args = parser.parse_args()
+
+    seeds = export_seeds(args.seeds)
+    sizes = [int(n) for n in args.sizes.split(",")]
+    start = time.perf_counter()
+    timings = export(args.out_dir, seeds, sizes, args.workers)
+    elapsed = time.perf_counter() - start
+
+    seconds = np.array(list(timings.values()))
+    print(f"{len(seconds)} estados em {elapsed:.1f} s com {args.workers} processo(s)")
+    print(f"Tempo por estado: média {seconds.mean() * 1000:.0f} ms | mediana {np.median(seconds) * 1000:.0f} ms | "
+          f"p95 {np.percentile(seconds, 95) * 1000:.0f} ms | máximo {seconds.max() * 1000:.0f} ms")
+    for path, value in sorted(timings.items(), key=lambda item: item[1], reverse=True)[:5]:
+        print(f"  {value * 1000:7.0f} ms  {path}")
+    print(f"Tamanho do pacote: {bundle_size(args.out_dir) / 1024**2:.1f} MB em {args.out_dir}")
+
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+<meta charset="utf-8">
+<title>Explorador Interativo de Correlação</title>
+<script src="plotly.min.js"></script>
+<style>
+body { font-family: sans-serif; max-width: 1100px; margin: 0 auto; padding: 1em; }
+.tabs button { padding: .5em 1em; border: none; background: none; cursor: pointer; font-size: 1em; }
+.tabs button.active { border-bottom: 3px solid #ff4b4b; }
+.row { display: flex; gap: 2em; }
+.controls { flex: 1; }
+.plot { flex: 2; min-height: 450px; }
+label { display: block; margin-top: 1em; }
+.metrics { display: flex; gap: 2em; flex-wrap: wrap; }
+.metrics div span { display: block; font-size: 1.6em; }
+.info { background: #e8f0fe; padding: .8em; border-radius: .4em; margin-top: 1em; }
+</style>
+</head>
+<body>
+<h1>📊 Explorador Interativo de Correlação</h1>
+<p>Versão estática: os gráficos foram gerados com antecedência para alguns valores de cada controle.</p>
+<div class="tabs"><button data-tab="linear">Correlação Linear</button><button data-tab="curved">Padrões Não-lineares</button></div>
+
+<section id="tab-linear">
+<h2>1️⃣ Correlação Linear</h2>
+<p>Mova o controle deslizante para ver como diferentes valores de correlação afetam o gráfico de dispersão.
+Note que mesmo com o mesmo alvo de correlação, cada amostra aleatória parece ligeiramente diferente!</p>
+<div class="row">
+<div class="controls">
+<label>Correlação Alvo: <b class="value"></b><input type="range" class="param"></label>
+<label>Tamanho da amostra <select class="size"></select></label>
+<p><button class="new-seed">🎲 Gerar Nova Amostra</button></p>
+</div>
+<div class="plot"></div>
+</div>
+</section>
+
+<section id="tab-curved">
+<h2>2️⃣ Padrões Não-lineares (A Forma de U)</h2>
+<p>Aqui é onde a correlação pode nos enganar! Estes dados mostram um padrão claro em forma de U,
+mas a correlação pode estar próxima de zero. Ajuste a curvatura para ver como o padrão muda.</p>
+<div class="row">
+<div class="controls">
+<label>Curvatura: <b class="value"></b><input type="range" class="param"></label>
+<label>Tamanho da amostra <select class="size"></select></label>
+<p><button class="new-seed">🎲 Gerar Nova Forma de U</button></p>
+</div>
+<div class="plot"></div>
+</div>
+<h3>Outras medidas de dependência</h3>
+<div class="metrics"></div>
+<p><small>Pearson, Spearman e Kendall só enxergam relações monótonas; a correlação de distância
+e a informação mútua são zero apenas quando não há relação nenhuma.</small></p>
+<div class="info">📌 Mesmo havendo um padrão claro, a correlação está próxima de zero! Isso mostra por que devemos
+sempre visualizar nossos dados.</div>
+</section>
+
+<script>
+const MANIFEST = __MANIFEST__;
+const loaded = {};
+const waiting = {};
+
+// Chamada por cada arquivo de estado ao ser carregado
+function exportedState(key, state) {
+  loaded[key] = state;
+  (waiting[key] || []).forEach(resolve => resolve(state));
+  delete waiting[key];
+}
+
+function loadState(scenario, param, seed, n) {
+  const key = `${scenario}-${seed}-${n}-${param.toFixed(1)}`;
+  if (loaded[key]) return Promise.resolve(loaded[key]);
+  return new Promise(resolve => {
+    if (!waiting[key]) {
+      waiting[key] = [];
+      const script = document.createElement("script");
+      script.src = `states/${scenario}/${seed}-${n}-${param.toFixed(1)}.js`;
+      document.head.appendChild(script);
+    }
+    waiting[key].push(resolve);
+  });
+}
+
+function formatNumber(n) { return n.toLocaleString("pt-BR"); }
+
+function setupTab(scenario, defaultParam) {
+  const section = document.getElementById(`tab-${scenario}`);
+  const grid = MANIFEST.grids[scenario];
+  const slider = section.querySelector(".param");
+  const size = section.querySelector(".size");
+  const plot = section.querySelector(".plot");
+  let seedIndex = 0;
+  slider.min = 0;
+  slider.max = grid.length - 1;
+  slider.value = grid.indexOf(defaultParam);
+  MANIFEST.sizes.forEach(n => size.add(new Option(formatNumber(n), n)));
+
+  async function update() {
+    const param = grid[slider.value];
+    const n = Number(size.value);
+    section.querySelector(".value").textContent = param.toFixed(1);
+    const state = await loadState(scenario, param, MANIFEST.seeds[seedIndex], n);
+    // Ignora respostas que chegaram depois de o controle ter mudado de novo
+    if (grid[slider.value] !== param || Number(size.value) !== n) return;
+    Plotly.react(plot, state.figure.data, state.figure.layout, {responsive: true});
+    const metrics = section.querySelector(".metrics");
+    if (metrics) {
+      metrics.innerHTML = Object.entries(state.stats)
+        .map(([name, value]) => `<div>${name}<span>${value.toFixed(2)}</span></div>`).join("");
+      if (n > MANIFEST.dependenceMaxPoints) {
+        metrics.innerHTML += `<p><small>Exceto Pearson, as medidas usam os primeiros `
+          + `${formatNumber(MANIFEST.dependenceMaxPoints)} pontos da amostra.</small></p>`;
+      }
+    }
+  }
+
+  slider.addEventListener("input", update);
+  size.addEventListener("change", update);
+  section.querySelector(".new-seed").addEventListener("click", () => {
+    seedIndex = (seedIndex + 1) % MANIFEST.seeds.length;
+    update();
+  });
+  return update;
+}
+
+const updates = {linear: setupTab("linear", 0.0), curved: setupTab("curved", 1.0)};
+function showTab(name) {
+  document.querySelectorAll(".tabs button").forEach(b => b.classList.toggle("active", b.dataset.tab === name));
+  Object.keys(updates).forEach(s => { document.getElementById(`tab-${s}`).hidden = s !== name; });
+  updates[name]();
+}
+document.querySelectorAll(".tabs button").forEach(b => b.addEventListener("click", () => showTab(b.dataset.tab)));
+showTab("linear");
+</script>
+</body>
+</html>
+"""
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+from dataset_registry import DatasetRegistry
+
+
+def test_names_with_the_same_slug_do_not_collide(tmp_path):
+    registry = DatasetRegistry(str(tmp_path))
+    registry.write("Turma", "x/y", [1, 2, 3], [1, 2, 4])
+    registry.write("Turma", "x y", [1, 2, 3], [3, 2, 1])
+
+    assert sorted(registry.collections()["Turma"]) == ["x y", "x/y"]
+    assert registry.load("Turma", "x/y").stats["r"] > 0
+    assert registry.load("Turma", "x y").stats["r"] < 0
@@ -0,0 +1,22 @@
+import tracemalloc
+
+import numpy as np
+
+from rerun_profiler import RerunProfiler
+
+
+def test_nested_section_keeps_outer_peak(tmp_path):
+    profiler = RerunProfiler(path=str(tmp_path / "metrics.prom"), trace_allocations=True)
+    try:
+        with profiler.section("app", "página") as outer:
+            # Pico da seção externa antes da interna: o reset_peak da interna não pode apagá-lo
+            big = np.ones(4_000_000)
+            del big
+            with profiler.section("app", "fragmento") as inner:
+                small = np.ones(500_000)
+                del small
+    finally:
+        tracemalloc.stop()
+    assert inner["peak_bytes"] >= 4_000_000
+    assert outer["peak_bytes"] >= 32_000_000
+    assert outer["peak_bytes"] >= inner["peak_bytes"]
@@ -0,0 +1 @@
+"""Páginas do Aplicativo Interativo de Aprendizado de Estatística (Introduction_2.py)."""
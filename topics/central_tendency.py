@@ -0,0 +1,182 @@
+"""Página "Medidas de Tendência Central" (com o Quarteto de Anscombe)."""
+import streamlit as st
+import pandas as pd
+import numpy as np
+import matplotlib.pyplot as plt
+
+from dataset_registry import ANSCOMBE, SAME_STATS, get_dataset_registry
+from numeric_input import numeric_data, show_values
+from render_cache import show_plot
+from rerun_profiler import profiled
+from resampling import RESAMPLING_MAX_POINTS
+
+# Pontos desenhados por conjunto; acima disso, o gráfico usa uma amostra regular
+PLOT_MAX_POINTS = 5_000
+
+
+def plot_points(dataset):
+    """Colunas para desenhar: uma amostra regular (sem cópia) acima de PLOT_MAX_POINTS"""
+    step = -(-len(dataset.x) // PLOT_MAX_POINTS)
+    return dataset.x[::step], dataset.y[::step]
+
+
+def draw_dataset(x_data, y_data, slope, intercept, selected_set, collection):
+    fig, ax = plt.subplots(figsize=(8, 6))
+    ax.scatter(x_data, y_data, s=80, alpha=0.7)
+
+    # Linha de regressão
+    x_line = np.linspace(min(x_data), max(x_data), 100)
+    y_line = slope * x_line + intercept
+    ax.plot(x_line, y_line, 'r--', alpha=0.8, label=f'y = {slope:.2f}x + {intercept:.2f}')
+
+    ax.set_xlabel('X')
+    ax.set_ylabel('Y')
+    ax.set_title(f'{selected_set} - {collection}')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    return fig
+
+
+def draw_collection(panels):
+    """Um painel por conjunto, `panels` = [(nome, x, y, inclinação, intercepto)], nos mesmos eixos"""
+    n_rows = -(-len(panels) // 2)
+    fig, axes = plt.subplots(n_rows, 2, figsize=(12, 5 * n_rows), sharex=True, sharey=True, squeeze=False)
+    axes = axes.flatten()
+
+    for ax, (name, x_vals, y_vals, slope_i, intercept_i) in zip(axes, panels):
+        ax.scatter(x_vals, y_vals, s=60, alpha=0.7)
+
+        # Linha de regressão
+        x_line = np.linspace(min(x_vals), max(x_vals), 100)
+        y_line = slope_i * x_line + intercept_i
+        ax.plot(x_line, y_line, 'r--', alpha=0.8)
+
+        ax.set_xlabel('X')
+        ax.set_ylabel('Y')
+        ax.set_title(name)
+        ax.grid(True, alpha=0.3)
+    for ax in axes[len(panels):]:
+        ax.set_visible(False)
+
+    fig.tight_layout()
+    return fig
+
+
+@st.fragment
+@profiled("Tendência Central / Média, mediana e moda")
+def tendency_section():
+    """Média, mediana e moda (fragmento: o campo de texto só reexecuta esta seção)"""
+    st.subheader("Exemplo Interativo")
+    numeric = numeric_data("Digite uma lista de números (separados por vírgula)", "10,20,30,40,50,60,70,80,90,10",
+                           key="tendency_data")
+    if numeric is None:
+        return
+    data, moments = numeric
+    show_values(data)
+
+    st.subheader("1. Média")
+    st.write(f"Média: {moments.mean:.2f}")
+    st.write("""
+    A média é a soma de todos os valores dividida pelo número de observações. 
+    É sensível a valores extremos (outliers).
+    """)
+
+    st.subheader("2. Mediana")
+    st.write(f"Mediana: {moments.median():.2f}")
+    st.write("""
+    A mediana é o valor que divide o conjunto de dados ao meio quando ordenado. 
+    É mais resistente a outliers que a média.
+    """)
+
+    st.subheader("3. Moda")
+    mode_result = pd.Series(data).mode()
+    if not mode_result.empty:
+        st.write(f"Moda: {mode_result[0]}")
+    else:
+        st.write("Não há moda única encontrada.")
+    st.write("""
+    A moda é o valor que aparece com maior frequência no conjunto de dados.
+    """)
+
+
+@st.fragment
+@profiled("Tendência Central / Quarteto de Anscombe")
+def anscombe_section():
+    """Demonstração interativa com os conjuntos do registro (Quarteto de Anscombe e outros)"""
+    st.subheader("Demonstração Interativa")
+    
+    # Conjuntos do registro: colunas mapeadas do disco e estatísticas já calculadas
+    registry = get_dataset_registry()
+    collections = registry.collections()
+    names = list(collections)
+    collection = st.selectbox("Coleção de conjuntos de dados:", names,
+                              index=names.index(ANSCOMBE) if ANSCOMBE in names else 0)
+    
+    # Escolha do conjunto
+    selected_set = st.selectbox("Escolha um conjunto:", collections[collection])
+    dataset = registry.load(collection, selected_set)
+    stats = dataset.stats
+    if dataset.description:
+        st.caption(dataset.description)
+    
+    # Estatísticas
+    st.write("**Estatísticas do conjunto selecionado:**")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.write(f"Média de X: {stats['mean_x']:.2f}")
+        st.write(f"Média de Y: {stats['mean_y']:.2f}")
+        st.write(f"Desvio padrão de X: {stats['std_x']:.2f}")
+        st.write(f"Desvio padrão de Y: {stats['std_y']:.2f}")
+    
+    with col2:
+        st.write(f"Correlação: {stats['r']:.3f}")
+        
+        # Incerteza da correlação (apenas 11 pontos no Anscombe!)
+        if stats["r_low"] is not None:
+            st.write(f"IC 95% (bootstrap): [{stats['r_low']:.2f}, {stats['r_high']:.2f}]")
+            st.write(f"p-valor (permutação): {stats['p_value']:.4f}")
+        else:
+            st.caption(f"Bootstrap e permutação só até {RESAMPLING_MAX_POINTS:,} pontos.")
+        
+        # Regressão linear simples
+        slope, intercept = stats["slope"], stats["intercept"]
+        st.write(f"Equação da reta: y = {slope:.2f}x + {intercept:.2f}")
+    
+    # Visualização
+    show_plot(draw_dataset, *plot_points(dataset), slope, intercept, selected_set, collection)
+    
+    # Comparação de todos os conjuntos
+    if st.checkbox("Mostrar todos os conjuntos simultaneamente"):
+        panels = [(name, *plot_points(d), d.stats["slope"], d.stats["intercept"])
+                  for name, d in ((name, registry.load(collection, name)) for name in collections[collection])]
+        show_plot(draw_collection, panels)
+        
+        # Só as coleções embutidas foram montadas com as mesmas estatísticas
+        if collection in (ANSCOMBE, SAME_STATS):
+            st.write(f"""
+            **Conclusão**: Apesar de terem estatísticas quase idênticas (média, desvio padrão, 
+            correlação e equação de regressão), os {len(collections[collection])} conjuntos mostram padrões completamente 
+            diferentes quando visualizados. Isso demonstra a importância crucial da visualização 
+            de dados na análise estatística!
+            """)
+
+
+def render():
+    """Desenha a página"""
+    st.header("Medidas de Tendência Central")
+    st.write("""
+    As medidas de tendência central descrevem o centro ou valor típico de um conjunto de dados.
+    """)
+    
+    tendency_section()
+
+    # Novo tópico: Quarteto de Anscombe
+    st.header("O Quarteto de Anscombe")
+    st.write("""
+    O Quarteto de Anscombe é um conjunto famoso de quatro conjuntos de dados que demonstra 
+    a importância da visualização de dados. Todos os quatro conjuntos têm praticamente 
+    as mesmas propriedades estatísticas básicas, mas são muito diferentes quando visualizados.
+    """)
+    
+    anscombe_section()
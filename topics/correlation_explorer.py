@@ -0,0 +1,127 @@
+"""Página "Matriz de Correlação" (tabelas largas)."""
+import streamlit as st
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+
+from correlation_matrix import (MATRIX_MAX_COLUMNS, cluster_order, correlation_matrix, downsample, file_chunks,
+                                top_pairs, write_memmap)
+from numeric_input import file_format
+from render_cache import show_plot
+from rerun_profiler import profiled
+from sampling_engine import DEFAULT_SEED, factor_loadings, generate_factor_data
+
+# Lado máximo do mapa de calor exibido (blocos maiores são promediados)
+HEATMAP_MAX_SIZE = 200
+# Linhas geradas por vez no exemplo sintético
+EXAMPLE_CHUNK_ROWS = 50_000
+# Tamanhos do exemplo sintético: no servidor compartilhado, no máximo 200 mil x 200 (~320 MB em disco)
+EXAMPLE_ROWS = [10_000, 50_000, 100_000, 200_000]
+EXAMPLE_COLUMNS = [20, 50, 100, 200]
+METHOD_LABELS = {"Pearson": "pearson", "Spearman": "spearman"}
+
+
+def draw_heatmap(matrix, labels, title):
+    fig, ax = plt.subplots(figsize=(8, 7))
+    image = ax.imshow(matrix, cmap="RdBu_r", vmin=-1, vmax=1, interpolation="nearest")
+    if labels is not None:
+        ax.set_xticks(range(len(labels)), labels, rotation=90, fontsize="small")
+        ax.set_yticks(range(len(labels)), labels, fontsize="small")
+    else:
+        ax.set_xticks([])
+        ax.set_yticks([])
+    ax.set_title(title)
+    fig.colorbar(image, ax=ax, label="Correlação")
+    return fig
+
+
+@st.cache_resource(max_entries=2, show_spinner="Gerando o exemplo...")
+def example_table(n_rows, n_columns, n_factors, seed=DEFAULT_SEED):
+    """Tabela sintética com grupos de colunas correlacionadas, gravada em disco em blocos"""
+    seeds = np.random.SeedSequence(seed).spawn(2)
+    loadings = factor_loadings(n_columns, n_factors, seed=np.random.default_rng(seeds[0]))
+    rng = np.random.default_rng(seeds[1])
+    chunks = (generate_factor_data(loadings, min(EXAMPLE_CHUNK_ROWS, n_rows - start), seed=rng)
+              for start in range(0, n_rows, EXAMPLE_CHUNK_ROWS))
+    return write_memmap(chunks, [f"x{i + 1}" for i in range(n_columns)])
+
+
+@st.cache_resource(max_entries=2, show_spinner="Convertendo o arquivo...")
+def uploaded_table(file_id, _file):
+    """Colunas numéricas de um arquivo enviado, convertidas uma vez para um memmap"""
+    columns, chunks = file_chunks(_file, file_format(_file.name))
+    return write_memmap(chunks, columns)
+
+
+@st.cache_resource(max_entries=4, show_spinner="Calculando a matriz de correlação...")
+def analyze(table_key, method, _table):
+    """Matriz de correlação e a ordem agrupada das colunas"""
+    matrix = correlation_matrix(_table.data, method)
+    return matrix, cluster_order(matrix)
+
+
+@st.fragment
+@profiled("Matriz de Correlação / Explorador")
+def explorer_section():
+    """Escolha dos dados, matriz, pares mais fortes e mapa de calor (fragmento)"""
+    source = st.radio("Dados", ["Exemplo sintético", "Enviar arquivo (CSV/Parquet)"], horizontal=True)
+    if source == "Exemplo sintético":
+        col1, col2, col3 = st.columns(3)
+        n_rows = col1.select_slider("Linhas", EXAMPLE_ROWS, value=100_000)
+        n_columns = col2.select_slider("Colunas", EXAMPLE_COLUMNS, value=100)
+        n_factors = col3.slider("Grupos de colunas (fatores)", 1, 20, 5)
+        table = example_table(n_rows, n_columns, n_factors)
+        table_key = f"exemplo-{n_rows}-{n_columns}-{n_factors}"
+    else:
+        upload = st.file_uploader("Arquivo CSV ou Parquet", type=["csv", "parquet", "pq"])
+        if upload is None:
+            st.info("Envie uma tabela com colunas numéricas (uma variável por coluna).")
+            return
+        try:
+            table = uploaded_table(upload.file_id, upload)
+        except ImportError:
+            st.error("Para ler arquivos Parquet instale o pacote pyarrow.")
+            return
+        except (ValueError, StopIteration, pd.errors.ParserError) as exc:
+            st.error(f"Não foi possível ler o arquivo: {exc}")
+            return
+        table_key = upload.file_id
+        if len(table.columns) == MATRIX_MAX_COLUMNS:
+            st.caption(f"Apenas as primeiras {MATRIX_MAX_COLUMNS} colunas numéricas são analisadas.")
+
+    n_rows, n_columns = table.data.shape
+    st.write(f"**{n_rows:,} linhas x {n_columns:,} colunas numéricas**")
+    if n_columns < 2:
+        st.warning("São necessárias pelo menos duas colunas numéricas.")
+        return
+
+    method_label = st.radio("Correlação", list(METHOD_LABELS), horizontal=True)
+    matrix, order = analyze(table_key, METHOD_LABELS[method_label], table)
+
+    st.subheader("Pares Mais Correlacionados")
+    k = st.slider("Quantos pares mostrar", 5, 100, 10)
+    pairs = top_pairs(matrix, table.columns, k)
+    st.dataframe(pd.DataFrame(pairs, columns=["Coluna 1", "Coluna 2", "Correlação"]), hide_index=True)
+
+    st.subheader("Mapa de Calor Agrupado")
+    clustered = matrix[np.ix_(order, order)]
+    shown = downsample(clustered, HEATMAP_MAX_SIZE)
+    labels = [table.columns[i] for i in order] if len(shown) == n_columns and n_columns <= 50 else None
+    title = f"{method_label} (colunas agrupadas"
+    title += f", blocos de {-(-n_columns // len(shown))} colunas)" if len(shown) < n_columns else ")"
+    show_plot(draw_heatmap, shown, labels, title)
+
+
+def render():
+    """Desenha a página"""
+    st.header("Matriz de Correlação")
+    st.write("""
+    Com muitas variáveis, olhar um par de cada vez não basta: a matriz de correlação mostra
+    a correlação de todos os pares de colunas de uma tabela. A correlação de **Pearson**
+    mede relações lineares; a de **Spearman** usa os postos e capta qualquer relação
+    monotônica. As colunas do mapa de calor são reordenadas para aproximar as que estão
+    mais correlacionadas entre si, revelando grupos de variáveis.
+    """)
+    st.caption("Valores ausentes são substituídos pela média da coluna.")
+
+    explorer_section()
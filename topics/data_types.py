@@ -0,0 +1,204 @@
+"""Página "Tipos de Dados"."""
+import streamlit as st
+import pandas as pd
+import numpy as np
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+from render_cache import show_plot
+from rerun_profiler import profiled
+from rolling_correlation import expanding_corr, rolling_corr, window_corr_matrix
+from sampling_engine import generate_random_walks, make_rng
+from ui_controls import sample_seed
+
+# Com mais entidades que isto, os gráficos deixam de mostrar legenda e rótulos
+LABELED_ENTITIES_MAX = 12
+
+
+def draw_scatter(data, x, y):
+    fig, ax = plt.subplots()
+    sns.scatterplot(x=x, y=y, data=data, ax=ax)
+    return fig
+
+
+def draw_lines(data, x, y, hue=None):
+    fig, ax = plt.subplots()
+    sns.lineplot(x=x, y=y, hue=hue, data=data, ax=ax)
+    return fig
+
+
+def draw_panel(dates, levels, entities):
+    fig, ax = plt.subplots()
+    lines = ax.plot(dates, levels.T, linewidth=1)
+    if len(entities) <= LABELED_ENTITIES_MAX:
+        ax.legend(lines, entities, title="País", fontsize="small")
+    ax.set_xlabel("Data")
+    ax.set_ylabel("PIB")
+    fig.autofmt_xdate()
+    return fig
+
+
+def draw_corr_over_time(dates, r, title):
+    fig, ax = plt.subplots()
+    ax.plot(dates, r)
+    ax.axhline(0, color="gray", linewidth=0.8)
+    ax.set_ylim(-1.05, 1.05)
+    ax.set_xlabel("Data")
+    ax.set_ylabel("Correlação")
+    ax.set_title(title)
+    fig.autofmt_xdate()
+    return fig
+
+
+def draw_corr_heatmap_time(dates, r, entities, title):
+    import matplotlib.dates as mdates
+
+    fig, ax = plt.subplots()
+    extent = [mdates.date2num(dates[0]), mdates.date2num(dates[-1]), len(entities) - 0.5, -0.5]
+    image = ax.imshow(r, aspect="auto", cmap="RdBu_r", vmin=-1, vmax=1, extent=extent, interpolation="nearest")
+    ax.xaxis_date()
+    if len(entities) <= LABELED_ENTITIES_MAX:
+        ax.set_yticks(range(len(entities)), entities)
+    ax.set_title(title)
+    fig.colorbar(image, ax=ax, label="Correlação")
+    fig.autofmt_xdate()
+    return fig
+
+
+def draw_corr_matrix(matrix, entities, title):
+    fig, ax = plt.subplots()
+    image = ax.imshow(matrix, cmap="RdBu_r", vmin=-1, vmax=1, interpolation="nearest")
+    if len(entities) <= LABELED_ENTITIES_MAX:
+        ax.set_xticks(range(len(entities)), entities, rotation=90)
+        ax.set_yticks(range(len(entities)), entities)
+    ax.set_title(title)
+    fig.colorbar(image, ax=ax, label="Correlação")
+    return fig
+
+
+@st.fragment
+@profiled("Tipos de Dados / Transversais")
+def cross_sectional_section():
+    """Dados transversais (fragmento: os widgets só reexecutam esta seção)"""
+    st.subheader("1. Dados Transversais (Cross-Sectional)")
+    st.write("""
+    - **Definição**: Dados coletados em um único ponto no tempo.
+    - **Exemplos**: Dados de pesquisa, dados de censo.
+    - **Visualização**: Gráfico de dispersão ou barras.
+    """)
+    st.write("**Exemplo Interativo**")
+    num_points = st.slider("Número de pontos de dados", 10, 1000, 100)
+    # Amostra semeada: o mesmo estado reaproveita o gráfico do cache
+    rng = make_rng(sample_seed("cross_sectional"))
+    cross_sectional_data = pd.DataFrame({
+        "Idade": rng.integers(18, 65, num_points),
+        "Renda": rng.integers(20000, 100000, num_points)
+    })
+    st.write(cross_sectional_data.head())
+    show_plot(draw_scatter, cross_sectional_data, "Idade", "Renda")
+
+
+@st.fragment
+@profiled("Tipos de Dados / Séries Temporais")
+def time_series_section():
+    """Dados de séries temporais"""
+    st.subheader("2. Dados de Séries Temporais")
+    st.write("""
+    - **Definição**: Dados coletados ao longo do tempo.
+    - **Exemplos**: Preços de ações, leituras de temperatura.
+    - **Visualização**: Gráfico de linha.
+    """)
+    st.write("**Exemplo Interativo**")
+    start_date = st.date_input("Data de início", pd.to_datetime("2023-01-01"))
+    num_days = st.slider("Número de dias", 10, 365, 100)
+    rng = make_rng(sample_seed("time_series"))
+    time_series_data = pd.DataFrame({
+        "Data": pd.date_range(start=start_date, periods=num_days, freq="D"),
+        "Preço": np.cumsum(rng.standard_normal(num_days)) + 100
+    })
+    st.write(time_series_data.head())
+    show_plot(draw_lines, time_series_data, "Data", "Preço")
+
+
+@st.fragment
+@profiled("Tipos de Dados / Painel")
+def panel_section():
+    """Dados em painel"""
+    st.subheader("3. Dados em Painel")
+    st.write("""
+    - **Definição**: Dados coletados ao longo do tempo para múltiplas entidades.
+    - **Exemplos**: PIB de países ao longo dos anos, dados de vendas para múltiplas lojas.
+    - **Visualização**: Gráfico de linhas facetado ou mapa de calor.
+    """)
+    st.write("**Exemplo Interativo**")
+    num_entities = st.slider("Número de entidades", 2, 50, 3)
+    num_days_panel = st.slider("Número de dias (painel)", 10, 3650, 100)
+    common = st.slider("Correlação entre os choques dos países", 0.0, 0.95, 0.5)
+    entities = [f"País {i+1}" for i in range(num_entities)]
+    dates = pd.date_range(start="2023-01-01", periods=num_days_panel, freq="D")
+    # Painel (entidades, dias): cada país acumula apenas os próprios choques
+    levels = generate_random_walks(num_entities, num_days_panel, common=common, seed=sample_seed("panel"))
+    panel_data = pd.DataFrame({
+        "País": np.repeat(entities, num_days_panel),
+        "Data": np.tile(dates, num_entities),
+        "PIB": levels.ravel()
+    })
+    st.write(panel_data.head())
+    show_plot(draw_panel, dates, levels, entities)
+    correlation_over_time(dates, levels, entities)
+
+
+def correlation_over_time(dates, levels, entities):
+    """Correlação móvel/expansiva entre os países e mapas de calor entre entidades"""
+    st.write("**Correlação ao Longo do Tempo**")
+    series = st.radio("Correlacionar", ["Variações diárias", "Níveis"], horizontal=True)
+    if series == "Níveis":
+        values, value_dates = levels, dates
+        st.caption("Passeios aleatórios independentes costumam parecer correlacionados nos níveis "
+                   "(correlação espúria); compare com as variações diárias.")
+    else:
+        values, value_dates = np.diff(levels, axis=1), dates[1:]
+    n_steps = values.shape[1]
+    if n_steps < 3:
+        st.info("Aumente o número de dias para calcular correlações ao longo do tempo.")
+        return
+
+    window_type = st.radio("Janela", ["Móvel", "Expansiva"], horizontal=True)
+    if window_type == "Móvel":
+        window = st.slider("Tamanho da janela (dias)", 2, min(365, n_steps), min(30, n_steps))
+
+        def correlate(x, y):
+            return rolling_corr(x, y, window)
+        label = f"janela móvel de {window} dias"
+    else:
+        window = None
+        correlate = expanding_corr
+        label = "janela expansiva"
+
+    col1, col2 = st.columns(2)
+    first = col1.selectbox("Primeira entidade", entities, index=0)
+    second = col2.selectbox("Segunda entidade", entities, index=1)
+    r_pair = correlate(values[entities.index(first)], values[entities.index(second)])
+    show_plot(draw_corr_over_time, value_dates, r_pair, f"{first} × {second} ({label})")
+
+    # Correlação de cada país com a média do painel, de uma vez para todos
+    r_mean = correlate(values, values.mean(axis=0))
+    show_plot(draw_corr_heatmap_time, value_dates, r_mean, entities, f"Correlação com a média do painel ({label})")
+
+    first_end, last_end = value_dates[(window or 2) - 1].date(), value_dates[-1].date()
+    end = st.slider("Fim da janela", first_end, last_end, last_end) if first_end < last_end else last_end
+    end_step = (end - value_dates[0].date()).days
+    matrix = window_corr_matrix(values, end_step, window or end_step + 1)
+    show_plot(draw_corr_matrix, matrix, entities, f"Correlação entre os países até {end:%d/%m/%Y} ({label})")
+
+
+def render():
+    """Desenha a página"""
+    st.header("Tipos de Dados")
+    st.write("""
+    Os dados podem ser classificados em três tipos principais baseados em como são coletados:
+    """)
+    
+    cross_sectional_section()
+    time_series_section()
+    panel_section()
@@ -0,0 +1,68 @@
+"""Página "Medidas de Dispersão"."""
+import streamlit as st
+import numpy as np
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+from numeric_input import numbers_text_input, numeric_data, show_values
+from render_cache import show_plot
+from rerun_profiler import profiled
+
+
+def draw_covariance(data, data2):
+    fig, ax = plt.subplots()
+    sns.scatterplot(x=data, y=data2, ax=ax)
+    ax.set_xlabel("Primeira variável")
+    ax.set_ylabel("Segunda variável")
+    return fig
+
+
+@st.fragment
+@profiled("Dispersão / Exemplo")
+def dispersion_section():
+    """Variância, desvio padrão e covariância (fragmento)"""
+    st.subheader("Exemplo Interativo")
+    numeric = numeric_data("Digite uma lista de números (separados por vírgula)", "10,20,30,40,50,60,70,80,90,10",
+                           key="dispersion_data")
+    if numeric is None:
+        return
+    data, moments = numeric
+    show_values(data)
+
+    st.subheader("1. Variância")
+    st.write(f"Variância: {moments.variance():.2f}")
+    st.write("""
+    A variância mede a dispersão dos dados em relação à média. 
+    É calculada como a média dos quadrados das diferenças em relação à média.
+    """)
+
+    st.subheader("2. Desvio Padrão")
+    st.write(f"Desvio Padrão: {moments.std():.2f}")
+    st.write("""
+    O desvio padrão é a raiz quadrada da variância. 
+    É expresso na mesma unidade dos dados originais.
+    """)
+
+    st.subheader("3. Covariância")
+    st.write("Digite outra lista de números para calcular a covariância:")
+    data2 = numbers_text_input("Segunda lista (separada por vírgula)", "15,25,35,45,55,65,75,85,95,15",
+                               key="dispersion_data2")
+    if len(data) == len(data2):
+        st.write(f"Covariância: {np.cov(data, data2)[0, 1]:.2f}")
+        st.write("""
+        A covariância mede como duas variáveis variam juntas. 
+        Valores positivos indicam que as variáveis tendem a aumentar juntas.
+        """)
+        show_plot(draw_covariance, data, data2)
+    else:
+        st.write("Ambas as listas devem ter o mesmo comprimento para calcular a covariância.")
+
+
+def render():
+    """Desenha a página"""
+    st.header("Medidas de Dispersão")
+    st.write("""
+    As medidas de dispersão descrevem o quão espalhados os dados estão.
+    """)
+    
+    dispersion_section()
@@ -0,0 +1,211 @@
+"""Página "Medidas de Assimetria e Curtose"."""
+import streamlit as st
+import numpy as np
+import matplotlib.pyplot as plt
+
+from distributions import (binned_density, plot_density, rescale_density, standard_density, standard_moments,
+                           standard_sample)
+from kde import BANDWIDTH_RULES
+from numeric_input import numeric_data
+from render_cache import show_plot
+from rerun_profiler import profiled
+from sampling_engine import DEFAULT_SEED
+
+# Família padronizada, locação e escala de cada distribuição do exemplo
+DISTRIBUTIONS = {
+    "Normal": ("normal", 50, 10),
+    # Distribuição qui-quadrado (assimetria positiva): 5 * qui2(2) + 30
+    "Assimétrica Positiva": ("chisquare2", 40, 10),
+    # Inverso da qui-quadrado (assimetria negativa): 70 - 5 * qui2(2)
+    "Assimétrica Negativa": ("chisquare2", 60, -10),
+    # Distribuição t com poucos graus de liberdade (caudas pesadas): 10 * t(3) + 50
+    "Leptocúrtica": ("t3", 50, 10 * np.sqrt(3)),
+    # Distribuição uniforme (achatada) entre 30 e 70
+    "Platicúrtica": ("uniform", 50, 40 / np.sqrt(12)),
+}
+# Semente da amostra normal de comparação (diferente da usada em "Normal")
+COMPARISON_SEED = DEFAULT_SEED + 1
+
+
+def draw_distribution(data, density, dist_type, mean, median):
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+
+    # Histograma
+    plot_density(ax1, density, hist_kws=dict(alpha=0.7, color='skyblue', edgecolor='black'),
+                 kde_kws=dict(color='navy', linewidth=2))
+    ax1.axvline(mean, color='red', linestyle='--', linewidth=2, label=f'Média: {mean:.2f}')
+    ax1.axvline(median, color='green', linestyle='--', linewidth=2, label=f'Mediana: {median:.2f}')
+    ax1.set_xlabel('Valores')
+    ax1.set_ylabel('Densidade')
+    ax1.set_title(f'Histograma - {dist_type}')
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+
+    # Box plot
+    ax2.boxplot(data, vert=True, patch_artist=True, 
+                boxprops=dict(facecolor='lightblue', alpha=0.7))
+    ax2.set_ylabel('Valores')
+    ax2.set_title('Box Plot')
+    ax2.grid(True, alpha=0.3)
+
+    fig.tight_layout()
+    return fig
+
+
+def draw_normal_comparison(density, normal_density, dist_type):
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    # Histogramas sobrepostos, cada um com sua KDE
+    plot_density(ax, density, label=f'{dist_type}', hist_kws=dict(alpha=0.6, color='skyblue'),
+                 kde_kws=dict(color='navy', linewidth=2))
+    plot_density(ax, normal_density, label='Normal', hist_kws=dict(alpha=0.6, color='orange'),
+                 kde_kws=dict(color='darkorange', linewidth=2))
+
+    ax.set_xlabel('Valores')
+    ax.set_ylabel('Densidade')
+    ax.set_title('Comparação com Distribuição Normal')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+    return fig
+
+
+@st.fragment
+@profiled("Assimetria e Curtose / Distribuições")
+def distribution_section():
+    """Exemplo interativo com distribuições (fragmento)"""
+    st.subheader("Exemplo Interativo com Distribuições")
+    
+    # Seletor de tipo de distribuição
+    dist_type = st.selectbox("Escolha o tipo de distribuição:", [
+        "Normal", "Assimétrica Positiva", "Assimétrica Negativa", 
+        "Leptocúrtica", "Platicúrtica", "Dados Personalizados"
+    ])
+    bw_label = st.radio("Largura de banda da curva de densidade (KDE)", list(BANDWIDTH_RULES), horizontal=True)
+    bw_method = BANDWIDTH_RULES[bw_label]
+    
+    if dist_type == "Dados Personalizados":
+        numeric = numeric_data("Digite uma lista de números (separados por vírgula)",
+                               "1,2,2,3,3,3,4,4,5,10,15,20", key="shape_data")
+        if numeric is None:
+            return
+        data, moments = numeric
+        density = binned_density(data, bins=30, bw_method=bw_method)
+    else:
+        n_samples = st.slider("Número de amostras", 100, 10000, 1000)
+        
+        # Amostra padronizada sorteada e resumida uma vez por tamanho; aqui só é reescalada
+        family, loc, scale = DISTRIBUTIONS[dist_type]
+        data = loc + scale * standard_sample(family, n_samples)
+        moments = standard_moments(family, n_samples).rescaled(loc, scale)
+        density = rescale_density(standard_density(family, n_samples, bins=30, bw_method=bw_method), loc, scale)
+    
+    # Cálculo das medidas (uma única passada pelos dados)
+    assimetria = moments.skewness()
+    curtose = moments.kurtosis(fisher=False)  # Pearson (normal = 3)
+    curtose_excessiva = moments.kurtosis(fisher=True)  # Fisher (normal = 0)
+    
+    # Exibir resultados
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Assimetria", f"{assimetria:.3f}")
+        if assimetria > 0.5:
+            st.write("🔴 Assimetria positiva")
+        elif assimetria < -0.5:
+            st.write("🔵 Assimetria negativa")
+        else:
+            st.write("🟢 Aproximadamente simétrica")
+    
+    with col2:
+        st.metric("Curtose (Pearson)", f"{curtose:.3f}")
+        if curtose > 3.5:
+            st.write("📈 Leptocúrtica (pontiaguda)")
+        elif curtose < 2.5:
+            st.write("📉 Platicúrtica (achatada)")
+        else:
+            st.write("📊 Mesocúrtica (normal)")
+    
+    with col3:
+        st.metric("Curtose Excessiva", f"{curtose_excessiva:.3f}")
+        st.write("(Normal = 0)")
+    
+    # Visualização
+    show_plot(draw_distribution, data, density, dist_type, moments.mean, moments.median())
+    
+    # Interpretação
+    st.subheader("Interpretação")
+    
+    interpretacao = []
+    
+    # Interpretação da assimetria
+    if abs(assimetria) < 0.5:
+        interpretacao.append("✅ **Assimetria**: A distribuição é aproximadamente simétrica.")
+    elif assimetria > 0:
+        interpretacao.append("📊 **Assimetria**: A distribuição tem cauda à direita (valores extremos maiores). A média tende a ser maior que a mediana.")
+    else:
+        interpretacao.append("📊 **Assimetria**: A distribuição tem cauda à esquerda (valores extremos menores). A média tende a ser menor que a mediana.")
+    
+    # Interpretação da curtose
+    if 2.5 <= curtose <= 3.5:
+        interpretacao.append("✅ **Curtose**: A distribuição tem formato similar à normal.")
+    elif curtose > 3.5:
+        interpretacao.append("📈 **Curtose**: A distribuição é mais pontiaguda que a normal, com caudas mais pesadas (maior concentração no centro).")
+    else:
+        interpretacao.append("📉 **Curtose**: A distribuição é mais achatada que a normal, com caudas mais leves (menor concentração no centro).")
+    
+    for item in interpretacao:
+        st.write(item)
+    
+    # Comparação com distribuição normal
+    st.subheader("Comparação com Distribuição Normal")
+    
+    if st.checkbox("Comparar com distribuição normal"):
+        normal_std = moments.std(ddof=0)
+        normal_moments = standard_moments("normal", moments.n, COMPARISON_SEED).rescaled(moments.mean, normal_std)
+        normal_density = standard_density("normal", moments.n, bins=30, bw_method=bw_method, seed=COMPARISON_SEED)
+        normal_density = rescale_density(normal_density, moments.mean, normal_std)
+        
+        show_plot(draw_normal_comparison, density, normal_density, dist_type)
+        
+        # Comparação das medidas
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.write("**Seus dados:**")
+            st.write(f"Assimetria: {assimetria:.3f}")
+            st.write(f"Curtose: {curtose:.3f}")
+        
+        with col2:
+            st.write("**Distribuição normal:**")
+            st.write(f"Assimetria: {normal_moments.skewness():.3f}")
+            st.write(f"Curtose: {normal_moments.kurtosis(fisher=False):.3f}")
+
+
+def render():
+    """Desenha a página"""
+    st.header("Medidas de Assimetria e Curtose")
+    st.write("""
+    Essas medidas descrevem a forma da distribuição dos dados, complementando as medidas 
+    de tendência central e dispersão.
+    """)
+    
+    st.subheader("1. Assimetria (Skewness)")
+    st.write("""
+    A assimetria mede o grau de desvio da simetria de uma distribuição:
+    - **Assimetria = 0**: Distribuição simétrica
+    - **Assimetria > 0**: Assimetria positiva (cauda à direita)
+    - **Assimetria < 0**: Assimetria negativa (cauda à esquerda)
+    """)
+    
+    st.subheader("2. Curtose (Kurtosis)")
+    st.write("""
+    A curtose mede o achatamento da distribuição:
+    - **Curtose = 3**: Distribuição normal (mesocúrtica)
+    - **Curtose > 3**: Distribuição mais pontiaguda (leptocúrtica)
+    - **Curtose < 3**: Distribuição mais achatada (platicúrtica)
+    
+    *Nota: Alguns softwares usam curtose excessiva (curtose - 3), onde 0 = normal*
+    """)
+    
+    distribution_section()
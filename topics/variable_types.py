@@ -0,0 +1,158 @@
+"""Página "Tipos de Variáveis"."""
+import streamlit as st
+import numpy as np
+import matplotlib.pyplot as plt
+
+from categorical import count_table, encode, sample_counts, validate_probabilities
+from distributions import plot_density, rescale_density, rescale_describe, standard_density, standard_describe
+from numeric_input import numbers_text_input
+from render_cache import show_plot
+from rerun_profiler import profiled
+from ui_controls import sample_seed
+
+CONTINUOUS_POINTS = 10000
+# Tamanhos de amostra das variáveis categóricas e ordinais
+CATEGORICAL_SIZES = [100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+# Acima disso, as barras ficam sem rótulos no eixo X
+MAX_LABELED_BARS = 40
+
+
+def draw_continuous(density):
+    fig, ax = plt.subplots()
+    plot_density(ax, density, stat="count", hist_kws=dict(alpha=0.75, edgecolor="white"))
+    ax.set_xlabel("Valores")
+    ax.set_ylabel("Frequência")
+    return fig
+
+
+def draw_countplot(labels, counts, colors, xlabel):
+    """Barras a partir das contagens já feitas (não dos dados brutos)"""
+    fig, ax = plt.subplots()
+    ax.bar(np.arange(len(labels)), counts, color=colors, width=0.8)
+    if len(labels) <= MAX_LABELED_BARS:
+        ax.set_xticks(np.arange(len(labels)), labels)
+    else:
+        ax.set_xticks([])
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel("Contagem")
+    return fig
+
+
+@st.fragment
+@profiled("Tipos de Variáveis / Contínuas")
+def continuous_section():
+    """Variáveis contínuas (fragmento: os sliders só reexecutam esta seção)"""
+    st.subheader("1. Variáveis Contínuas")
+    st.write("""
+    - **Definição**: Variáveis que podem assumir qualquer valor dentro de um intervalo.
+    - **Exemplos**: Altura, peso, temperatura.
+    - **Visualização**: Histograma ou gráfico de linha.
+    """)
+    st.write("**Exemplo Interativo**")
+    mean = st.slider("Média da distribuição", 0.0, 100.0, 50.0)
+    std_dev = st.slider("Desvio Padrão", 0.1, 20.0, 10.0)
+    # Amostra normal padrão sorteada uma vez; os sliders só reescalam os resumos
+    st.write(rescale_describe(standard_describe("normal", CONTINUOUS_POINTS), mean, std_dev))
+    density = rescale_density(standard_density("normal", CONTINUOUS_POINTS), mean, std_dev)
+    show_plot(draw_continuous, density)
+
+
+@st.fragment
+@profiled("Tipos de Variáveis / Categóricas")
+def categorical_section():
+    """Variáveis categóricas"""
+    st.subheader("2. Variáveis Categóricas")
+    st.write("""
+    - **Definição**: Variáveis que representam categorias ou grupos.
+    - **Exemplos**: Gênero, cor, tipo de carro.
+    - **Visualização**: Gráfico de barras ou pizza.
+    """)
+    st.write("**Exemplo Interativo**")
+    categories = st.text_input("Digite categorias (separadas por vírgula)", "Vermelho,Azul,Verde")
+    categories, _ = encode([cat.strip() for cat in categories.split(",") if cat.strip()])
+    if not categories:
+        st.warning("Digite ao menos uma categoria.")
+        return
+    n = st.select_slider("Tamanho da amostra", CATEGORICAL_SIZES, key="categorical_n")
+    # Categorias equiprováveis; só as contagens são sorteadas (semeadas, para o cache de gráficos)
+    seed = sample_seed("categorical")
+    counts = count_table(categories, sample_counts(np.full(len(categories), 1 / len(categories)), n, seed=seed))
+    st.write(counts)
+    
+    # Definir cores para as categorias
+    color_map = {
+        'Vermelho': 'red',
+        'Azul': 'blue', 
+        'Verde': 'green',
+        'Amarelo': 'yellow',
+        'Roxo': 'purple',
+        'Laranja': 'orange',
+        'Rosa': 'pink',
+        'Marrom': 'brown',
+        'Cinza': 'gray',
+        'Preto': 'black'
+    }
+    
+    unique_categories = list(counts.index)
+    colors = [color_map.get(cat.lower().capitalize(), 'steelblue') for cat in unique_categories]
+    
+    show_plot(draw_countplot, unique_categories, counts.to_numpy(), colors, "Categorias")
+
+
+@st.fragment
+@profiled("Tipos de Variáveis / Ordinais")
+def ordinal_section():
+    """Variáveis ordinais"""
+    st.subheader("3. Variáveis Ordinais")
+    st.write("""
+    - **Definição**: Variáveis categóricas com uma ordenação ou classificação clara.
+    - **Exemplos**: Nível de educação (Ensino Médio, Graduação, Mestrado, Doutorado), 
+    classificação de satisfação (Baixo, Médio, Alto).
+    - **Visualização**: Gráfico de barras ordenado.
+    """)
+    st.write("**Exemplo Interativo**")
+    levels = st.text_input("Digite níveis ordinais (separados por vírgula)", "Baixo,Médio,Alto")
+    levels = [level.strip() for level in levels.split(",") if level.strip()]
+    if not levels:
+        st.warning("Digite ao menos um nível.")
+        return
+    probabilities = numbers_text_input("Digite probabilidades para cada nível (separadas por vírgula)",
+                                       "0.2,0.5,0.3", key="ordinal_probabilities")
+    try:
+        probabilities = validate_probabilities(probabilities, len(levels))
+    except ValueError as exc:
+        st.error(str(exc))
+        return
+    # Níveis repetidos somam as probabilidades
+    levels, codes = encode(levels)
+    probabilities = np.bincount(codes, weights=probabilities, minlength=len(levels))
+    n = st.select_slider("Tamanho da amostra", CATEGORICAL_SIZES, key="ordinal_n")
+    counts = sample_counts(probabilities, n, seed=sample_seed("ordinal"))
+    st.write(count_table(levels, counts))
+    
+    # Definir cores diferentes para níveis ordinais
+    ordinal_colors = {
+        'Baixo': '#ff6b6b',      # Vermelho claro
+        'Médio': '#4ecdc4',      # Verde azulado
+        'Alto': '#45b7d1',       # Azul claro
+        'Muito Baixo': '#ff9ff3', # Rosa
+        'Muito Alto': '#96ceb4',  # Verde claro
+        'Extremo': '#feca57'      # Amarelo
+    }
+    
+    colors = [ordinal_colors.get(level, 'steelblue') for level in levels]
+    
+    show_plot(draw_countplot, levels, counts, colors, "Níveis")
+
+
+def render():
+    """Desenha a página"""
+    st.header("Tipos de Variáveis")
+    st.write("""
+    Variáveis são características ou atributos que podem ser medidos ou observados. 
+    Elas são classificadas em três tipos principais:
+    """)
+    
+    continuous_section()
+    categorical_section()
+    ordinal_section()
@@ -0,0 +1,16 @@
+"""Controles de interface compartilhados pelas páginas do Introduction_2.py.
+
+`sample_seed` dá a semente dos exemplos sorteados de uma seção, com um botão
+de nova amostra. Fica fora de `sampling_engine`, que não depende do Streamlit.
+"""
+import streamlit as st
+
+from sampling_engine import DEFAULT_SEED, new_seed
+
+
+def sample_seed(key, label="🎲 Nova amostra"):
+    """Semente do exemplo sorteado de uma seção (a padrão, comum às sessões, até o botão sortear outra)"""
+    state_key = f"{key}_seed"
+    if st.button(label, key=f"{key}_new_sample"):
+        st.session_state[state_key] = new_seed()
+    return st.session_state.setdefault(state_key, DEFAULT_SEED)